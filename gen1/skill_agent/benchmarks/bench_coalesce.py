@@ -0,0 +1,85 @@
+"""
+Benchmark: a retry storm of identical /api/v1/run requests, with and without
+single-flight coalescing (RUN_COALESCE_ENABLED).
+
+Serves the real FastAPI app (main.py) with uvicorn, with the crew pool
+swapped for stand-in crews whose run() blocks for RUN_SECONDS (like a
+kickoff waiting on the LLM). BURST identical requests and DISTINCT different
+ones are sent at once to a run executor with 4 workers and a queue of 4.
+Without coalescing every duplicate takes a worker (or is rejected with 503);
+with it they share the one run in flight.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_coalesce.py
+"""
+
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from benchmarks.bench_run_executor import serve  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.crew_pool import CrewPool, set_crew_pool  # noqa: E402
+from src.run_executor import RunExecutor  # noqa: E402
+
+RUN_SECONDS = 1.0
+BURST = 12
+DISTINCT = 2
+
+
+class StandInCrew:
+    """Blocks like a kickoff waiting on the LLM, then answers; counts the runs it did."""
+
+    runs = 0
+    _lock = threading.Lock()
+
+    def run(self, task_description: str, **inputs) -> str:
+        with StandInCrew._lock:
+            StandInCrew.runs += 1
+        time.sleep(RUN_SECONDS)
+        return f"done: {task_description}"
+
+
+def scenario(label: str, coalesce: bool, base: str) -> None:
+    settings.RUN_COALESCE_ENABLED = coalesce
+    executor = RunExecutor(workers=4, queue_size=4, default_retry_after=5)
+    main.get_run_executor = lambda: executor
+    StandInCrew.runs = 0
+    tasks = ["Summarize the api-development skill"] * BURST + [f"distinct task {i}" for i in range(DISTINCT)]
+
+    def run(task: str) -> httpx.Response:
+        with httpx.Client(base_url=base, timeout=60) as client:
+            return client.post("/api/v1/run", json={"task_description": task})
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(len(tasks)) as pool:
+        responses = list(pool.map(run, tasks))
+    elapsed = time.perf_counter() - start
+    ok = sum(r.status_code == 200 and r.json()["success"] for r in responses)
+    rejected = sum(r.status_code == 503 for r in responses)
+    print(
+        f"{label:<11} {len(tasks)} requests | ok {ok} | 503 {rejected} | "
+        f"crew runs {StandInCrew.runs} | {elapsed:4.2f} s"
+    )
+
+
+def run_benchmark() -> None:
+    logging.disable(logging.WARNING)
+    set_crew_pool(CrewPool(StandInCrew, max_idle=BURST + DISTINCT))
+    base = serve()
+    scenario("separate", False, base)
+    scenario("coalesced", True, base)
+    with httpx.Client(base_url=base) as client:
+        print(f"coalesce: {client.get('/api/v1/metrics').json()['coalesce']}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
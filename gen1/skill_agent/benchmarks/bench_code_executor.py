@@ -0,0 +1,73 @@
+"""
+Benchmark: one-shot code execution — fresh interpreter vs. preloaded zygote.
+
+Compares the original `subprocess.run([sys.executable, tmp_path])` path with
+forking from the zygote, for a snippet that imports the usual suspects.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_code_executor.py [iterations]
+"""
+
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.tools.zygote import Zygote  # noqa: E402
+
+SNIPPET = """
+import json, yaml
+try:
+    import numpy
+except ImportError:
+    pass
+print(json.dumps({"ok": True}))
+"""
+
+
+def bench(label: str, fn, iterations: int) -> list[float]:
+    fn()  # warm-up (starts the zygote on the first call)
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<22} mean {statistics.mean(timings):7.1f} ms | "
+        f"p50 {statistics.median(timings):7.1f} ms | "
+        f"max {max(timings):7.1f} ms"
+    )
+    return timings
+
+
+def main() -> None:
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    with tempfile.TemporaryDirectory() as tmp:
+        script = Path(tmp) / "snippet.py"
+        script.write_text(SNIPPET, encoding="utf-8")
+
+        def run_subprocess() -> None:
+            subprocess.run(
+                [sys.executable, str(script)], capture_output=True, text=True, timeout=60, cwd=tmp
+            )
+
+        zygote = Zygote(preload=["json", "yaml", "requests", "numpy"], memory_limit_mb=0)
+
+        def run_zygote() -> None:
+            result = zygote.run_script(script, [], Path(tmp), 60)
+            assert result is not None and result.returncode == 0, result
+
+        print(f"=== one-shot execution, {iterations} iterations ===")
+        baseline = bench("subprocess.run", run_subprocess, iterations)
+        forked = bench("zygote fork", run_zygote, iterations)
+        zygote.stop()
+
+    print(f"\nSpeed-up (mean): {statistics.mean(baseline) / statistics.mean(forked):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: mechanical requests through the agent vs the command router.
+
+Each TASK names a skill action outright ("show me the api-development
+skill", "/run ..."). Through the agent, a real SkillsCrew on the scripted
+stand-in model (LATENCY_MS per completion) takes one tool step and a final
+answer. Through the router (src/command_router.py) the same skills_manager
+call runs directly. Completion caching is off so each kickoff pays for its
+model calls.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_command_router.py [rounds]
+"""
+
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LATENCY_MS = 300
+SCRIPT = f"""
+latency_ms: {LATENCY_MS}
+default:
+  - "Thought: The task names the skill.\\nAction: skills_manager\\nAction Input: {{\\"action\\": \\"load_skill\\", \\"skill_name\\": \\"api-development\\"}}"
+  - "Thought: I now know the final answer\\nFinal Answer: Stand-in answer after {{turn}} turns."
+"""
+TASKS = [
+    "Show me the api-development skill",
+    "list the resources of skill-creator",
+    "/run content-idea-generator generate_ideas.py blogs",
+    "Write a REST API design for an orders service",  # not a command
+]
+
+_tmp = tempfile.TemporaryDirectory()
+_script = Path(_tmp.name) / "script.yaml"
+_script.write_text(SCRIPT)
+os.environ["LLM_MODEL"] = f"standin/{_script}"
+os.environ["LLM_STREAM"] = "false"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.command_router import CommandRouter  # noqa: E402
+from src.crew import SkillsCrew  # noqa: E402
+
+
+def run_benchmark() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    logging.disable(logging.WARNING)
+    crew = SkillsCrew()
+    router = CommandRouter()
+    for task in TASKS:
+        agent, routed = [], []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            crew.run(task_description=task)
+            agent.append((time.perf_counter() - start) * 1000)
+            start = time.perf_counter()
+            handled = router.run(task) is not None
+            routed.append((time.perf_counter() - start) * 1000)
+        via = f"{statistics.median(routed):8.2f} ms" if handled else "  (agent)  "
+        print(f"{task[:48]:<50} agent {statistics.median(agent):8.1f} ms | router {via}")
+    print(f"router: {router.stats()} | model calls: {crew.llm.calls}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,66 @@
+"""
+Benchmark: per-request crew setup, fresh SkillsCrew vs pooled lease.
+
+Measures only what /api/v1/run pays before kickoff:
+
+- fresh:   SkillsCrew() + crew() on every request (the old handler)
+- pooled:  get a crew from CrewPool.lease() + reset() of its tool cache
+
+The first SkillsCrew() of a process also pays for crewai imports, so one
+throwaway instance is built before timing. No LLM call is made; any
+LiteLLM-style model id works, e.g.
+
+Usage (from gen1/skill_agent):
+    LLM_MODEL=openai/gpt-4o-mini OPENAI_API_KEY=sk-dummy python benchmarks/bench_crew_pool.py [requests]
+"""
+
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.crew import SkillsCrew  # noqa: E402
+from src.crew_pool import CrewPool  # noqa: E402
+
+
+def fresh() -> None:
+    SkillsCrew().crew()
+
+
+def measure(label: str, setup: Callable[[], None], requests: int) -> List[float]:
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        setup()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<7} {requests} requests | median {statistics.median(samples):7.2f} ms | "
+        f"max {max(samples):7.2f} ms | total {sum(samples):8.1f} ms"
+    )
+    return samples
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logging.disable(logging.INFO)
+    fresh()  # pay the one-off import cost outside the measurement
+
+    measure("fresh", fresh, requests)
+
+    pool = CrewPool(SkillsCrew, max_idle=1)
+    pool.warm(1)
+
+    def pooled() -> None:
+        with pool.lease() as crew:
+            crew.reset()
+
+    measure("pooled", pooled, requests)
+    print(f"pool stats: {pool.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: chat history under a flood of distinct thread IDs.
+
+Appends one turn (user + assistant message) for THREADS distinct thread IDs
+to each backend and reports per-append latency and the memory still held
+(tracemalloc) at checkpoints:
+
+- dict:    the previous module-level CHAT_HISTORY (trimmed per thread, never evicted)
+- memory:  MemoryHistoryStore, LRU of MAX_THREADS threads
+- sqlite:  SQLiteHistoryStore, batched WAL writes; after a prune the
+           database holds MAX_THREADS threads
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_history_store.py [threads]
+"""
+
+import gc
+from array import array
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.history_store import MemoryHistoryStore, SQLiteHistoryStore  # noqa: E402
+
+MAX_THREADS = 10_000
+MAX_MESSAGES = 20
+TURN = [
+    {"role": "user", "content": "Summarize the api-development skill " * 4},
+    {"role": "assistant", "content": "The api-development skill covers REST and GraphQL design. " * 8},
+]
+
+
+def dict_append(history: Dict[str, List[Dict[str, str]]]) -> Callable[[str], None]:
+    def append(thread_id: str) -> None:
+        messages = history.setdefault(thread_id, [])
+        messages.extend(dict(m) for m in TURN)
+        if len(messages) > MAX_MESSAGES:
+            history[thread_id] = messages[-MAX_MESSAGES:]
+    return append
+
+
+def scenario(label: str, append: Callable[[str], None], threads: int, after: Callable[[], str] = lambda: "") -> None:
+    samples = array("d", [0.0]) * threads  # preallocated, so it isn't counted as held
+    checkpoints: List[str] = []
+    gc.collect()
+    tracemalloc.start()
+    for i in range(threads):
+        start = time.perf_counter()
+        append(f"thread-{i}")
+        samples[i] = (time.perf_counter() - start) * 1e6
+        if (i + 1) % (threads // 4) == 0:
+            checkpoints.append(f"{tracemalloc.get_traced_memory()[0] / 2**20:6.1f}")
+    tracemalloc.stop()
+    print(
+        f"{label:<7} append median {statistics.median(samples):6.1f} µs p99 "
+        f"{sorted(samples)[int(len(samples) * 0.99)]:7.1f} µs | held MiB at 25/50/75/100%: "
+        f"{' '.join(checkpoints)} {after()}"
+    )
+
+
+def run_benchmark() -> None:
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    scenario("dict", dict_append({}), threads)
+
+    memory = MemoryHistoryStore(max_threads=MAX_THREADS, max_messages=MAX_MESSAGES, ttl=3600)
+    scenario("memory", lambda tid: memory.append(tid, TURN), threads,
+             lambda: f"| {memory.stats()['threads']} threads kept")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        sqlite = SQLiteHistoryStore(
+            Path(tmp) / "history.sqlite3", max_threads=MAX_THREADS, max_messages=MAX_MESSAGES, ttl=3600
+        )
+
+        def after() -> str:
+            start = time.perf_counter()
+            sqlite.flush()
+            sqlite._prune(time.time())
+            elapsed = time.perf_counter() - start
+            stats = sqlite.stats()
+            return f"| {stats['flushes']} flushes, final flush + prune {elapsed:.2f} s, {stats['threads']} threads kept"
+
+        scenario("sqlite", lambda tid: sqlite.append(tid, TURN), threads, after)
+        start = time.perf_counter()
+        assert len(sqlite.get(f"thread-{threads - 1}")) == 2
+        print(f"sqlite get {1e6 * (time.perf_counter() - start):.0f} µs")
+        sqlite.close()
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,146 @@
+"""
+Benchmark: HTML → text extraction for web_fetch.
+
+Compares the old nine-pass regex chain with the single-pass html.parser
+extractor (full document, and fed in 16 KB chunks with the 8000-char budget
+web_fetch uses, stopping once it is met) on
+synthetic pages shaped like the marketplace pages the agent fetches:
+
+- leaderboard: skills.sh-style listing, hundreds of linked rows
+- github blob: GitHub file view, big inline JSON payload, styles and scripts
+- skill page:  rendered skill.md with headings, lists and code blocks
+- hostile:     many unterminated <script> tags (quadratic for `.*?` + DOTALL)
+
+Before timing, a few snippets (e.g. card-style links wrapping headings) are
+checked against their expected markdown.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_html_extract.py [rounds]
+"""
+
+import re
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.tools.html_extract import HTMLTextExtractor, html_to_text  # noqa: E402
+
+BUDGET = 8000
+CHUNK = 16 * 1024
+
+
+# (html, expected html_to_text output)
+CASES = [
+    ('<a href="/x"><div>inner</div></a>', "inner (/x)"),
+    ('<a href="/y"><h2>Title</h2></a>', "## Title (/y)"),
+    ('<p>See <a href="/z">the docs</a>.</p>', "See [the docs](/z)."),
+]
+
+
+def regex_strip(html: str) -> str:
+    """The previous WebFetchTool._strip_html, kept here as the baseline."""
+    text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
+    text = re.sub(r'<[^>]+>', ' ', text)
+    text = re.sub(r'&nbsp;', ' ', text)
+    text = re.sub(r'&amp;', '&', text)
+    text = re.sub(r'&lt;', '<', text)
+    text = re.sub(r'&gt;', '>', text)
+    text = re.sub(r'&quot;', '"', text)
+    text = re.sub(r'\s{3,}', '\n\n', text)
+    return text.strip()
+
+
+def leaderboard_page() -> str:
+    rows = "".join(
+        f'<tr><td>{i}</td><td><a href="/owner{i % 40}/skills/skill-{i}">skill-{i}</a></td>'
+        f"<td>Helps with task #{i} &amp; related workflows</td><td>{1000 - i}</td></tr>"
+        for i in range(800)
+    )
+    return (
+        "<!DOCTYPE html><html><head><title>skills.sh</title>"
+        "<style>" + ".c{color:red}" * 2000 + "</style></head><body>"
+        "<nav><a href='/'>Home</a><a href='/docs'>Docs</a></nav><h1>Leaderboard</h1>"
+        f"<table>{rows}</table><script>window.__DATA__={{}}</script></body></html>"
+    )
+
+
+def github_blob_page() -> str:
+    payload = '{"blob":{"rawLines":[' + ",".join(f'"line {i} of the file"' for i in range(20000)) + "]}}"
+    lines = "".join(f"<tr><td class='num'>{i}</td><td>line {i} of the file</td></tr>" for i in range(1500))
+    return (
+        "<!DOCTYPE html><html><head>" + "<link rel=stylesheet href=x.css>" * 40
+        + "<style>" + ".blob{font:mono}" * 3000 + "</style></head><body>"
+        + f'<script type="application/json" data-target="react-app.embeddedData">{payload}</script>'
+        + f"<h2>skills/code-review/skill.md</h2><table>{lines}</table>"
+        + "<script>" + "function f(){return 1<2}" * 2000 + "</script></body></html>"
+    )
+
+
+def skill_page() -> str:
+    section = (
+        "<h2>Step {n}</h2><p>Run the checks &mdash; then review the output.</p>"
+        "<ul><li>Look for <code>TODO</code> markers</li><li>Check error handling</li></ul>"
+        "<pre><code>def check(path):\n    return path.exists() and path.stat().st_size &gt; 0\n</code></pre>"
+    )
+    body = "".join(section.format(n=n) for n in range(300))
+    return f"<!DOCTYPE html><html><head><title>code-review</title></head><body><h1>Code Review</h1>{body}</body></html>"
+
+
+def hostile_page() -> str:
+    return "<html><body>" + "<script>var a = 1;" * 4000 + "<p>text</p></body></html>"
+
+
+def streamed_extract(html: str) -> str:
+    """What web_fetch does: feed chunks as they arrive, stop at the budget."""
+    extractor = HTMLTextExtractor(BUDGET)
+    for start in range(0, len(html), CHUNK):
+        extractor.feed(html[start:start + CHUNK])
+        if extractor.exhausted:
+            break
+    return extractor.text()
+
+
+def check_cases() -> None:
+    for html, expected in CASES:
+        got = html_to_text(html)
+        status = "ok  " if got == expected else "FAIL"
+        print(f"{status} {html!r} -> {got!r}" + ("" if got == expected else f" (expected {expected!r})"))
+    print()
+
+
+def bench(fn: Callable[[], object], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.mean(timings)
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    check_cases()
+    pages = {
+        "leaderboard": leaderboard_page(),
+        "github blob": github_blob_page(),
+        "skill page": skill_page(),
+        "hostile": hostile_page(),
+    }
+    print(f"{'page':<12} {'size':>8} {'regex chain':>12} {'parser':>10} {'parser+budget':>14}")
+    for name, html in pages.items():
+        regex_ms = bench(lambda: regex_strip(html), rounds)
+        full_ms = bench(lambda: html_to_text(html), rounds)
+        budget_ms = bench(lambda: streamed_extract(html), rounds)
+        print(
+            f"{name:<12} {len(html) / 1024:6.0f}KB {regex_ms:10.1f}ms "
+            f"{full_ms:8.1f}ms {budget_ms:12.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark: /api/v1/run fully offline, with and without completion cache hits.
+
+Serves the real FastAPI app (main.py) with real SkillsCrew instances on the
+scripted stand-in model (LLM_MODEL=standin/<script>): every task takes one
+skills_manager tool call and a final answer, LATENCY_MS per completion. The
+same TASKS are sent twice; the second pass (plus a re-spaced copy of the
+first task, to exercise message normalization) should be answered from the
+completion cache without calling the model.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_llm_cache.py
+"""
+
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+
+LATENCY_MS = 300
+SCRIPT = f"""
+latency_ms: {LATENCY_MS}
+default:
+  - "Thought: I should check the available skills.\\nAction: skills_manager\\nAction Input: {{\\"action\\": \\"list_skills\\"}}"
+  - "Thought: I now know the final answer\\nFinal Answer: Stand-in answer after {{turn}} turns."
+"""
+TASKS = [f"Summarize what skill {i} would help with" for i in range(5)]
+
+_tmp = tempfile.TemporaryDirectory()
+_script = Path(_tmp.name) / "script.yaml"
+_script.write_text(SCRIPT)
+os.environ["LLM_MODEL"] = f"standin/{_script}"
+os.environ["LLM_STREAM"] = "false"
+os.environ["RUN_JOBS_DB_PATH"] = str(Path(_tmp.name) / "jobs.sqlite3")
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from benchmarks.bench_run_jobs import serve  # noqa: E402
+from src.crew_pool import get_crew_pool  # noqa: E402
+from src.llm import set_llm_cache  # noqa: E402
+from src.tools.ttl_cache import TTLCache  # noqa: E402
+
+
+def model_calls() -> int:
+    with get_crew_pool()._lock:
+        crews = list(get_crew_pool()._idle)
+    return sum(crew.llm.inner.calls for crew in crews)
+
+
+def run_pass(client: httpx.Client, label: str, tasks: List[str]) -> None:
+    before = model_calls()
+    samples = []
+    for task in tasks:
+        start = time.perf_counter()
+        data = client.post("/api/v1/run", json={"task_description": task}).json()
+        samples.append((time.perf_counter() - start) * 1000)
+        assert data["success"], data
+    print(
+        f"{label:<18} median {statistics.median(samples):8.1f} ms | max {max(samples):8.1f} ms | "
+        f"model calls {model_calls() - before}"
+    )
+
+
+def run_benchmark() -> None:
+    logging.disable(logging.WARNING)
+    set_llm_cache(TTLCache(ttl=3600, max_entries=256, disk_path=Path(_tmp.name) / "llm_cache.sqlite3"))
+    base = serve()
+    with httpx.Client(base_url=base, timeout=120) as client:
+        client.post("/api/v1/run", json={"task_description": "warm-up"})
+        run_pass(client, "cold (misses)", TASKS)
+        run_pass(client, "repeated (hits)", TASKS)
+        run_pass(client, "re-spaced task", ["  Summarize  what skill 0\nwould help   with "])
+        print(f"llm_cache: {client.get('/api/v1/metrics').json()['llm_cache']}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,102 @@
+"""
+Demo: the outbound governor against a rate-limited stand-in marketplace.
+
+The stand-in serves at most LIMIT requests per second and answers 429 beyond
+that. 16 agent threads fetch 80 skill pages through WebFetchTool under three
+policies:
+
+- no limits:   no client-side limiting, no retries (every 429 is a failure)
+- retry only:  jittered backoff on 429, but no rate limit / concurrency cap
+- governed:    token bucket at the server's rate + concurrency cap + backoff
+- max wait 1s: governed, but callers give up after 1 s (counted as rejections)
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_rate_limit.py
+"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_web_fetch import StandInWebFetchTool  # noqa: E402
+from benchmarks.standin_server import Route, StandInServer  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.tools.http_client import PooledHTTPClient, set_http_client  # noqa: E402
+from src.tools.rate_limit import DomainLimit, OutboundGovernor  # noqa: E402
+
+LIMIT = 20  # requests per second the stand-in accepts
+THREADS = 16
+FETCHES = 80
+
+
+class RateLimitedMarketplace:
+    """Stand-in handler: fixed one-second windows of LIMIT requests, then 429."""
+
+    def __init__(self) -> None:
+        self.throttled = 0
+        self._lock = threading.Lock()
+        self._second = 0
+        self._count = 0
+
+    def __call__(self, server: StandInServer, path: str) -> Route:
+        with self._lock:
+            second = int(time.monotonic())
+            if second != self._second:
+                self._second, self._count = second, 0
+            self._count += 1
+            if self._count > LIMIT:
+                self.throttled += 1
+                return Route(429, b"slow down")
+        return Route(body=b"# Skill\n\nDo the thing.\n")
+
+
+def run(label: str, governor: OutboundGovernor) -> None:
+    set_http_client(PooledHTTPClient(
+        max_connections=50, max_keepalive=20, keepalive_expiry=30, http2=False, governor=governor
+    ))
+    time.sleep(1.0 - time.monotonic() % 1)  # start on a fresh server window
+    marketplace = RateLimitedMarketplace()
+    with StandInServer(handler=marketplace) as server:
+        tool = StandInWebFetchTool()
+        urls = [server.url(f"/skill-{i}") for i in range(FETCHES)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(THREADS) as pool:
+            results = list(pool.map(tool._fetch, urls))
+        elapsed = time.perf_counter() - start
+
+    ok = sum(r.startswith("# Content from:") for r in results)
+    stats = governor.metrics().get("127.0.0.1", {})
+    print(
+        f"{label:<11} ok {ok:3d}/{FETCHES} | 429s served {marketplace.throttled:3d} | "
+        f"retries {stats.get('retries', 0):3d} | wait avg {stats.get('wait_avg_ms', 0):6.1f} ms "
+        f"max {stats.get('wait_max_ms', 0):7.1f} ms | rejections {stats.get('rejections', 0)} | "
+        f"{elapsed:5.2f} s"
+    )
+
+
+def main() -> None:
+    settings.HTTP_CACHE_ENABLED = False
+    unlimited = DomainLimit(rate=1e6, burst=10**6, concurrency=THREADS)
+    run("no limits", OutboundGovernor(
+        {}, unlimited, max_wait=30, max_retries=0, backoff_base=0.25, backoff_max=5,
+    ))
+    run("retry only", OutboundGovernor(
+        {}, unlimited, max_wait=30, max_retries=3, backoff_base=0.25, backoff_max=5,
+    ))
+    run("governed", OutboundGovernor(
+        {}, DomainLimit(rate=LIMIT * 0.9, burst=5, concurrency=4),
+        max_wait=30, max_retries=3, backoff_base=0.25, backoff_max=5,
+    ))
+    run("max wait 1s", OutboundGovernor(
+        {}, DomainLimit(rate=LIMIT * 0.9, burst=5, concurrency=4),
+        max_wait=1, max_retries=3, backoff_base=0.25, backoff_max=5,
+    ))
+    set_http_client(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark: LLM calls per task with and without the skills registry in the
+task prompt (SKILLS_REGISTRY_IN_PROMPT).
+
+Runs real SkillsCrew kickoffs on the scripted stand-in model. The script
+follows the agent protocol: when the task carries the registry it picks the
+skill from it and goes straight to load_skill, otherwise it first calls
+list_skills. Completion caching is off so every model call is counted.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_registry_prompt.py [tasks]
+"""
+
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+LATENCY_MS = 200
+LIST = '"Thought: I need the skill list first.\\nAction: skills_manager\\nAction Input: {\\"action\\": \\"list_skills\\"}"'
+LOAD = '"Thought: api-development matches.\\nAction: skills_manager\\nAction Input: {\\"action\\": \\"load_skill\\", \\"skill_name\\": \\"api-development\\"}"'
+FINAL = '"Thought: I now know the final answer\\nFinal Answer: Done after {turn} turns."'
+SCRIPT = f"""
+latency_ms: {LATENCY_MS}
+rules:
+  - match: "- api-development: "
+    responses: [{LOAD}, {FINAL}]
+default: [{LIST}, {LOAD}, {FINAL}]
+"""
+
+_tmp = tempfile.TemporaryDirectory()
+_script = Path(_tmp.name) / "script.yaml"
+_script.write_text(SCRIPT)
+os.environ["LLM_MODEL"] = f"standin/{_script}"
+os.environ["LLM_STREAM"] = "false"
+os.environ["LLM_CACHE_ENABLED"] = "false"
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import settings  # noqa: E402
+from src.crew import SkillsCrew  # noqa: E402
+
+
+def run_pass(label: str, in_prompt: bool, tasks: int) -> None:
+    settings.SKILLS_REGISTRY_IN_PROMPT = in_prompt
+    crew = SkillsCrew()
+    samples = []
+    for i in range(tasks):
+        start = time.perf_counter()
+        crew.run(task_description=f"Design a REST endpoint for resource {i}")
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<20} {crew.llm.calls / tasks:4.1f} LLM calls/task | "
+        f"median {statistics.median(samples):8.1f} ms | max {max(samples):8.1f} ms"
+    )
+
+
+def run_benchmark() -> None:
+    tasks = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    logging.disable(logging.WARNING)
+    run_pass("list_skills first", False, tasks)
+    run_pass("registry in prompt", True, tasks)
+    print(f"registry summary: {len(SkillsCrew().skills_registry())} chars")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,110 @@
+"""
+Benchmark: /health latency while crews run, inline vs bounded run executor.
+
+Serves the real FastAPI app (main.py) with uvicorn, with the crew pool
+swapped for stand-in crews whose run() blocks for RUN_SECONDS (like a
+kickoff waiting on the LLM). RUNS concurrent /api/v1/run requests are sent
+while /health is polled:
+
+- inline:    the old handler, crew.run() on the event loop thread
+- executor:  crew.run() on the bounded run executor (2 workers, queue 2),
+             excess runs rejected with 503 + Retry-After
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_run_executor.py
+"""
+
+import logging
+import socket
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import main  # noqa: E402
+from src.crew_pool import CrewPool, set_crew_pool  # noqa: E402
+from src.run_executor import RunExecutor  # noqa: E402
+
+RUN_SECONDS = 1.0
+RUNS = 6
+
+
+class StandInCrew:
+    """Blocks like a kickoff waiting on the LLM, then answers."""
+
+    def run(self, task_description: str, **inputs) -> str:
+        time.sleep(RUN_SECONDS)
+        return f"done: {task_description}"
+
+
+class InlineExecutor(RunExecutor):
+    """The previous behaviour: run the crew directly in the async handler."""
+
+    async def submit(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+
+def serve() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(main.app, port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def scenario(label: str, executor: RunExecutor, base: str) -> None:
+    main.get_run_executor = lambda: executor
+    health_ms = []
+    stop = threading.Event()
+
+    def poll_health() -> None:
+        with httpx.Client(base_url=base, timeout=60) as client:
+            while not stop.is_set():
+                start = time.perf_counter()
+                client.get("/health")
+                health_ms.append((time.perf_counter() - start) * 1000)
+                time.sleep(0.02)
+
+    def run(i: int) -> httpx.Response:
+        with httpx.Client(base_url=base, timeout=60) as client:
+            return client.post("/api/v1/run", json={"task_description": f"task {i}"})
+
+    poller = threading.Thread(target=poll_health)
+    poller.start()
+    start = time.perf_counter()
+    with ThreadPoolExecutor(RUNS) as pool:
+        responses = list(pool.map(run, range(RUNS)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    poller.join()
+
+    ok = sum(r.status_code == 200 for r in responses)
+    rejected = [r for r in responses if r.status_code == 503]
+    retry_after = rejected[0].headers.get("retry-after") if rejected else "-"
+    print(
+        f"{label:<9} runs ok {ok}/{RUNS} | 503 {len(rejected)} (Retry-After {retry_after}) | "
+        f"/health median {statistics.median(health_ms):7.1f} ms max {max(health_ms):7.1f} ms | "
+        f"{elapsed:4.1f} s"
+    )
+
+
+def run_benchmark() -> None:
+    logging.disable(logging.WARNING)
+    set_crew_pool(CrewPool(StandInCrew, max_idle=RUNS))
+    base = serve()
+    scenario("inline", InlineExecutor(workers=1, queue_size=RUNS), base)
+    scenario("executor", RunExecutor(workers=2, queue_size=2, default_retry_after=5), base)
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,150 @@
+"""
+Benchmark: time until the client gets an answer, blocking /run vs /jobs.
+
+Serves the real FastAPI app (main.py) with uvicorn. Runs are stand-ins that
+take STEPS agent steps of STEP_SECONDS each and report them through the same
+step callback the crew uses:
+
+- run:   POST /api/v1/run holds the request until the crew finishes
+- jobs:  POST /api/v1/jobs returns a job id; the events stream carries
+         every step and the final status
+
+It then checks that a job keeps running after its client disconnects and
+that DELETE stops a running job at its next step.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_run_jobs.py
+"""
+
+import json
+import logging
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import List
+
+import httpx
+import uvicorn
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from crewai.agents.parser import AgentAction, AgentFinish  # noqa: E402
+
+import main  # noqa: E402
+from src.crew_pool import CrewPool, set_crew_pool  # noqa: E402
+from src.run_events import on_step  # noqa: E402
+from src.run_jobs import RunJobQueue, _run_crew  # noqa: E402
+
+STEPS = 4
+STEP_SECONDS = 0.25
+REQUESTS = 5
+
+
+class StandInCrew:
+    """Takes STEPS agent steps like a kickoff, reporting each to the step callback."""
+
+    def run(self, task_description: str, **inputs) -> str:
+        for i in range(STEPS):
+            time.sleep(STEP_SECONDS)
+            on_step(AgentAction(thought=f"step {i}", tool="skills_manager", tool_input="{}", text="", result="ok"))
+        on_step(AgentFinish(thought="done", output=f"done: {task_description}", text=""))
+        return f"done: {task_description}"
+
+
+def serve() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server = uvicorn.Server(uvicorn.Config(main.app, port=port, log_level="error"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}"
+
+
+def read_events(client: httpx.Client, job_id: str) -> List[dict]:
+    events = []
+    with client.stream("GET", f"/api/v1/jobs/{job_id}/events") as response:
+        event = {}
+        for line in response.iter_lines():
+            if line.startswith("event: "):
+                event["type"] = line[7:]
+            elif line.startswith("data: "):
+                event["data"] = json.loads(line[6:])
+            elif not line and event:
+                events.append(event)
+                event = {}
+    return events
+
+
+def wait_for(client: httpx.Client, job_id: str, status: str, timeout: float = 30) -> dict:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        job = client.get(f"/api/v1/jobs/{job_id}").json()
+        if job["status"] == status:
+            return job
+        time.sleep(0.05)
+    raise AssertionError(f"job {job_id} never reached {status}: {job}")
+
+
+def report(label: str, samples: List[float]) -> None:
+    print(f"{label:<22} median {statistics.median(samples):8.1f} ms | max {max(samples):8.1f} ms")
+
+
+def run_benchmark() -> None:
+    logging.disable(logging.WARNING)
+    set_crew_pool(CrewPool(StandInCrew, max_idle=4))
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = RunJobQueue(
+            db_path=Path(tmp) / "jobs.sqlite3",
+            workers=2,
+            max_queued=8,
+            history_limit=50,
+            runner=_run_crew,
+            poll_interval=0.05,
+        )
+        main.get_run_jobs = lambda: queue
+        base = serve()
+
+        with httpx.Client(base_url=base, timeout=60) as client:
+            blocking, accepted, finished = [], [], []
+            for i in range(REQUESTS):
+                start = time.perf_counter()
+                assert client.post("/api/v1/run", json={"task_description": f"task {i}"}).json()["success"]
+                blocking.append((time.perf_counter() - start) * 1000)
+
+            for i in range(REQUESTS):
+                start = time.perf_counter()
+                job = client.post("/api/v1/jobs", json={"task_description": f"task {i}"}).json()
+                accepted.append((time.perf_counter() - start) * 1000)
+                events = read_events(client, job["id"])
+                finished.append((time.perf_counter() - start) * 1000)
+                steps = [e for e in events if e["type"] == "step"]
+                assert len(steps) == STEPS + 1, events
+                assert events[-1]["data"] == {"status": "completed", "result": f"done: task {i}"}, events[-1]
+
+            report("run (blocking)", blocking)
+            report("jobs: job id returned", accepted)
+            report("jobs: final event", finished)
+
+            # The client goes away right after submitting; the job still completes
+            with httpx.Client(base_url=base, timeout=60) as gone:
+                job_id = gone.post("/api/v1/jobs", json={"task_description": "orphan"}).json()["id"]
+            job = wait_for(client, job_id, "completed")
+            print(f"client disconnected:   job {job['status']} -> {job['result']!r}")
+
+            job_id = client.post("/api/v1/jobs", json={"task_description": "cancel me"}).json()["id"]
+            wait_for(client, job_id, "running")
+            start = time.perf_counter()
+            client.delete(f"/api/v1/jobs/{job_id}")
+            job = wait_for(client, job_id, "cancelled")
+            print(f"DELETE running job:    {job['status']} after {(time.perf_counter() - start) * 1000:.0f} ms")
+            print(f"metrics jobs:          {client.get('/api/v1/metrics').json()['jobs']}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,112 @@
+"""
+Benchmark: duckduckgo_search with the local stand-in index.
+
+Replays the queries an agent typically issues during a session (with the
+repeats and case/spacing variants it produces) against LocalIndexBackend
+with simulated network latency, comparing:
+
+- no cache:        every query hits the backend
+- memory cache:    normalized queries served from the memory tier
+- disk (restart):  a fresh process-level cache warmed only from the disk tier
+
+then the SEARCH & CREATE step 1 (skills.sh + GitHub queries) as two sequential
+calls vs one search_queries=[...] call, uncached.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_search.py [latency_ms]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import settings  # noqa: E402
+from src.tools.duck_duck_go_search_tool import DuckDuckGoSearchTool  # noqa: E402
+from src.tools.search_backend import (  # noqa: E402
+    LocalIndexBackend,
+    SearchResult,
+    set_search_backend,
+    set_search_cache,
+)
+from src.tools.ttl_cache import TTLCache  # noqa: E402
+
+QUERIES = [
+    "site:skills.sh code-review",
+    'site:github.com "skill.md" code-review',
+    "site:skills.sh  Code-Review",
+    "site:https://www.skills.sh/ code-review",
+    "site:skills.sh database design",
+    'site:github.com "skill.md" database design',
+    "site:skills.sh database   design",
+    "site:skills.sh code-review",
+    "site:skills.sh frontend development",
+    'site:github.com "skill.md" frontend development',
+    "site:skills.sh Frontend Development",
+    "site:skills.sh code-review",
+]
+
+
+class SlowLocalIndex(LocalIndexBackend):
+    """Local index that sleeps like a network round trip and counts calls."""
+
+    def __init__(self, documents: List[SearchResult], latency: float) -> None:
+        super().__init__(documents)
+        self.latency = latency
+        self.calls = 0
+
+    def search(self, query: str, max_results: int) -> List[SearchResult]:
+        self.calls += 1
+        time.sleep(self.latency)
+        return super().search(query, max_results)
+
+
+def replay(label: str, backend: SlowLocalIndex, cache: TTLCache) -> None:
+    set_search_cache(cache)
+    set_search_backend(backend)
+    tool = DuckDuckGoSearchTool()
+    backend.calls = 0
+    start = time.perf_counter()
+    for query in QUERIES:
+        assert "URL:" in tool._run(search_query=query)
+    elapsed = (time.perf_counter() - start) * 1000
+    print(f"{label:<15} {len(QUERIES)} queries: {elapsed:7.1f} ms | backend calls: {backend.calls}")
+
+
+def search_phase(backend: SlowLocalIndex) -> None:
+    set_search_cache(TTLCache(ttl=0, max_entries=1))
+    set_search_backend(backend)
+    tool = DuckDuckGoSearchTool()
+    queries = ["site:skills.sh code-review", 'site:github.com "skill.md" code-review']
+
+    start = time.perf_counter()
+    for query in queries:
+        tool._run(search_query=query)
+    sequential = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    merged = tool._run(search_queries=queries)
+    parallel = (time.perf_counter() - start) * 1000
+    assert "Found by: [" in merged
+    print(f"search phase    2 tool calls: {sequential:7.1f} ms | 1 multi-query call: {parallel:7.1f} ms")
+
+
+def main() -> None:
+    latency = (float(sys.argv[1]) if len(sys.argv) > 1 else 300) / 1000
+    index = LocalIndexBackend.from_file(settings.SEARCH_LOCAL_INDEX)
+    backend = SlowLocalIndex(index.documents, latency)
+    with tempfile.TemporaryDirectory() as tmp:
+        disk = Path(tmp) / "search_cache.sqlite3"
+        replay("no cache", backend, TTLCache(ttl=0, max_entries=1))
+        replay("memory cache", backend, TTLCache(ttl=3600, max_entries=512, disk_path=disk))
+        replay("disk (restart)", backend, TTLCache(ttl=3600, max_entries=512, disk_path=disk))
+    search_phase(backend)
+    set_search_backend(None)
+    set_search_cache(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark: time to first byte of agent output, final status vs streamed tokens.
+
+Serves the real FastAPI app (main.py) with uvicorn. The stand-in crew
+generates STEPS LLM responses of CHUNKS chunks each (CHUNK_SECONDS apart),
+publishing every chunk on the CrewAI event bus as LLMStreamChunkEvent, the
+way LLM(stream=True) does, with a TOOL_SECONDS tool call between responses. One job is
+followed over /api/v1/jobs/{id}/events and we record when the first token,
+tool and step events arrive and when the final status does.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_streaming.py
+"""
+
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from crewai.agents.parser import AgentAction, AgentFinish  # noqa: E402
+from crewai.events import crewai_event_bus  # noqa: E402
+from crewai.events.types.llm_events import LLMStreamChunkEvent  # noqa: E402
+from crewai.events.types.tool_usage_events import ToolUsageStartedEvent  # noqa: E402
+
+import main  # noqa: E402
+from benchmarks.bench_run_jobs import read_events, serve  # noqa: E402
+from src.crew_pool import CrewPool, set_crew_pool  # noqa: E402
+from src.run_events import on_step, register_stream_handlers  # noqa: E402
+from src.run_jobs import RunJobQueue, _run_crew  # noqa: E402
+
+STEPS = 3
+CHUNKS = 150
+CHUNK_SECONDS = 0.01
+TOOL_SECONDS = 0.1
+
+
+class StreamingStandInCrew:
+    """Streams token chunks through the event bus like a kickoff with a streaming LLM."""
+
+    def __init__(self) -> None:
+        register_stream_handlers()
+
+    def generate(self, text: str) -> None:
+        for i in range(CHUNKS):
+            time.sleep(CHUNK_SECONDS)
+            crewai_event_bus.emit(self, LLMStreamChunkEvent(chunk=f"{text}{i} ", call_id="standin"))
+
+    def run(self, task_description: str, **inputs) -> str:
+        for step in range(STEPS):
+            self.generate(f"t{step}.")
+            crewai_event_bus.emit(self, ToolUsageStartedEvent(tool_name="web_fetch", tool_args={"url": "x"}))
+            time.sleep(TOOL_SECONDS)
+            on_step(AgentAction(thought="", tool="web_fetch", tool_input="{}", text="", result="ok"))
+        self.generate("final.")
+        on_step(AgentFinish(thought="", output="done", text=""))
+        return "done"
+
+
+def run_benchmark() -> None:
+    logging.disable(logging.WARNING)
+    set_crew_pool(CrewPool(StreamingStandInCrew, max_idle=1))
+    with tempfile.TemporaryDirectory() as tmp:
+        queue = RunJobQueue(
+            db_path=Path(tmp) / "jobs.sqlite3",
+            workers=1,
+            max_queued=8,
+            history_limit=50,
+            runner=_run_crew,
+            poll_interval=0.05,
+        )
+        main.get_run_jobs = lambda: queue
+        base = serve()
+
+        with httpx.Client(base_url=base, timeout=60) as client:
+            start = time.perf_counter()
+            job_id = client.post("/api/v1/jobs", json={"task_description": "stream"}).json()["id"]
+            first = {}
+            with client.stream("GET", f"/api/v1/jobs/{job_id}/events") as response:
+                for line in response.iter_lines():
+                    if line.startswith("event: "):
+                        first.setdefault(line[7:], (time.perf_counter() - start) * 1000)
+            total = (time.perf_counter() - start) * 1000
+
+            events = read_events(client, job_id)
+            tokens = [e for e in events if e["type"] == "token"]
+            text = "".join(e["data"]["text"] for e in tokens)
+            chunks = (STEPS + 1) * CHUNKS
+            assert text.count(" ") == chunks, "tokens lost or duplicated"
+            assert [e["type"] for e in events if e["type"] in ("tool", "step")] == ["tool", "step"] * STEPS + ["step"]
+
+        for kind in ("token", "tool", "step"):
+            print(f"first {kind:<6} event  {first[kind]:8.1f} ms")
+        print(f"final status        {total:8.1f} ms")
+        print(f"{chunks} chunks -> {len(tokens)} token events (avg {len(text) / len(tokens):.0f} chars)")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,87 @@
+"""
+Benchmark: the read-only skills_manager calls every run repeats, with and
+without the shared tool-result cache.
+
+Copies ./skills to a temp dir. Each "request" uses a fresh SkillsManagerTool,
+as every pooled crew has its own, and calls list_skills, load_skill and
+list_resources for one skill. It then checks that the cache is invalidated
+precisely:
+
+- editing skill.md outside the tools changes load_skill only
+- adding a reference file outside the tools changes list_resources only
+- write_file through the tool bumps the generation (everything recomputed)
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_tool_cache.py [requests]
+"""
+
+import logging
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from src.config.settings import settings  # noqa: E402
+from src.tools.skills_manager_tool import SkillsManagerTool  # noqa: E402
+from src.tools.tool_cache import ToolResultCache, set_tool_cache  # noqa: E402
+
+SKILL = "api-development"
+
+
+def request() -> None:
+    tool = SkillsManagerTool()
+    assert SKILL in tool._run(action="list_skills")
+    assert "SKILL LOADED" in tool._run(action="load_skill", skill_name=SKILL)
+    assert "References" in tool._run(action="list_resources", skill_name=SKILL)
+
+
+def measure(label: str, run: Callable[[], None], requests: int) -> None:
+    samples: List[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(f"{label:<10} {requests} requests | median {statistics.median(samples):7.3f} ms | max {max(samples):7.3f} ms")
+
+
+def run_benchmark() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logging.disable(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        settings.SKILLS_DIR = Path(tmp) / "skills"
+        shutil.copytree(Path(__file__).resolve().parent.parent / "skills", settings.SKILLS_DIR)
+
+        set_tool_cache(None)
+        settings.TOOL_CACHE_ENABLED = False
+        measure("uncached", request, requests)
+
+        cache = ToolResultCache(max_entries=256, disk_path=Path(tmp) / "tool_cache.sqlite3")
+        set_tool_cache(cache)
+        settings.TOOL_CACHE_ENABLED = True
+        request()
+        measure("cached", request, requests)
+
+        tool = SkillsManagerTool()
+        before = cache.stats()
+        skill_md = settings.SKILLS_DIR / SKILL / "skill.md"
+        skill_md.write_text(skill_md.read_text() + "\nEdited outside the tools.\n")
+        assert "Edited outside" in tool._run(action="load_skill", skill_name=SKILL)
+        tool._run(action="list_resources", skill_name=SKILL)
+        (settings.SKILLS_DIR / SKILL / "references" / "new.md").write_text("# New")
+        assert "references/new.md" in tool._run(action="list_resources", skill_name=SKILL)
+        after = cache.stats()
+        print(f"external edits:  {after['stale'] - before['stale']} stale entries recomputed "
+              f"(load_skill, list_resources, list_resources)")
+
+        tool._run(action="write_file", skill_name=SKILL, file_path="references/new.md", file_content="# Newer")
+        assert "# Newer" in tool._run(action="read_resource", skill_name=SKILL, resource_path="references/new.md")
+        print(f"write_file:      generation {after['generation']} -> {cache.stats()['generation']} | {cache.stats()}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
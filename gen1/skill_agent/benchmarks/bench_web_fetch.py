@@ -0,0 +1,130 @@
+"""
+Benchmark: WebFetchTool against a local stand-in marketplace.
+
+Compares a fresh httpx.Client per URL (the old behaviour) with the pooled
+keep-alive client, for the 14 sequential probes of an owner-less fetch_skill,
+then the pooled client backed by the on-disk response cache (fresh hits and
+ETag revalidation). Finally compares buffering a large HTML page in full
+against the streamed, early-terminating extraction.
+
+Usage (from gen1/skill_agent):
+    python benchmarks/bench_web_fetch.py [rounds]
+"""
+
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import ClassVar, Dict, Set
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import httpx  # noqa: E402
+
+from benchmarks.standin_server import Route, StandInServer  # noqa: E402
+from src.config.settings import settings  # noqa: E402
+from src.tools.http_cache import HTTPResponseCache, set_http_cache  # noqa: E402
+from src.tools.http_client import PooledHTTPClient, set_http_client  # noqa: E402
+from src.tools.rate_limit import DomainLimit, OutboundGovernor  # noqa: E402
+from src.tools.web_fetch_tool import WebFetchTool  # noqa: E402
+
+
+class StandInWebFetchTool(WebFetchTool):
+    ALLOWED_DOMAINS: ClassVar[Set[str]] = {"127.0.0.1"}
+
+
+class RevalidatingWebFetchTool(StandInWebFetchTool):
+    DOMAIN_CACHE_TTLS: ClassVar[Dict[str, int]] = {"127.0.0.1": 0}  # always stale
+
+
+LARGE_PAGE = (
+    b"<!DOCTYPE html><html><head><style>body { color: #333 }</style></head><body>"
+    + b"<div class='row'><p>Skill catalogue entry with a short description.</p></div>" * 60_000
+    + b"</body></html>"
+)
+
+
+def bench_large_page(server: StandInServer, rounds: int) -> None:
+    url = server.url("/large")
+    tool = StandInWebFetchTool()
+
+    # The old path: buffer the whole body, strip all of it, then truncate
+    def buffered() -> None:
+        text = httpx.get(url, timeout=15).text
+        tool._render(url, tool._strip_html(text))
+
+    def streamed() -> None:
+        assert "[TRUNCATED" in tool._fetch(url)
+
+    settings.HTTP_CACHE_ENABLED = False
+    for label, fn in (("buffered page", buffered), ("streamed page", streamed)):
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{label:<16} {len(LARGE_PAGE) / 1e6:.1f} MB html: mean {statistics.mean(timings):7.1f} ms")
+
+
+def main() -> None:
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    route = Route(body=b"# Skill\n" * 200, headers={"Content-Type": "text/plain", "ETag": '"v1"'})
+    large = Route(body=LARGE_PAGE, headers={"Content-Type": "text/html; charset=utf-8"})
+    with StandInServer({"/skill": route, "/large": large}) as server, tempfile.TemporaryDirectory() as tmp:
+        urls = [server.url("/skill")] * 14
+
+        def fresh_clients() -> None:
+            for url in urls:
+                with httpx.Client(follow_redirects=True, timeout=15) as client:
+                    client.get(url).raise_for_status()
+
+        # No rate limit here — this measures connection reuse, not politeness
+        governor = OutboundGovernor(
+            {}, DomainLimit(rate=1e6, burst=10**6, concurrency=6),
+            max_wait=30, max_retries=0, backoff_base=0.5, backoff_max=30,
+        )
+        pooled = PooledHTTPClient(
+            max_connections=50, max_keepalive=20, keepalive_expiry=30, http2=False, governor=governor
+        )
+        set_http_client(pooled)
+        cache = HTTPResponseCache(Path(tmp) / "http_cache.sqlite3", max_bytes=16 * 1024 * 1024)
+
+        def run_tool(tool: StandInWebFetchTool):
+            def fetch_all() -> None:
+                for url in urls:
+                    assert tool._fetch(url).startswith("# Content from:")
+            return fetch_all
+
+        scenarios = (
+            ("client per URL", None, fresh_clients),
+            ("pooled client", None, run_tool(StandInWebFetchTool())),
+            ("pooled + cache", cache, run_tool(StandInWebFetchTool())),
+            ("revalidate 304", cache, run_tool(RevalidatingWebFetchTool())),
+        )
+        for label, scenario_cache, fn in scenarios:
+            settings.HTTP_CACHE_ENABLED = scenario_cache is not None
+            set_http_cache(scenario_cache)
+            if scenario_cache:
+                scenario_cache.clear()
+            before = (server.requests, server.connections, server.not_modified)
+            timings = []
+            for _ in range(rounds):
+                start = time.perf_counter()
+                fn()
+                timings.append((time.perf_counter() - start) * 1000)
+            requests, connections, not_modified = (
+                now - then
+                for now, then in zip((server.requests, server.connections, server.not_modified), before)
+            )
+            print(
+                f"{label:<16} 14 fetches: mean {statistics.mean(timings):7.1f} ms | "
+                f"requests: {requests:3d} ({not_modified} x 304) | connections opened: {connections}"
+            )
+        set_http_cache(None)
+        bench_large_page(server, rounds)
+        set_http_client(None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Local stand-in HTTP server for benchmarks of the outbound tools.
+
+Serves canned responses on 127.0.0.1 with HTTP/1.1 keep-alive, optional
+per-request latency, ETag revalidation (304 on a matching If-None-Match),
+and counters so benchmarks can assert how many
+requests and connections actually reached the "marketplace".
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+
+@dataclass
+class Route:
+    status: int = 200
+    body: bytes = b""
+    headers: dict[str, str] = field(default_factory=lambda: {"Content-Type": "text/plain"})
+
+
+class StandInServer:
+    """
+    Usage:
+        with StandInServer({"/skill": Route(body=b"# Skill")}, latency=0.05) as server:
+            url = server.url("/skill")
+    `handler` (optional) may override routing: handler(server, path) -> Route | None.
+    """
+
+    def __init__(
+        self,
+        routes: dict[str, Route] | None = None,
+        latency: float = 0.0,
+        handler: Callable[["StandInServer", str], Route | None] | None = None,
+    ) -> None:
+        self.routes = routes or {}
+        self.latency = latency
+        self.handler = handler
+        self.requests = 0
+        self.connections = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._httpd.server_address[1]
+
+    def url(self, path: str = "/") -> str:
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    def _make_handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def setup(self) -> None:
+                super().setup()
+                with server._lock:
+                    server.connections += 1
+
+            def do_GET(self) -> None:  # noqa: N802
+                with server._lock:
+                    server.requests += 1
+                if server.latency:
+                    time.sleep(server.latency)
+                route = server.handler(server, self.path) if server.handler else None
+                if route is None:
+                    route = server.routes.get(self.path, Route(404, b"not found"))
+                etag = route.headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    with server._lock:
+                        server.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(route.status)
+                for key, value in route.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(route.body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(route.body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # client stopped reading early — expected for streamed fetches
+
+            def log_message(self, *args) -> None:
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
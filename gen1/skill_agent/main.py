@@ -1,19 +1,32 @@
 import sys
+import json
+import asyncio
 import logging
 import uuid
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict
 
-from fastapi import FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel, Field
 
 # Add src to path so relative imports work
 sys.path.append(str(Path(__file__).parent / "src"))
 
-from src.crew import SkillsCrew
+from src.config.settings import settings
+from src.command_router import get_command_router, run_command
+from src.crew_pool import get_crew_pool
+from src.history_store import close_history_store, get_history_store, save_turn
+from src.llm import get_llm_cache
+from src.run_executor import ExecutorSaturated, get_run_executor
+from src.run_jobs import FINISHED_STATES, QueueFull, get_run_jobs
+from src.single_flight import get_single_flight, run_key
 from src.tools.skills_manager_tool import SkillsManagerTool
+from src.tools.tool_cache import get_tool_cache
+from src.tools.http_client import close_http_client
+from src.tools.rate_limit import get_governor
 
 # Configure logging
 logging.basicConfig(
@@ -22,16 +35,43 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# --- Lifespan ---
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the first crew(s) up front so the first request doesn't pay for it
+    try:
+        await asyncio.to_thread(get_crew_pool().warm, settings.CREW_POOL_WARM)
+    except Exception as e:
+        logger.warning("Crew pool warm-up failed (will build on demand): %s", e)
+    # Start the job workers (and fail jobs whose worker died); they save chat history themselves
+    get_run_jobs()
+    yield
+    get_run_executor().shutdown()
+    get_crew_pool().close()
+    close_history_store()
+    # Release pooled keep-alive connections on shutdown
+    close_http_client()
+
 # --- FastAPI App Initialization ---
 app = FastAPI(
     title="Skill Agent API",
     description="REST API to trigger Skill-Driven CrewAI Operator for dynamic tasks.",
-    version="0.2.0"
+    version="0.2.0",
+    lifespan=lifespan,
 )
 
-# --- In-Memory Store ---
-# thread_id -> list of {"role": "user"|"assistant", "content": "..."}
-CHAT_HISTORY: Dict[str, List[Dict[str, str]]] = {}
+# How often a job event stream checks the job store for new events
+EVENT_POLL_SECONDS = 0.1
+EVENT_KEEPALIVE_SECONDS = 15
+
+def _format_history(thread_id: str) -> str:
+    history_list = get_history_store().get(thread_id)
+    if not history_list:
+        return "No previous context."
+    return "\n".join([
+        f"{msg['role'].upper()}: {msg['content']}" 
+        for msg in history_list
+    ])
 
 # Static Files and UI folder (Fixed pathing)
 static_path = Path(__file__).parent / "static"
@@ -77,6 +117,25 @@ async def health_check():
     """Verify the API is running."""
     return {"status": "healthy", "version": "0.2.0"}
 
+@app.get("/api/v1/metrics", tags=["Monitoring"])
+async def get_metrics():
+    """Outbound traffic per domain, crew run queue / active runs, coalesced runs, crew pool, LLM and tool cache usage."""
+    llm_cache = get_llm_cache()
+    tool_cache = get_tool_cache()
+    router = get_command_router()
+    single_flight = get_single_flight()
+    return {
+        "outbound": get_governor().metrics(),
+        "history": get_history_store().stats(),
+        "runs": get_run_executor().stats(),
+        "jobs": get_run_jobs().stats(),
+        "crew_pool": get_crew_pool().stats(),
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+        "tool_cache": tool_cache.stats() if tool_cache else None,
+        "router": router.stats() if router else None,
+        "coalesce": single_flight.stats() if single_flight else None,
+    }
+
 @app.get("/api/v1/skills", tags=["Skills"])
 async def get_skills():
     """Returns a list of all dynamically discovered skills."""
@@ -89,6 +148,14 @@ async def get_skills():
         logger.error("Error fetching skills: %s", str(e))
         return {"skills": [], "error": str(e)}
 
+def _run_crew(**inputs: Any) -> str:
+    """Blocking part of a run; executes on a run executor thread."""
+    result = run_command(inputs["task_description"])
+    if result is not None:
+        return result
+    with get_crew_pool().lease() as crew:
+        return crew.run(**inputs)
+
 @app.post(
     "/api/v1/run", 
     response_model=RunResponse, 
@@ -106,32 +173,36 @@ async def run_skill_crew(request: RunRequest):
         thread_id = request.thread_id or str(uuid.uuid4())
         
         # 2. Retrieve and format history
-        history_list = CHAT_HISTORY.get(thread_id, [])
-        formatted_history = "No previous context."
-        if history_list:
-            formatted_history = "\n".join([
-                f"{msg['role'].upper()}: {msg['content']}" 
-                for msg in history_list
-            ])
+        formatted_history = _format_history(thread_id)
             
-        # 3. Initialize and run the crew
-        crew = SkillsCrew()
-        result = crew.run(
-            task_description=request.task_description, 
-            chat_history=formatted_history,
-            **request.extra_inputs
-        )
-        
-        # 4. Save history
-        if thread_id not in CHAT_HISTORY:
-            CHAT_HISTORY[thread_id] = []
-        
-        CHAT_HISTORY[thread_id].append({"role": "user", "content": request.task_description})
-        CHAT_HISTORY[thread_id].append({"role": "assistant", "content": result})
-        
-        # Keep only last 10 turns (20 messages) to avoid context bloat
-        if len(CHAT_HISTORY[thread_id]) > 20:
-            CHAT_HISTORY[thread_id] = CHAT_HISTORY[thread_id][-20:]
+        # 3. Lease a pre-built crew and run it on the run executor (off the event loop),
+        # 4. then save history; only the caller that actually runs it saves the turn
+        led = False
+
+        async def run():
+            nonlocal led
+            led = True
+            result = await get_run_executor().submit(
+                _run_crew,
+                task_description=request.task_description,
+                chat_history=formatted_history,
+                thread_id=thread_id,
+                **request.extra_inputs
+            )
+            save_turn(thread_id, request.task_description, result)
+            return result
+
+        # Identical concurrent requests (same task, inputs and thread state) share one run
+        single_flight = get_single_flight()
+        if single_flight is None:
+            result = await run()
+        else:
+            thread_state = [request.thread_id, formatted_history]
+            key = run_key(request.task_description, request.extra_inputs, thread_state)
+            result = await single_flight.do(key, run)
+            if not led and request.thread_id is None:
+                # A fresh thread of this caller's own, so the turn isn't a duplicate
+                save_turn(thread_id, request.task_description, result)
             
         return RunResponse(
             success=True,
@@ -140,6 +211,13 @@ async def run_skill_crew(request: RunRequest):
             message="Task completed successfully"
         )
         
+    except ExecutorSaturated as e:
+        logger.warning("Rejected run request: %s", e)
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(e.retry_after)},
+            content=RunResponse(success=False, result="", message=str(e)).model_dump()
+        )
     except Exception as e:
         logger.error("Error running Skills Crew: %s", str(e), exc_info=True)
         return JSONResponse(
@@ -151,6 +229,86 @@ async def run_skill_crew(request: RunRequest):
             ).model_dump()
         )
 
+# --- Asynchronous jobs ---
+
+@app.post("/api/v1/jobs", tags=["Jobs"], status_code=status.HTTP_202_ACCEPTED)
+async def submit_job(request: RunRequest):
+    """Queue an agent run and return its job handle immediately."""
+    thread_id = request.thread_id or str(uuid.uuid4())
+    inputs = {"chat_history": _format_history(thread_id), **request.extra_inputs}
+    try:
+        job = await asyncio.to_thread(
+            get_run_jobs().submit, request.task_description, thread_id, inputs
+        )
+    except QueueFull as e:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            headers={"Retry-After": str(e.retry_after)},
+            content={"detail": str(e)},
+        )
+    return job.to_dict(include_result=False)
+
+@app.get("/api/v1/jobs", tags=["Jobs"])
+async def list_jobs(limit: int = 50):
+    """Most recent jobs, newest first (without results)."""
+    jobs = await asyncio.to_thread(get_run_jobs().list_jobs, limit)
+    return {"jobs": [job.to_dict(include_result=False) for job in jobs]}
+
+@app.get("/api/v1/jobs/{job_id}", tags=["Jobs"])
+async def get_job(job_id: str):
+    """Status of a job, with its result once completed."""
+    job = await asyncio.to_thread(get_run_jobs().get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return job.to_dict()
+
+@app.get("/api/v1/jobs/{job_id}/events", tags=["Jobs"])
+async def stream_job_events(job_id: str, request: Request, after: int = 0):
+    """
+    Server-Sent Events: status changes and agent steps of a job, from the
+    beginning (or after `after` / Last-Event-ID). Ends with the final status.
+    """
+    jobs = get_run_jobs()
+    if not await asyncio.to_thread(jobs.get, job_id):
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    last_event_id = request.headers.get("last-event-id", "")
+    last = int(last_event_id) if last_event_id.isdigit() else after
+
+    async def stream():
+        nonlocal last
+        idle = 0.0
+        while True:
+            events = await asyncio.to_thread(jobs.events, job_id, last)
+            for event in events:
+                last = event["seq"]
+                yield f"id: {last}\nevent: {event['type']}\ndata: {json.dumps(event['data'])}\n\n"
+                if event["type"] == "status" and event["data"].get("status") in FINISHED_STATES:
+                    return
+            if events:
+                idle = 0.0
+                continue
+            if await request.is_disconnected():
+                return
+            idle += EVENT_POLL_SECONDS
+            if idle >= EVENT_KEEPALIVE_SECONDS:
+                idle = 0.0
+                yield ": keep-alive\n\n"
+            await asyncio.sleep(EVENT_POLL_SECONDS)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.delete("/api/v1/jobs/{job_id}", tags=["Jobs"])
+async def cancel_job(job_id: str):
+    """Cancel a queued job, or stop a running one at its next agent step."""
+    job = await asyncio.to_thread(get_run_jobs().cancel, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return job.to_dict(include_result=False)
+
 @app.post("/api/v1/skills", tags=["Skills"])
 async def create_skill(request: SkillCreateRequest):
     """Dynamically create a new skill."""
@@ -0,0 +1,186 @@
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Pattern, Tuple
+
+from src.config.settings import settings
+from src.run_events import describe_step, emit
+from src.tools.skills_manager_tool import SkillsManagerTool
+
+logger = logging.getLogger(__name__)
+
+# /command → (skills_manager action, positional arguments); the last argument
+# takes the rest of the line, arguments in [brackets] in the usage are optional
+SLASH_COMMANDS: Dict[str, Tuple[str, List[str]]] = {
+    "skills": ("list_skills", []),
+    "skill": ("load_skill", ["skill_name"]),
+    "load": ("load_skill", ["skill_name"]),
+    "resources": ("list_resources", ["skill_name"]),
+    "read": ("read_resource", ["skill_name", "resource_path"]),
+    "run": ("run_script", ["skill_name", "script_name", "script_args"]),
+}
+OPTIONAL_ARGS = ("script_args",)
+
+COMMAND_HELP = "\n".join([
+    "# Commands",
+    "",
+    "- /skills — list available skills",
+    "- /skill <name> — load a skill's instructions (alias: /load)",
+    "- /resources <name> — list a skill's references and scripts",
+    "- /read <name> <references/file.md> — read a resource",
+    "- /run <name> <script.py> [args] — run a skill script",
+    "",
+    "Anything else is handled by the agent.",
+])
+
+_POLITE = r"(?:please |can you |could you )?"
+_SKILL = r"(?P<skill_name>[\w.-]+?)(?:'s|’s)?"
+
+# Phrasings unambiguous enough to run without the agent; each must match the
+# whole (whitespace-normalized) task, and the skill / file must exist
+INTENT_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    ("list_skills", re.compile(rf"{_POLITE}(?:list|show)(?: me)?(?: all)?(?: the)?(?: available)? skills", re.I)),
+    ("load_skill", re.compile(rf"{_POLITE}(?:show|load|open|display)(?: me)?(?: the)? {_SKILL} skill", re.I)),
+    ("load_skill", re.compile(rf"{_POLITE}(?:show|load|open|display)(?: me)?(?: the)? skill {_SKILL}", re.I)),
+    ("list_resources", re.compile(
+        rf"{_POLITE}(?:list|show)(?: me)?(?: the)? (?:resources|references|scripts|files) (?:of|for|in)(?: the)? "
+        rf"{_SKILL}(?: skill)?",
+        re.I,
+    )),
+    ("read_resource", re.compile(
+        rf"{_POLITE}(?:show|read|open|display)(?: me)?(?: the)? {_SKILL} (?P<resource_path>(?:references|scripts)/[\w./-]+)",
+        re.I,
+    )),
+    ("run_script", re.compile(
+        rf"{_POLITE}(?:run|execute) {_SKILL} (?:scripts/)?(?P<script_name>[\w.-]+\.py)(?: (?:for|with|on) (?P<script_args>.+))?",
+        re.I,
+    )),
+]
+
+
+@dataclass
+class Command:
+    """A skills_manager call resolved from the task text, run without the agent."""
+
+    action: str
+    args: Dict[str, str] = field(default_factory=dict)
+    source: str = "slash"  # slash | intent
+
+
+class CommandRouter:
+    """
+    Deterministic fast path in front of SkillsCrew.run. Mechanical requests
+    ("/run content-idea-generator generate_ideas.py blogs", "show me the
+    api-development skill") are executed as a single skills_manager call
+    instead of a full kickoff; everything else falls through to the agent.
+
+    Slash commands always run (a known command with bad arguments returns its
+    usage). Natural-language intents only run on a full-sentence match that
+    names an existing skill and file, so anything ambiguous reaches the agent.
+    """
+
+    def __init__(self, intents: bool = True) -> None:
+        self.intents = intents
+        self.tool = SkillsManagerTool()
+        self._lock = threading.Lock()
+        self._counts = {"slash": 0, "intent": 0, "agent": 0}
+
+    def route(self, task: str) -> Optional[Command | str]:
+        """The command for `task`, a usage / help message, or None for the agent."""
+        text = " ".join(task.split())
+        if text.startswith("/"):
+            return self._parse_slash(text)
+        if self.intents:
+            return self._match_intent(text.rstrip(".!?"))
+        return None
+
+    def _parse_slash(self, text: str) -> Optional[Command | str]:
+        name, _, rest = text[1:].partition(" ")
+        name = name.lower()
+        if name == "help":
+            return COMMAND_HELP
+        if name not in SLASH_COMMANDS:
+            return None  # e.g. a task that starts with a path
+        action, names = SLASH_COMMANDS[name]
+        values = rest.split(None, len(names) - 1) if names and rest else []
+        required = [n for n in names if n not in OPTIONAL_ARGS]
+        if len(values) < len(required):
+            usage = " ".join(f"[{n}]" if n in OPTIONAL_ARGS else f"<{n}>" for n in names)
+            return f"❌ Usage: /{name} {usage}".rstrip() + "\n\n" + COMMAND_HELP
+        return Command(action, dict(zip(names, values)), source="slash")
+
+    def _match_intent(self, text: str) -> Optional[Command]:
+        for action, pattern in INTENT_PATTERNS:
+            match = pattern.fullmatch(text)
+            if not match:
+                continue
+            args = {k: v for k, v in match.groupdict().items() if v}
+            if self._confident(action, args):
+                return Command(action, args, source="intent")
+        return None
+
+    def _confident(self, action: str, args: Dict[str, str]) -> bool:
+        """Only act on intents whose skill (and file) actually exist."""
+        if "skill_name" not in args:
+            return True
+        meta = self.tool._resolve_skill(args["skill_name"])
+        if meta is None:
+            return False
+        relative = args.get("resource_path") or (
+            f"scripts/{args['script_name']}" if "script_name" in args else ""
+        )
+        if not relative:
+            return True
+        path = self.tool._safe_resolve(meta, relative)
+        return path is not None and path.is_file()
+
+    def run(self, task: str) -> Optional[str]:
+        """Execute `task` directly if it is a command; None means run the agent."""
+        routed = self.route(task)
+        if routed is None:
+            self._count("agent")
+            return None
+        if isinstance(routed, str):
+            self._count("slash")
+            return routed
+        self._count(routed.source)
+        logger.info("Routed %s command: %s %s", routed.source, routed.action, routed.args)
+        tool_input = {"action": routed.action, **routed.args}
+        emit("tool", {"tool": self.tool.name, "tool_input": tool_input})
+        result = self.tool._run(**tool_input)
+        step = SimpleNamespace(
+            tool=self.tool.name, thought=f"{routed.source} command", tool_input=tool_input, result=result
+        )
+        emit("step", describe_step(step))
+        return result
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"intents": self.intents, **self._counts}
+
+
+_router: Optional[CommandRouter] = None
+_router_lock = threading.Lock()
+
+
+def get_command_router() -> Optional[CommandRouter]:
+    """Return the shared command router, or None when COMMAND_ROUTER_ENABLED is off."""
+    global _router
+    if not settings.COMMAND_ROUTER_ENABLED:
+        return None
+    with _router_lock:
+        if _router is None:
+            _router = CommandRouter(intents=settings.COMMAND_ROUTER_INTENTS)
+        return _router
+
+
+def run_command(task: str) -> Optional[str]:
+    """Result of `task` as a direct command, or None when the agent should handle it."""
+    router = get_command_router()
+    return router.run(task) if router is not None else None
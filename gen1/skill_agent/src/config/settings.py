@@ -13,6 +13,132 @@ class Settings:
     LLM_MODEL: str = os.getenv("LLM_MODEL", "gemini/gemini-2.5-flash")
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
 
+    # Pooled SkillsCrew instances per worker (built once, leased per request)
+    CREW_POOL_SIZE: int = int(os.getenv("CREW_POOL_SIZE", "4"))
+    CREW_POOL_WARM: int = int(os.getenv("CREW_POOL_WARM", "1"))
+
+    # Crew runs execute on a bounded thread pool, off the event loop; beyond
+    # RUN_WORKERS running + RUN_QUEUE_SIZE waiting, /api/v1/run answers 503
+    RUN_WORKERS: int = int(os.getenv("RUN_WORKERS", "4"))
+    RUN_QUEUE_SIZE: int = int(os.getenv("RUN_QUEUE_SIZE", "8"))
+    RUN_RETRY_AFTER: int = int(os.getenv("RUN_RETRY_AFTER", "30"))
+    # Identical concurrent /api/v1/run requests share one execution (src/single_flight.py)
+    RUN_COALESCE_ENABLED: bool = os.getenv("RUN_COALESCE_ENABLED", "true").lower() == "true"
+
+    # Asynchronous run jobs (/api/v1/jobs): persistent SQLite queue + progress events.
+    # RUN_JOB_WORKERS=0 makes this an API-only process; run `python -m src.run_jobs` workers instead
+    RUN_JOBS_DB_PATH: Path = Path(os.getenv("RUN_JOBS_DB_PATH", str(BASE_DIR / ".cache" / "run_jobs.sqlite3")))
+    RUN_JOB_WORKERS: int = int(os.getenv("RUN_JOB_WORKERS", "2"))
+    RUN_JOBS_MAX_QUEUED: int = int(os.getenv("RUN_JOBS_MAX_QUEUED", "32"))
+    RUN_JOBS_HISTORY_LIMIT: int = int(os.getenv("RUN_JOBS_HISTORY_LIMIT", "200"))
+    # A running job not heartbeated for this long (its worker died, on any host) is failed;
+    # keep it well above clock skew between hosts sharing RUN_JOBS_DB_PATH
+    RUN_JOBS_LEASE_SECONDS: float = float(os.getenv("RUN_JOBS_LEASE_SECONDS", "120"))
+
+    # Chat history per thread_id (src/history_store.py): memory (this process,
+    # LRU) or sqlite (WAL file shared by workers, batched writes). Each thread
+    # keeps its last HISTORY_MAX_MESSAGES; idle threads expire after HISTORY_TTL
+    HISTORY_BACKEND: str = os.getenv("HISTORY_BACKEND", "sqlite").lower()
+    HISTORY_DB_PATH: Path = Path(os.getenv("HISTORY_DB_PATH", str(BASE_DIR / ".cache" / "chat_history.sqlite3")))
+    HISTORY_MAX_THREADS: int = int(os.getenv("HISTORY_MAX_THREADS", "10000"))
+    HISTORY_MAX_MESSAGES: int = int(os.getenv("HISTORY_MAX_MESSAGES", "20"))
+    HISTORY_TTL: int = int(os.getenv("HISTORY_TTL", str(7 * 86400)))
+    HISTORY_FLUSH_MS: int = int(os.getenv("HISTORY_FLUSH_MS", "50"))
+    HISTORY_BATCH_SIZE: int = int(os.getenv("HISTORY_BATCH_SIZE", "256"))
+
+    # Stream LLM output to job event streams, coalesced into one "token" event
+    # per STREAM_FLUSH_MS or STREAM_FLUSH_CHARS (whichever comes first)
+    LLM_STREAM: bool = os.getenv("LLM_STREAM", "true").lower() == "true"
+    STREAM_FLUSH_MS: int = int(os.getenv("STREAM_FLUSH_MS", "100"))
+    STREAM_FLUSH_CHARS: int = int(os.getenv("STREAM_FLUSH_CHARS", "200"))
+
+    # Completion cache in front of the crew LLM (src/llm.py), keyed on model,
+    # tool schemas and whitespace-normalized messages; memory LRU + SQLite tier
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL: int = int(os.getenv("LLM_CACHE_TTL", "86400"))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+    LLM_CACHE_DISK: bool = os.getenv("LLM_CACHE_DISK", "true").lower() == "true"
+    LLM_CACHE_PATH: Path = Path(os.getenv("LLM_CACHE_PATH", str(BASE_DIR / ".cache" / "llm_cache.sqlite3")))
+
+    # Shared cache of read-only skills_manager results (src/tools/tool_cache.py);
+    # the SQLite tier lets workers share results and invalidations
+    TOOL_CACHE_ENABLED: bool = os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+    TOOL_CACHE_MAX_ENTRIES: int = int(os.getenv("TOOL_CACHE_MAX_ENTRIES", "256"))
+    TOOL_CACHE_DISK: bool = os.getenv("TOOL_CACHE_DISK", "false").lower() == "true"
+    TOOL_CACHE_PATH: Path = Path(os.getenv("TOOL_CACHE_PATH", str(BASE_DIR / ".cache" / "tool_cache.sqlite3")))
+
+    # Render the skills registry into the task ({skills_registry}) so the agent
+    # skips the list_skills step; false makes it discover skills with the tool
+    SKILLS_REGISTRY_IN_PROMPT: bool = os.getenv("SKILLS_REGISTRY_IN_PROMPT", "true").lower() == "true"
+
+    # Run slash commands (/skill, /read, /run, ...) and unambiguous requests
+    # ("show me the X skill") as one skills_manager call, without the agent
+    COMMAND_ROUTER_ENABLED: bool = os.getenv("COMMAND_ROUTER_ENABLED", "true").lower() == "true"
+    COMMAND_ROUTER_INTENTS: bool = os.getenv("COMMAND_ROUTER_INTENTS", "true").lower() == "true"
+
+    # Offline scripted model: LLM_MODEL=standin or standin/<script.yaml>
+    STANDIN_LLM_LATENCY_MS: int = int(os.getenv("STANDIN_LLM_LATENCY_MS", "0"))
+
+    # Persistent Python kernels for code_executor run_python (one per thread_id)
+    KERNEL_ENABLED: bool = os.getenv("KERNEL_ENABLED", "true").lower() == "true"
+    KERNEL_MAX_SESSIONS: int = int(os.getenv("KERNEL_MAX_SESSIONS", "8"))
+    KERNEL_IDLE_TIMEOUT: int = int(os.getenv("KERNEL_IDLE_TIMEOUT", "900"))
+    KERNEL_MEMORY_LIMIT_MB: int = int(os.getenv("KERNEL_MEMORY_LIMIT_MB", "2048"))
+
+    # Preloaded zygote that forks one child per run_python / run_script execution
+    ZYGOTE_ENABLED: bool = os.getenv("ZYGOTE_ENABLED", "true").lower() == "true"
+    ZYGOTE_PRELOAD: str = os.getenv("ZYGOTE_PRELOAD", "json,yaml,requests,numpy")
+    EXEC_MEMORY_LIMIT_MB: int = int(os.getenv("EXEC_MEMORY_LIMIT_MB", "2048"))
+
+    # code_executor run_batch
+    BATCH_MAX_WORKERS: int = int(os.getenv("BATCH_MAX_WORKERS", str(os.cpu_count() or 4)))
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", "32"))
+
+    # Managed packages: local wheelhouse + per-skill cached virtualenvs
+    WHEELHOUSE_DIR: Path = Path(os.getenv("WHEELHOUSE_DIR", str(BASE_DIR / ".cache" / "wheelhouse")))
+    VENV_CACHE_DIR: Path = Path(os.getenv("VENV_CACHE_DIR", str(BASE_DIR / ".cache" / "venvs")))
+    PACKAGE_OFFLINE: bool = os.getenv("PACKAGE_OFFLINE", "false").lower() == "true"
+    PACKAGE_INSTALL_TIMEOUT: int = int(os.getenv("PACKAGE_INSTALL_TIMEOUT", "300"))
+
+    # Shared outbound HTTP client (web_fetch)
+    HTTP_MAX_CONNECTIONS: int = int(os.getenv("HTTP_MAX_CONNECTIONS", "50"))
+    HTTP_MAX_KEEPALIVE: int = int(os.getenv("HTTP_MAX_KEEPALIVE", "20"))
+    HTTP_MAX_PER_HOST: int = int(os.getenv("HTTP_MAX_PER_HOST", "6"))
+    HTTP_KEEPALIVE_EXPIRY: float = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "30"))
+    HTTP2_ENABLED: bool = os.getenv("HTTP2_ENABLED", "true").lower() == "true"
+
+    # Outbound rate limiting (per-domain overrides in src/tools/rate_limit.py);
+    # HTTP_MAX_PER_HOST is the default per-domain concurrency
+    RATE_LIMIT_DEFAULT_RPS: float = float(os.getenv("RATE_LIMIT_DEFAULT_RPS", "5"))
+    RATE_LIMIT_DEFAULT_BURST: int = int(os.getenv("RATE_LIMIT_DEFAULT_BURST", "10"))
+    RATE_LIMIT_MAX_WAIT: float = float(os.getenv("RATE_LIMIT_MAX_WAIT", "30"))
+    RATE_LIMIT_MAX_RETRIES: int = int(os.getenv("RATE_LIMIT_MAX_RETRIES", "3"))
+    RATE_LIMIT_BACKOFF_BASE: float = float(os.getenv("RATE_LIMIT_BACKOFF_BASE", "0.5"))
+    RATE_LIMIT_BACKOFF_MAX: float = float(os.getenv("RATE_LIMIT_BACKOFF_MAX", "30"))
+
+    # Hard cap on raw bytes read per web_fetch response (bodies are streamed)
+    WEB_FETCH_MAX_BYTES: int = int(os.getenv("WEB_FETCH_MAX_BYTES", str(2 * 1024 * 1024)))
+    # Concurrent probes when fetch_skill searches the known owners
+    FETCH_FANOUT_CONCURRENCY: int = int(os.getenv("FETCH_FANOUT_CONCURRENCY", "8"))
+
+    # On-disk response cache for web_fetch (per-domain TTLs live in web_fetch_tool)
+    HTTP_CACHE_ENABLED: bool = os.getenv("HTTP_CACHE_ENABLED", "true").lower() == "true"
+    HTTP_CACHE_PATH: Path = Path(os.getenv("HTTP_CACHE_PATH", str(BASE_DIR / ".cache" / "http_cache.sqlite3")))
+    HTTP_CACHE_MAX_MB: int = int(os.getenv("HTTP_CACHE_MAX_MB", "64"))
+    HTTP_CACHE_DEFAULT_TTL: int = int(os.getenv("HTTP_CACHE_DEFAULT_TTL", "600"))
+    HTTP_CACHE_NEGATIVE_TTL: int = int(os.getenv("HTTP_CACHE_NEGATIVE_TTL", "600"))
+
+    # duckduckgo_search: backend (duckduckgo | local stand-in index) and result cache
+    SEARCH_BACKEND: str = os.getenv("SEARCH_BACKEND", "duckduckgo").lower()
+    SEARCH_LOCAL_INDEX: Path = Path(os.getenv("SEARCH_LOCAL_INDEX", str(BASE_DIR / "benchmarks" / "search_index.json")))
+    SEARCH_CACHE_TTL: int = int(os.getenv("SEARCH_CACHE_TTL", "3600"))
+    SEARCH_CACHE_MAX_ENTRIES: int = int(os.getenv("SEARCH_CACHE_MAX_ENTRIES", "512"))
+    SEARCH_CACHE_DISK: bool = os.getenv("SEARCH_CACHE_DISK", "true").lower() == "true"
+    SEARCH_CACHE_PATH: Path = Path(os.getenv("SEARCH_CACHE_PATH", str(BASE_DIR / ".cache" / "search_cache.sqlite3")))
+    # search_queries=[...]: max queries per call, and how many run at once
+    SEARCH_MAX_QUERIES: int = int(os.getenv("SEARCH_MAX_QUERIES", "6"))
+    SEARCH_PARALLEL_QUERIES: int = int(os.getenv("SEARCH_PARALLEL_QUERIES", "4"))
+
     @classmethod
     def validate(cls) -> None:
         if not cls.SKILLS_DIR.exists():
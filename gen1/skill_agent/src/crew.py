@@ -1,14 +1,21 @@
 import logging
 from typing import Any
 
-from crewai import Agent, Crew, Process, Task, LLM
+from crewai import Agent, Crew, Process, Task
+from crewai.agents.cache import CacheHandler
 from crewai.project import CrewBase, agent, crew, task
 
 from src.config.settings import settings
+from src.llm import build_llm
+from src.run_events import on_step, register_stream_handlers
 from src.tools import SkillsManagerTool, CodeExecutorTool, WebFetchTool, DuckDuckGoSearchTool
+from src.tools.python_kernel import session_scope
 
 logger = logging.getLogger(__name__)
 
+# {skills_registry} when SKILLS_REGISTRY_IN_PROMPT is off
+REGISTRY_NOT_PROVIDED = "Not provided. Call skills_manager(action='list_skills') to discover skills."
+
 
 @CrewBase
 class SkillsCrew:
@@ -27,7 +34,12 @@ class SkillsCrew:
 
     def __init__(self) -> None:
         settings.validate()
-        self.llm = LLM(model=settings.LLM_MODEL)
+        # Provider model or offline stand-in, behind the completion cache;
+        # streamed chunks reach job event streams through register_stream_handlers()
+        self.llm = build_llm()
+        register_stream_handlers()
+        # Shared with skills_registry(), which renders its registry into the task
+        self.skills_manager = SkillsManagerTool()
         logger.info(
             "SkillsCrew initialized. Skills dir: %s, Model: %s",
             settings.SKILLS_DIR, settings.LLM_MODEL
@@ -38,7 +50,7 @@ class SkillsCrew:
         return Agent(
             config=self.agents_config["skills_operator"],
             tools=[
-                SkillsManagerTool(),
+                self.skills_manager,
                 CodeExecutorTool(),
                 WebFetchTool(),
                 DuckDuckGoSearchTool(),
@@ -65,21 +77,50 @@ class SkillsCrew:
             tasks=self.tasks,
             process=Process.sequential,
             verbose=True,
+            step_callback=on_step,
         )
 
-    def run(self, task_description: str, chat_history: str = "No previous context.", **extra_inputs: Any) -> str:
+    def reset(self) -> None:
+        """
+        Clear per-request state so a pooled instance can serve the next request.
+        The tool-result cache is swapped for an empty one: results such as
+        list_skills must not leak from one request into another.
+        """
+        crew = self.crew()
+        cache_handler = CacheHandler()
+        crew._cache_handler = cache_handler
+        for crew_agent in crew.agents:
+            crew_agent.set_cache_handler(cache_handler)
+
+    def skills_registry(self) -> str:
+        """Compact skill list for the task prompt, saving the agent a list_skills round trip."""
+        if not settings.SKILLS_REGISTRY_IN_PROMPT:
+            return REGISTRY_NOT_PROVIDED
+        return self.skills_manager.registry_summary()
+
+    def run(
+        self,
+        task_description: str,
+        chat_history: str = "No previous context.",
+        thread_id: str | None = None,
+        **extra_inputs: Any,
+    ) -> str:
         """
         Kick off the crew with a task description and optional chat history.
         Extra inputs are merged and passed to task interpolation.
+        thread_id scopes persistent code_executor state to the conversation.
         """
         inputs = {
             "task_description": task_description,
             "chat_history": chat_history,
+            "skills_registry": self.skills_registry(),
             **extra_inputs
         }
-        logger.info("Kicking off SkillsCrew with inputs: %s", inputs)
+        logger.info("Kicking off SkillsCrew for task: %s", task_description)
 
-        result = self.crew().kickoff(inputs=inputs)
+        self.reset()
+        with session_scope(thread_id):
+            result = self.crew().kickoff(inputs=inputs)
 
         logger.info("SkillsCrew completed. Output length: %d chars", len(result.raw))
         return result.raw
@@ -0,0 +1,127 @@
+import contextlib
+import logging
+import threading
+import time
+from typing import Callable, Dict, Generic, Iterator, List, Optional, TypeVar
+
+from src.config.settings import settings
+from src.crew import SkillsCrew
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class CrewPool(Generic[T]):
+    """
+    Per-worker pool of fully built crews.
+
+    Building a SkillsCrew (settings validation, YAML config, LLM client, tool
+    instances, agent/task/crew objects) happens once per pooled instance
+    instead of once per request. Each request leases an instance exclusively,
+    so concurrent requests never share a crew's mutable kickoff state. When
+    all instances are busy a new one is built (never blocks); at most
+    `max_idle` are kept for reuse. Instances whose run raised are discarded.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        max_idle: int,
+        close: Optional[Callable[[T], None]] = None,
+    ) -> None:
+        self._factory = factory
+        self._close = close
+        self.max_idle = max(1, max_idle)
+        self._idle: List[T] = []
+        self._lock = threading.Lock()
+        self.built = 0
+        self.leased = 0
+        self.reused = 0
+        self.discarded = 0
+        self.build_seconds = 0.0
+
+    def _build(self) -> T:
+        start = time.perf_counter()
+        instance = self._factory()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.built += 1
+            self.build_seconds += elapsed
+        logger.info("Crew pool built an instance in %.0f ms", elapsed * 1000)
+        return instance
+
+    def _discard(self, instance: T) -> None:
+        with self._lock:
+            self.discarded += 1
+        if self._close:
+            try:
+                self._close(instance)
+            except Exception as e:
+                logger.warning("Error closing pooled crew: %s", e)
+
+    def warm(self, count: int) -> None:
+        """Pre-build instances (e.g. at startup) so first requests don't pay for it."""
+        for _ in range(max(0, min(count, self.max_idle) - len(self._idle))):
+            instance = self._build()
+            with self._lock:
+                self._idle.append(instance)
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[T]:
+        with self._lock:
+            instance = self._idle.pop() if self._idle else None
+            self.leased += 1
+            if instance is not None:
+                self.reused += 1
+        if instance is None:
+            instance = self._build()
+
+        try:
+            yield instance
+        except BaseException:
+            self._discard(instance)  # state after a failed kickoff is unknown
+            raise
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(instance)
+                return
+        self._discard(instance)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for instance in idle:
+            self._discard(instance)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "built": self.built,
+                "leased": self.leased,
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "avg_build_ms": round(1000 * self.build_seconds / self.built, 1) if self.built else 0.0,
+            }
+
+
+_pool: Optional[CrewPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_crew_pool() -> CrewPool:
+    """Return this worker's SkillsCrew pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = CrewPool(SkillsCrew, max_idle=settings.CREW_POOL_SIZE)
+        return _pool
+
+
+def set_crew_pool(pool: Optional[CrewPool]) -> None:
+    """Swap the pool, e.g. for a pool of stand-in crews in benchmarks."""
+    global _pool
+    with _pool_lock:
+        _pool = pool
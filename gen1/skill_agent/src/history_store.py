@@ -0,0 +1,331 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple, Union
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# {"role": "user" | "assistant", "content": "..."}
+Message = Dict[str, str]
+
+# How often the SQLite store expires idle threads and enforces max_threads
+PRUNE_INTERVAL_SECONDS = 60.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS chat_threads (
+    thread_id  TEXT PRIMARY KEY,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chat_threads_updated ON chat_threads (updated_at);
+
+CREATE TABLE IF NOT EXISTS chat_messages (
+    id        INTEGER PRIMARY KEY,
+    thread_id TEXT NOT NULL,
+    role      TEXT NOT NULL,
+    content   TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_chat_messages_thread ON chat_messages (thread_id, id);
+"""
+
+
+class MemoryHistoryStore:
+    """
+    Per-thread chat history in this process: an LRU of at most `max_threads`
+    threads, each a deque of its last `max_messages` messages (O(1) append).
+    Threads idle for longer than `ttl` seconds are dropped.
+    """
+
+    def __init__(self, max_threads: int, max_messages: int, ttl: float) -> None:
+        self.max_threads = max(1, max_threads)
+        self.max_messages = max(1, max_messages)
+        self.ttl = ttl
+        self._threads: "OrderedDict[str, Tuple[float, Deque[Message]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evicted = 0
+        self.expired = 0
+
+    def get(self, thread_id: str) -> List[Message]:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = self._threads.get(thread_id)
+            if entry is None:
+                return []
+            self._threads[thread_id] = (now, entry[1])
+            self._threads.move_to_end(thread_id)
+            return list(entry[1])
+
+    def append(self, thread_id: str, messages: List[Message]) -> None:
+        now = time.time()
+        with self._lock:
+            self._expire(now)
+            entry = self._threads.get(thread_id)
+            history = entry[1] if entry else deque(maxlen=self.max_messages)
+            history.extend(messages)
+            self._threads[thread_id] = (now, history)
+            self._threads.move_to_end(thread_id)
+            while len(self._threads) > self.max_threads:
+                self._threads.popitem(last=False)
+                self.evicted += 1
+
+    def _expire(self, now: float) -> None:
+        """Drop idle threads from the LRU end. Caller holds the lock."""
+        while self._threads:
+            thread_id, (last_used, _) = next(iter(self._threads.items()))
+            if now - last_used <= self.ttl:
+                break
+            del self._threads[thread_id]
+            self.expired += 1
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "backend": "memory",
+                "threads": len(self._threads),
+                "max_threads": self.max_threads,
+                "evicted": self.evicted,
+                "expired": self.expired,
+            }
+
+
+class SQLiteHistoryStore:
+    """
+    Chat history in SQLite (WAL), shared by every worker on the host and kept
+    across restarts. Appends are O(1) inserts buffered in memory and written
+    by a background thread in batches (every `flush_ms` or `batch_size`
+    messages); reads in this process see their own unflushed messages. If the
+    writer falls behind, an append beyond 4 batches flushes on the caller's
+    thread, so the buffer stays bounded. Each
+    thread keeps its last `max_messages` messages. Threads not written for
+    `ttl` seconds are deleted, and the least recently written ones beyond
+    `max_threads` are deleted too.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_threads: int,
+        max_messages: int,
+        ttl: float,
+        flush_ms: int = 50,
+        batch_size: int = 256,
+    ) -> None:
+        self.max_threads = max(1, max_threads)
+        self.max_messages = max(1, max_messages)
+        self.ttl = ttl
+        self.flush_seconds = max(1, flush_ms) / 1000
+        self.batch_size = max(1, batch_size)
+        self.max_pending = self.batch_size * 4
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._db_lock = threading.Lock()
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.executescript(_SCHEMA)
+        self._pending: List[Tuple[str, Message, float]] = []
+        self._pending_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        self._last_prune = 0.0
+        self.flushes = 0
+        self.written = 0
+        self.pruned = 0
+        self._flusher = threading.Thread(target=self._flush_loop, name="history-flush", daemon=True)
+        self._flusher.start()
+
+    def get(self, thread_id: str) -> List[Message]:
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT role, content FROM chat_messages WHERE thread_id = ? ORDER BY id DESC LIMIT ?",
+                (thread_id, self.max_messages),
+            ).fetchall()
+            with self._pending_lock:
+                pending = [message for tid, message, _ in self._pending if tid == thread_id]
+        messages = [{"role": role, "content": content} for role, content in reversed(rows)] + pending
+        return messages[-self.max_messages:]
+
+    def append(self, thread_id: str, messages: List[Message]) -> None:
+        now = time.time()
+        with self._pending_lock:
+            self._pending.extend((thread_id, message, now) for message in messages)
+            pending = len(self._pending)
+        if pending >= self.max_pending:
+            self.flush()
+        elif pending >= self.batch_size:
+            self._wake.set()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.warning("Chat history flush failed (will retry): %s", e)
+
+    def flush(self) -> None:
+        """Write buffered messages in one transaction and trim the threads they touched."""
+        now = time.time()
+        # get() holds the DB lock too, so it never sees a batch in neither place
+        with self._db_lock:
+            with self._pending_lock:
+                batch, self._pending = self._pending, []
+            if batch:
+                self._write(batch)
+                self.flushes += 1
+                self.written += len(batch)
+        if now - self._last_prune >= PRUNE_INTERVAL_SECONDS:
+            self._last_prune = now
+            self._prune(now)
+
+    def _write(self, batch: List[Tuple[str, Message, float]]) -> None:
+        """Caller holds the DB lock; on failure the batch goes back to the buffer."""
+        updated: Dict[str, float] = {}
+        for thread_id, _, ts in batch:
+            updated[thread_id] = ts
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO chat_messages (thread_id, role, content) VALUES (?, ?, ?)",
+                    [(tid, m["role"], m["content"]) for tid, m, _ in batch],
+                )
+                self._conn.executemany(
+                    "INSERT INTO chat_threads (thread_id, updated_at) VALUES (?, ?) "
+                    "ON CONFLICT(thread_id) DO UPDATE SET updated_at = excluded.updated_at",
+                    list(updated.items()),
+                )
+                self._conn.executemany(
+                    "DELETE FROM chat_messages WHERE thread_id = ? AND id < ("
+                    "SELECT MIN(id) FROM (SELECT id FROM chat_messages WHERE thread_id = ? "
+                    "ORDER BY id DESC LIMIT ?))",
+                    [(tid, tid, self.max_messages) for tid in updated],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        except Exception:
+            with self._pending_lock:
+                self._pending[:0] = batch  # keep order; retried on the next flush
+            raise
+
+    def _prune(self, now: float) -> None:
+        """Delete idle threads and the least recently written ones beyond max_threads."""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (count,) = self._conn.execute("SELECT COUNT(*) FROM chat_threads").fetchone()
+                self._conn.execute(
+                    "CREATE TEMP TABLE IF NOT EXISTS doomed_threads (thread_id TEXT PRIMARY KEY)"
+                )
+                self._conn.execute("DELETE FROM doomed_threads")
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO doomed_threads SELECT thread_id FROM chat_threads WHERE updated_at < ?",
+                    (now - self.ttl,),
+                )
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO doomed_threads SELECT thread_id FROM chat_threads "
+                    "ORDER BY updated_at LIMIT ?",
+                    (max(0, count - self.max_threads),),
+                )
+                self._conn.execute(
+                    "DELETE FROM chat_messages WHERE thread_id IN (SELECT thread_id FROM doomed_threads)"
+                )
+                removed = self._conn.execute(
+                    "DELETE FROM chat_threads WHERE thread_id IN (SELECT thread_id FROM doomed_threads)"
+                ).rowcount
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.pruned += removed
+        if removed:
+            logger.info("Pruned %d chat history threads", removed)
+
+    def close(self) -> None:
+        """Stop the flusher and write what is still buffered."""
+        self._closed.set()
+        self._wake.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._db_lock:
+            (threads,) = self._conn.execute("SELECT COUNT(*) FROM chat_threads").fetchone()
+        with self._pending_lock:
+            pending = len(self._pending)
+        return {
+            "backend": "sqlite",
+            "threads": threads,
+            "max_threads": self.max_threads,
+            "pending": pending,
+            "flushes": self.flushes,
+            "written": self.written,
+            "pruned": self.pruned,
+        }
+
+
+# Anything with the same get / append / stats / close methods can be set instead
+HistoryStore = Union[MemoryHistoryStore, SQLiteHistoryStore]
+
+_store: Optional[HistoryStore] = None
+_store_lock = threading.Lock()
+
+
+def get_history_store() -> HistoryStore:
+    """Return this process's chat history store (HISTORY_BACKEND: memory | sqlite)."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            if settings.HISTORY_BACKEND == "sqlite":
+                _store = SQLiteHistoryStore(
+                    db_path=settings.HISTORY_DB_PATH,
+                    max_threads=settings.HISTORY_MAX_THREADS,
+                    max_messages=settings.HISTORY_MAX_MESSAGES,
+                    ttl=settings.HISTORY_TTL,
+                    flush_ms=settings.HISTORY_FLUSH_MS,
+                    batch_size=settings.HISTORY_BATCH_SIZE,
+                )
+            else:
+                _store = MemoryHistoryStore(
+                    max_threads=settings.HISTORY_MAX_THREADS,
+                    max_messages=settings.HISTORY_MAX_MESSAGES,
+                    ttl=settings.HISTORY_TTL,
+                )
+        return _store
+
+
+def set_history_store(store: Optional[HistoryStore]) -> None:
+    """Swap the history store, e.g. for a temporary one in benchmarks."""
+    global _store
+    with _store_lock:
+        _store = store
+
+
+def save_turn(thread_id: str, task_description: str, result: str) -> None:
+    """Append one user / assistant exchange to a thread's history."""
+    # The store keeps the last HISTORY_MAX_MESSAGES per thread to avoid context bloat
+    get_history_store().append(thread_id, [
+        {"role": "user", "content": task_description},
+        {"role": "assistant", "content": result},
+    ])
+
+
+def close_history_store() -> None:
+    """Flush and release the history store (app shutdown)."""
+    global _store
+    with _store_lock:
+        store, _store = _store, None
+    if store is not None:
+        store.close()
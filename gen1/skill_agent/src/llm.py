@@ -0,0 +1,275 @@
+import hashlib
+import json
+import logging
+import re
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+from crewai import LLM, BaseLLM
+from crewai.events import crewai_event_bus
+from crewai.events.types.llm_events import LLMStreamChunkEvent
+from pydantic import Field
+
+from src.config.settings import settings
+from src.tools.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+STANDIN_PREFIX = "standin"
+
+# Used when LLM_MODEL=standin (no script): answer every task in one step
+DEFAULT_STANDIN_SCRIPT: Dict[str, Any] = {
+    "rules": [],
+    "default": ["Thought: I now know the final answer\nFinal Answer: Stand-in answer (turn {turn})."],
+}
+
+# Characters per streamed chunk when the stand-in model streams
+STANDIN_CHUNK_CHARS = 16
+
+
+def _normalize_content(content: Any) -> Any:
+    if isinstance(content, str):
+        return " ".join(content.split())
+    return content
+
+
+def completion_key(
+    model: str,
+    messages: Any,
+    tools: Optional[List[Dict[str, Any]]] = None,
+    stop: Optional[List[str]] = None,
+    temperature: Optional[float] = None,
+    response_model: Any = None,
+) -> str:
+    """
+    Cache key of one completion: model, sampling settings, tool schemas and the
+    messages with whitespace collapsed (so re-indented prompts still match).
+    """
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    normalized = [
+        {
+            "role": message.get("role"),
+            "content": _normalize_content(message.get("content")),
+            **{k: message[k] for k in ("name", "tool_calls", "tool_call_id") if message.get(k)},
+        }
+        for message in messages
+    ]
+    payload = {
+        "model": model,
+        "temperature": temperature,
+        "stop": sorted(stop or []),
+        "tools": tools or [],
+        "response_model": getattr(response_model, "__name__", None),
+        "messages": normalized,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+def _as_messages(messages: Any) -> List[Dict[str, Any]]:
+    """Messages as role / content dicts (CrewAI may also pass a bare prompt string)."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return list(messages)
+
+
+def _emit_chunk(source: BaseLLM, chunk: str, call_id: str, from_task: Any, from_agent: Any) -> None:
+    """Publish one stream chunk on the CrewAI event bus, where job event streams listen."""
+    crewai_event_bus.emit(
+        source,
+        event=LLMStreamChunkEvent(chunk=chunk, call_id=call_id, from_task=from_task, from_agent=from_agent),
+    )
+
+
+class CachedLLM(BaseLLM):
+    """
+    Wraps any CrewAI LLM with a completion cache. Text completions are stored
+    under completion_key(); tool-call responses and structured outputs pass
+    through uncached. On a hit the cached text is replayed as one stream chunk
+    so job event streams still see it.
+    """
+
+    llm_type: str = "cached"
+    inner: Any = None
+    cache: Any = Field(default=None, exclude=True)
+
+    def __init__(self, inner: BaseLLM, cache: Any) -> None:
+        # Public BaseLLM arguments only; the rest is set as attributes, which
+        # works whether BaseLLM is a plain class or a pydantic model
+        super().__init__(model=inner.model, temperature=inner.temperature, stop=list(inner.stop or []))
+        self.inner = inner
+        self.cache = cache
+        self.stream = getattr(inner, "stream", False)
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Any = None,
+        from_agent: Any = None,
+        response_model: Any = None,
+    ) -> Any:
+        # The agent sets its stop words on this LLM: as `stop`, or scoped to the
+        # call and read back through `stop_sequences` on newer CrewAI releases
+        stop = list(getattr(self, "stop_sequences", self.stop) or [])
+        key = completion_key(
+            self.inner.model, messages, tools, stop, self.inner.temperature, response_model
+        )
+        cached = self.cache.get(key)
+        if isinstance(cached, str):
+            if self.stream:
+                _emit_chunk(self, cached, uuid.uuid4().hex, from_task, from_agent)
+            return cached
+
+        # Each crew has its own wrapped LLM, so setting its stop words is not shared
+        self.inner.stop = stop
+        result = self.inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        if isinstance(result, str) and result.strip():
+            self.cache.set(key, result)
+        return result
+
+    def supports_function_calling(self) -> bool:
+        return getattr(self.inner, "supports_function_calling", lambda: False)()
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self.inner.get_token_usage_summary()
+
+
+class StandInLLM(BaseLLM):
+    """
+    Deterministic offline model for load tests and benchmarks, selected with
+    LLM_MODEL=standin or LLM_MODEL=standin/<script.yaml>. A script is
+
+        latency_ms: 200            # per completion (spread over chunks when streaming)
+        rules:
+          - match: "gross margin"  # regex searched in the first user message (the task)
+            responses: ["Thought: ...\\nAction: ...\\nAction Input: {...}", "Thought: ...\\nFinal Answer: ..."]
+        default: ["Thought: ...\\nFinal Answer: ..."]
+
+    Response N answers the Nth agent turn (the last one repeats); "{turn}" is
+    replaced by the turn number. Answers use CrewAI's ReAct text format.
+    """
+
+    llm_type: str = "standin"
+    script: Dict[str, Any] = Field(default_factory=lambda: dict(DEFAULT_STANDIN_SCRIPT))
+    latency: float = 0.0
+    calls: int = 0
+
+    def __init__(
+        self,
+        model: str,
+        script: Optional[Dict[str, Any]] = None,
+        latency: float = 0.0,
+        stream: bool = False,
+    ) -> None:
+        super().__init__(model=model)
+        self.script = script if script is not None else dict(DEFAULT_STANDIN_SCRIPT)
+        self.latency = latency
+        self.stream = stream
+        self.calls = 0
+
+    @classmethod
+    def from_model(cls, model: str, stream: bool = False) -> "StandInLLM":
+        _, _, script_path = model.partition("/")
+        script = DEFAULT_STANDIN_SCRIPT
+        if script_path:
+            script = yaml.safe_load(Path(script_path).read_text(encoding="utf-8")) or {}
+        latency_ms = script.get("latency_ms", settings.STANDIN_LLM_LATENCY_MS)
+        return cls(model=model, script=script, latency=latency_ms / 1000, stream=stream)
+
+    def _respond(self, messages: List[Dict[str, Any]]) -> str:
+        task = next((str(m.get("content", "")) for m in messages if m.get("role") == "user"), "")
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+        responses = self.script.get("default") or DEFAULT_STANDIN_SCRIPT["default"]
+        for rule in self.script.get("rules", []):
+            if re.search(rule["match"], task, re.IGNORECASE):
+                responses = rule["responses"]
+                break
+        return responses[min(turn, len(responses) - 1)].replace("{turn}", str(turn))
+
+    def call(
+        self,
+        messages: Any,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        callbacks: Optional[List[Any]] = None,
+        available_functions: Optional[Dict[str, Any]] = None,
+        from_task: Any = None,
+        from_agent: Any = None,
+        response_model: Any = None,
+    ) -> str:
+        self.calls += 1
+        text = self._respond(_as_messages(messages))
+        if not self.stream:
+            time.sleep(self.latency)
+            return text
+        chunks = [text[i:i + STANDIN_CHUNK_CHARS] for i in range(0, len(text), STANDIN_CHUNK_CHARS)]
+        call_id = uuid.uuid4().hex
+        for chunk in chunks:
+            time.sleep(self.latency / len(chunks))
+            _emit_chunk(self, chunk, call_id, from_task, from_agent)
+        return text
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+def is_standin(model: str) -> bool:
+    return model == STANDIN_PREFIX or model.startswith(STANDIN_PREFIX + "/")
+
+
+_llm_cache: Optional[TTLCache] = None
+_llm_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> Optional[TTLCache]:
+    """Return the shared completion cache, or None when LLM_CACHE_ENABLED is off."""
+    global _llm_cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    with _llm_cache_lock:
+        if _llm_cache is None:
+            _llm_cache = TTLCache(
+                ttl=settings.LLM_CACHE_TTL,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                disk_path=settings.LLM_CACHE_PATH if settings.LLM_CACHE_DISK else None,
+            )
+        return _llm_cache
+
+
+def set_llm_cache(cache: Optional[TTLCache]) -> None:
+    """Swap the shared completion cache, e.g. for a temporary one in benchmarks."""
+    global _llm_cache
+    with _llm_cache_lock:
+        _llm_cache = cache
+
+
+def build_llm() -> BaseLLM:
+    """The crew LLM for LLM_MODEL (provider model or stand-in), behind the completion cache."""
+    model = settings.LLM_MODEL
+    if is_standin(model):
+        llm: BaseLLM = StandInLLM.from_model(model, stream=settings.LLM_STREAM)
+    else:
+        llm = LLM(model=model, stream=settings.LLM_STREAM)
+    cache = get_llm_cache()
+    return CachedLLM(llm, cache) if cache is not None else llm
@@ -0,0 +1,157 @@
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Longest thought / tool input / tool result carried in one step event
+MAX_STEP_FIELD_CHARS = 2000
+
+
+class RunCancelled(BaseException):
+    """
+    Raised inside a kickoff (from the step callback) when its job was cancelled.
+    A BaseException so CrewAI's retry-on-error loop doesn't restart the task.
+    """
+
+
+@dataclass
+class RunContext:
+    """
+    Where the crew running on this thread reports progress, and how it learns it was cancelled.
+    Streamed LLM tokens are buffered and sent as one "token" event per
+    STREAM_FLUSH_MS / STREAM_FLUSH_CHARS, always ahead of the next other event.
+    """
+
+    job_id: str
+    emit: Callable[[str, Dict[str, Any]], None]
+    is_cancelled: Callable[[], bool]
+    _tokens: List[str] = field(default_factory=list, init=False, repr=False)
+    _token_chars: int = field(default=0, init=False, repr=False)
+    _buffer_started: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def _flush_tokens(self) -> None:
+        """Send buffered tokens. Caller holds the lock."""
+        if self._tokens:
+            text = "".join(self._tokens)
+            self._tokens.clear()
+            self._token_chars = 0
+            self.emit("token", {"text": text})
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._flush_tokens()
+            self.emit(event_type, data)
+
+    def add_token(self, text: str) -> None:
+        with self._lock:
+            now = time.monotonic()
+            if not self._tokens:
+                self._buffer_started = now
+            self._tokens.append(text)
+            self._token_chars += len(text)
+            if (
+                self._token_chars >= settings.STREAM_FLUSH_CHARS
+                or now - self._buffer_started >= settings.STREAM_FLUSH_MS / 1000
+            ):
+                self._flush_tokens()
+
+
+current_run: ContextVar[Optional[RunContext]] = ContextVar("current_run", default=None)
+
+
+def emit(event_type: str, data: Dict[str, Any]) -> None:
+    """Report an event for the current run; a no-op outside a job (e.g. /api/v1/run)."""
+    ctx = current_run.get()
+    if ctx is None:
+        return
+    try:
+        ctx.publish(event_type, data)
+    except Exception as e:
+        logger.warning("Dropping %s event for job %s: %s", event_type, ctx.job_id, e)
+
+
+def emit_token(text: str) -> None:
+    """Stream a chunk of LLM output for the current run (coalesced, see RunContext)."""
+    ctx = current_run.get()
+    if ctx is None or not text:
+        return
+    try:
+        ctx.add_token(text)
+    except Exception as e:
+        logger.warning("Dropping tokens for job %s: %s", ctx.job_id, e)
+
+
+def _clip(value: Any) -> str:
+    text = value if isinstance(value, str) else str(value)
+    if len(text) > MAX_STEP_FIELD_CHARS:
+        return text[:MAX_STEP_FIELD_CHARS] + "…"
+    return text
+
+
+def describe_step(step: Any) -> Dict[str, Any]:
+    """Summarize a CrewAI AgentAction / AgentFinish for the event stream."""
+    if hasattr(step, "tool"):
+        return {
+            "kind": "tool",
+            "thought": _clip(getattr(step, "thought", "")),
+            "tool": step.tool,
+            "tool_input": _clip(getattr(step, "tool_input", "")),
+            "result": _clip(getattr(step, "result", None) or ""),
+        }
+    return {
+        "kind": "final",
+        "thought": _clip(getattr(step, "thought", "")),
+        "output": _clip(getattr(step, "output", "")),
+    }
+
+
+def on_step(step: Any) -> None:
+    """
+    Crew step_callback: records each agent step of the current job and stops
+    the kickoff at the next step boundary once the job has been cancelled.
+    """
+    ctx = current_run.get()
+    if ctx is None:
+        return
+    if ctx.is_cancelled():
+        raise RunCancelled(f"Job {ctx.job_id} was cancelled.")
+    emit("step", describe_step(step))
+
+
+_stream_handlers_registered = False
+_stream_handlers_lock = threading.Lock()
+
+
+def register_stream_handlers() -> None:
+    """
+    Forward CrewAI event-bus events to the run that caused them: LLM stream
+    chunks become "token" events, tool starts become "tool" events (the
+    matching "step" event follows once the tool returns). Idempotent.
+    """
+    global _stream_handlers_registered
+    with _stream_handlers_lock:
+        if _stream_handlers_registered:
+            return
+        from crewai.events import crewai_event_bus
+        from crewai.events.types.llm_events import LLMStreamChunkEvent
+        from crewai.events.types.tool_usage_events import ToolUsageStartedEvent
+
+        # Chunk handlers run synchronously on the kickoff thread, other
+        # handlers on the bus's pool with a copy of its context; both see current_run
+        @crewai_event_bus.on(LLMStreamChunkEvent)
+        def _on_stream_chunk(source: Any, event: LLMStreamChunkEvent) -> None:
+            if event.tool_call is None:  # native tool-call argument deltas aren't prose
+                emit_token(event.chunk)
+
+        @crewai_event_bus.on(ToolUsageStartedEvent)
+        def _on_tool_started(source: Any, event: ToolUsageStartedEvent) -> None:
+            emit("tool", {"tool": event.tool_name, "tool_input": _clip(event.tool_args)})
+
+        _stream_handlers_registered = True
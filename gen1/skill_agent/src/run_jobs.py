@@ -0,0 +1,529 @@
+import json
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from src.config.settings import settings
+from src.history_store import close_history_store, save_turn
+from src.run_events import RunCancelled, RunContext, current_run
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Progress events kept per job; beyond it streamed "token" events are dropped
+# (status, tool and step events are always kept; max_iter bounds the latter)
+MAX_EVENTS_PER_JOB = 1000
+BOUNDED_EVENT_TYPES = ("token",)
+
+_HOST = socket.gethostname()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS run_jobs (
+    id               TEXT PRIMARY KEY,
+    thread_id        TEXT NOT NULL,
+    task_description TEXT NOT NULL,
+    inputs           TEXT NOT NULL,
+    status           TEXT NOT NULL,
+    created_at       REAL NOT NULL,
+    started_at       REAL,
+    finished_at      REAL,
+    result           TEXT,
+    error            TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    owner            TEXT,
+    heartbeat_at     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_run_jobs_status ON run_jobs (status, created_at);
+
+CREATE TABLE IF NOT EXISTS run_job_events (
+    job_id TEXT NOT NULL,
+    seq    INTEGER NOT NULL,
+    ts     REAL NOT NULL,
+    type   TEXT NOT NULL,
+    data   TEXT NOT NULL,
+    PRIMARY KEY (job_id, seq)
+);
+"""
+
+
+class QueueFull(Exception):
+    """Too many jobs are already waiting for a run worker."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"Too many queued jobs; retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+@dataclass
+class RunJob:
+    """One asynchronous agent run."""
+
+    id: str
+    thread_id: str
+    task_description: str
+    inputs: Dict[str, Any]
+    status: str
+    created_at: float
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[str] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    owner: Optional[str] = field(default=None, repr=False)
+    heartbeat_at: Optional[float] = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self, include_result: bool = True) -> Dict[str, Any]:
+        data = asdict(self)
+        data.pop("inputs")
+        data.pop("owner")
+        data.pop("heartbeat_at")
+        if not include_result:
+            data.pop("result")
+        return data
+
+
+class RunJobQueue:
+    """
+    Persistent queue of agent runs backed by SQLite.
+
+    Jobs, their status and their progress events live in the database, so a
+    job outlives the HTTP request that created it and clients can reconnect
+    to its event stream at any time. Worker threads claim queued jobs with an
+    atomic UPDATE, which lets several processes share one database: an API
+    process can run with RUN_JOB_WORKERS=0 while `python -m src.run_jobs`
+    processes do the work. Cancellation is cooperative: the flag is checked by
+    the crew's step callback between agent steps.
+
+    Each process heartbeats the jobs it is running every `lease / 3` seconds.
+    A running job whose heartbeat is older than `lease` (its worker died, on
+    any host) is failed by whichever process notices first. Finished jobs are
+    passed to `on_finish`, which by default saves the turn to chat history.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        workers: int,
+        max_queued: int,
+        history_limit: int,
+        runner: Callable[[RunJob], str],
+        poll_interval: float = 1.0,
+        lease: float = 120.0,
+        on_finish: Optional[Callable[[RunJob], None]] = None,
+    ) -> None:
+        self._workers = max(0, workers)
+        self._max_queued = max(1, max_queued)
+        self._history_limit = history_limit
+        self._runner = runner
+        self._poll_interval = poll_interval
+        self._lease = max(1.0, lease)
+        self.owner = f"{_HOST}:{os.getpid()}"
+        self.on_finish: Optional[Callable[[RunJob], None]] = on_finish or save_job_history
+
+        self._db_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._threads: List[threading.Thread] = []
+        self._state_lock = threading.Lock()
+        self._run_seconds = 0.0
+        self._finished = 0
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.executescript(_SCHEMA)
+            columns = {row["name"] for row in self._conn.execute("PRAGMA table_info(run_jobs)")}
+            if "heartbeat_at" not in columns:  # store created before leases existed
+                self._conn.execute("ALTER TABLE run_jobs ADD COLUMN heartbeat_at REAL")
+        self._recover()
+        self._ensure_workers()
+        self._heartbeat = threading.Thread(target=self._heartbeat_loop, name="run-job-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    # -- persistence helpers --------------------------------------------------
+
+    def _row_to_job(self, row: sqlite3.Row) -> RunJob:
+        data = dict(row)
+        data["inputs"] = json.loads(data["inputs"])
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return RunJob(**data)
+
+    def _recover(self) -> None:
+        """
+        Fail running jobs whose worker is gone: a process on this host that no
+        longer exists, or any worker whose lease (last heartbeat) has expired.
+        """
+        cutoff = time.time() - self._lease
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT id, owner, COALESCE(heartbeat_at, started_at) AS seen FROM run_jobs WHERE status = ?",
+                (RUNNING,),
+            ).fetchall()
+        for row in rows:
+            host, _, pid = (row["owner"] or "").rpartition(":")
+            if host == _HOST and pid.isdigit() and not _pid_alive(int(pid)):
+                self._finish(row["id"], FAILED, error="Interrupted by server restart.")
+            elif row["owner"] != self.owner and (row["seen"] or 0) < cutoff:
+                self._finish(
+                    row["id"], FAILED, error="Run worker stopped responding (lease expired).", stale_before=cutoff
+                )
+
+    def _heartbeat_loop(self) -> None:
+        """Renew the lease on this process's running jobs and fail expired ones."""
+        while True:
+            time.sleep(self._lease / 3)
+            try:
+                with self._db_lock:
+                    self._conn.execute(
+                        "UPDATE run_jobs SET heartbeat_at = ? WHERE owner = ? AND status = ?",
+                        (time.time(), self.owner, RUNNING),
+                    )
+                self._recover()
+            except sqlite3.Error as e:
+                logger.warning("Run job heartbeat failed: %s", e)
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs (and their events) beyond the history limit."""
+        placeholders = ", ".join("?" for _ in FINISHED_STATES)
+        with self._db_lock:
+            stale = [
+                row["id"] for row in self._conn.execute(
+                    f"SELECT id FROM run_jobs WHERE status IN ({placeholders}) "
+                    "ORDER BY finished_at DESC LIMIT -1 OFFSET ?",
+                    (*FINISHED_STATES, self._history_limit),
+                )
+            ]
+            if stale:
+                marks = ", ".join("?" for _ in stale)
+                self._conn.execute("BEGIN")
+                try:
+                    self._conn.execute(f"DELETE FROM run_job_events WHERE job_id IN ({marks})", stale)
+                    self._conn.execute(f"DELETE FROM run_jobs WHERE id IN ({marks})", stale)
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+
+    # -- events ---------------------------------------------------------------
+
+    def add_event(self, job_id: str, event_type: str, data: Dict[str, Any]) -> None:
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (count,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM run_job_events WHERE job_id = ?", (job_id,)
+                ).fetchone()
+                if count < MAX_EVENTS_PER_JOB or event_type not in BOUNDED_EVENT_TYPES:
+                    self._conn.execute(
+                        "INSERT INTO run_job_events (job_id, seq, ts, type, data) VALUES (?, ?, ?, ?, ?)",
+                        (job_id, count + 1, time.time(), event_type, json.dumps(data, default=str)),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def events(self, job_id: str, after: int = 0, limit: int = 200) -> List[Dict[str, Any]]:
+        """Events of a job with seq > `after`, oldest first."""
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT seq, ts, type, data FROM run_job_events "
+                "WHERE job_id = ? AND seq > ? ORDER BY seq LIMIT ?",
+                (job_id, after, limit),
+            ).fetchall()
+        return [
+            {"seq": row["seq"], "ts": row["ts"], "type": row["type"], "data": json.loads(row["data"])}
+            for row in rows
+        ]
+
+    # -- public interface -----------------------------------------------------
+
+    def submit(self, task_description: str, thread_id: str, inputs: Dict[str, Any]) -> RunJob:
+        job = RunJob(
+            id=uuid.uuid4().hex[:12],
+            thread_id=thread_id,
+            task_description=task_description,
+            inputs=inputs,
+            status=QUEUED,
+            created_at=time.time(),
+        )
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                (queued,) = self._conn.execute(
+                    "SELECT COUNT(*) FROM run_jobs WHERE status = ?", (QUEUED,)
+                ).fetchone()
+                if queued >= self._max_queued:
+                    raise QueueFull(self._retry_after(queued))
+                self._conn.execute(
+                    "INSERT INTO run_jobs (id, thread_id, task_description, inputs, status, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (job.id, thread_id, task_description, json.dumps(inputs, default=str), QUEUED, job.created_at),
+                )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        self.add_event(job.id, "status", {"status": QUEUED})
+        self._wake.set()
+        logger.info("Queued run job %s (thread %s)", job.id, thread_id)
+        return job
+
+    def get(self, job_id: str) -> Optional[RunJob]:
+        with self._db_lock:
+            row = self._conn.execute("SELECT * FROM run_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def list_jobs(self, limit: int = 50) -> List[RunJob]:
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT * FROM run_jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def cancel(self, job_id: str) -> Optional[RunJob]:
+        """Cancel a queued job now, or ask a running one to stop at its next step."""
+        with self._db_lock:
+            cursor = self._conn.execute(
+                "UPDATE run_jobs SET status = ?, finished_at = ?, cancel_requested = 1 "
+                "WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), job_id, QUEUED),
+            )
+            if cursor.rowcount:
+                cancelled_while_queued = True
+            else:
+                cancelled_while_queued = False
+                self._conn.execute(
+                    "UPDATE run_jobs SET cancel_requested = 1 WHERE id = ? AND status = ?",
+                    (job_id, RUNNING),
+                )
+        if cancelled_while_queued:
+            self.add_event(job_id, "status", {"status": CANCELLED})
+        logger.info("Cancellation requested for run job %s.", job_id)
+        return self.get(job_id)
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM run_jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    def _retry_after(self, queued: int) -> int:
+        with self._state_lock:
+            avg = self._run_seconds / self._finished if self._finished else None
+        if avg is None:
+            return settings.RUN_RETRY_AFTER
+        return max(1, min(300, round(avg * (queued + 1) / max(1, self._workers))))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._db_lock:
+            counts = dict(self._conn.execute(
+                "SELECT status, COUNT(*) FROM run_jobs GROUP BY status"
+            ).fetchall())
+        return {
+            "workers": self._workers,
+            "queue_limit": self._max_queued,
+            "queued": counts.get(QUEUED, 0),
+            "running": counts.get(RUNNING, 0),
+            "completed": counts.get(COMPLETED, 0),
+            "failed": counts.get(FAILED, 0),
+            "cancelled": counts.get(CANCELLED, 0),
+        }
+
+    # -- workers --------------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        with self._state_lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            while len(self._threads) < self._workers:
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"run-job-worker-{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _claim(self) -> Optional[RunJob]:
+        """Atomically move the oldest queued job to running (safe across processes)."""
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute(
+                    "SELECT id FROM run_jobs WHERE status = ? ORDER BY created_at LIMIT 1", (QUEUED,)
+                ).fetchone()
+                if row:
+                    now = time.time()
+                    self._conn.execute(
+                        "UPDATE run_jobs SET status = ?, started_at = ?, heartbeat_at = ?, owner = ? WHERE id = ?",
+                        (RUNNING, now, now, self.owner, row["id"]),
+                    )
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        return self.get(row["id"]) if row else None
+
+    def _worker_loop(self) -> None:
+        while True:
+            try:
+                job = self._claim()
+            except sqlite3.Error as e:
+                logger.warning("Could not claim a run job: %s", e)
+                job = None
+            if job is None:
+                self._wake.wait(self._poll_interval)
+                self._wake.clear()
+                continue
+            self._execute(job)
+
+    def _execute(self, job: RunJob) -> None:
+        self.add_event(job.id, "status", {"status": RUNNING})
+        logger.info("Running job %s: %s", job.id, job.task_description[:80])
+        token = current_run.set(RunContext(
+            job_id=job.id,
+            emit=lambda event_type, data: self.add_event(job.id, event_type, data),
+            is_cancelled=lambda: self._cancel_requested(job.id),
+        ))
+        start = time.perf_counter()
+        try:
+            result = self._runner(job)
+        except RunCancelled:
+            self._finish(job.id, CANCELLED)
+        except Exception as e:
+            logger.error("Run job %s failed: %s", job.id, e, exc_info=True)
+            self._finish(job.id, FAILED, error=str(e))
+        else:
+            self._finish(job.id, COMPLETED, result=result)
+        finally:
+            current_run.reset(token)
+            with self._state_lock:
+                self._run_seconds += time.perf_counter() - start
+                self._finished += 1
+        self._prune()
+
+    def _finish(
+        self,
+        job_id: str,
+        status: str,
+        result: Optional[str] = None,
+        error: Optional[str] = None,
+        stale_before: Optional[float] = None,
+    ) -> None:
+        """
+        Move a running job to `status`. A no-op if it is no longer running
+        (e.g. its lease expired and another process failed it) or, with
+        `stale_before`, if it was heartbeated since.
+        """
+        query = (
+            "UPDATE run_jobs SET status = ?, finished_at = ?, result = ?, error = ? "
+            "WHERE id = ? AND status = ?"
+        )
+        params: List[Any] = [status, time.time(), result, error, job_id, RUNNING]
+        if stale_before is not None:
+            query += " AND COALESCE(heartbeat_at, started_at) < ?"
+            params.append(stale_before)
+        with self._db_lock:
+            updated = self._conn.execute(query, params).rowcount
+        if not updated:
+            logger.warning("Run job %s was no longer running; %s result dropped", job_id, status)
+            return
+        data: Dict[str, Any] = {"status": status}
+        if result is not None:
+            data["result"] = result
+        if error is not None:
+            data["error"] = error
+        self.add_event(job_id, "status", data)
+        logger.info("Run job %s finished: %s", job_id, status)
+        job = self.get(job_id)
+        if job and self.on_finish:
+            try:
+                self.on_finish(job)
+            except Exception as e:
+                logger.warning("on_finish hook failed for job %s: %s", job_id, e)
+
+
+def save_job_history(job: RunJob) -> None:
+    """Default on_finish: record a completed job's turn in its thread's chat history."""
+    if job.result is not None:
+        save_turn(job.thread_id, job.task_description, job.result)
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _run_crew(job: RunJob) -> str:
+    # Deferred: keeps this module importable without crewai
+    from src.command_router import run_command
+    from src.crew_pool import get_crew_pool
+
+    result = run_command(job.task_description)
+    if result is not None:
+        return result
+
+    with get_crew_pool().lease() as crew:
+        return crew.run(
+            task_description=job.task_description,
+            thread_id=job.thread_id,
+            **job.inputs,
+        )
+
+
+_queue: Optional[RunJobQueue] = None
+_queue_lock = threading.Lock()
+
+
+def get_run_jobs(workers: Optional[int] = None) -> RunJobQueue:
+    """Return this process's job queue, creating it (and its workers) on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = RunJobQueue(
+                db_path=settings.RUN_JOBS_DB_PATH,
+                workers=settings.RUN_JOB_WORKERS if workers is None else workers,
+                max_queued=settings.RUN_JOBS_MAX_QUEUED,
+                history_limit=settings.RUN_JOBS_HISTORY_LIMIT,
+                runner=_run_crew,
+                lease=settings.RUN_JOBS_LEASE_SECONDS,
+            )
+        return _queue
+
+
+if __name__ == "__main__":
+    # Standalone run worker sharing RUN_JOBS_DB_PATH with the API processes
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    get_run_jobs(workers=max(1, settings.RUN_JOB_WORKERS))
+    logger.info("Run worker %s:%d waiting for jobs", _HOST, os.getpid())
+    try:
+        threading.Event().wait()
+    finally:
+        close_history_store()
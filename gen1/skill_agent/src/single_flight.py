@@ -0,0 +1,81 @@
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def run_key(task_description: str, extra_inputs: Dict[str, Any], thread_state: Any = None) -> str:
+    """Hash of a run's inputs: whitespace-normalized task, extra inputs and thread state."""
+    payload = {
+        "task": " ".join(task_description.split()),
+        "extra_inputs": extra_inputs,
+        "thread": thread_state,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class SingleFlight:
+    """
+    Coalesces identical concurrent runs. The first caller for a key starts the
+    run; callers arriving with the same key while it is in flight await that
+    same task and get its result (or its exception). A waiter that goes away
+    does not cancel the run for the others. Must be used from one event loop.
+    """
+
+    def __init__(self) -> None:
+        self._in_flight: Dict[str, "asyncio.Task[Any]"] = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finish(key, done))
+            with self._lock:
+                self.leaders += 1
+        else:
+            with self._lock:
+                self.coalesced += 1
+            logger.info("Coalesced run %s with the one in flight", key[:12])
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: "asyncio.Task[Any]") -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled():
+            task.exception()  # retrieved here so a run nobody awaits any more isn't reported
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "in_flight": len(self._in_flight),
+                "leaders": self.leaders,
+                "coalesced": self.coalesced,
+            }
+
+
+_single_flight: Optional[SingleFlight] = None
+_single_flight_lock = threading.Lock()
+
+
+def get_single_flight() -> Optional[SingleFlight]:
+    """Return this worker's run coalescer, or None when RUN_COALESCE_ENABLED is off."""
+    global _single_flight
+    if not settings.RUN_COALESCE_ENABLED:
+        return None
+    with _single_flight_lock:
+        if _single_flight is None:
+            _single_flight = SingleFlight()
+        return _single_flight
@@ -0,0 +1,62 @@
+"""
+Long-lived Python kernel process used by PythonKernel.
+
+Protocol (one JSON object per line):
+  request  → {"code": "<source>", "cwd": "<dir>"}
+  response ← {"stdout": "...", "stderr": "...", "exit_code": 0}
+
+The original stdin/stdout are reserved for the protocol; the executed code
+sees an empty stdin and captured stdout/stderr. Globals persist between
+requests, so imports and variables survive across calls.
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import traceback
+
+
+def main() -> None:
+    proto_in = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+
+    # Stray fd-level reads/writes (input(), child processes) must not touch the protocol
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    sys.stdin = open(os.devnull, "r", encoding="utf-8")
+
+    namespace: dict = {"__name__": "__main__", "__builtins__": __builtins__}
+
+    for line in proto_in:
+        request = json.loads(line)
+        stdout, stderr = io.StringIO(), io.StringIO()
+        exit_code = 0
+
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            try:
+                os.chdir(request.get("cwd") or os.getcwd())
+                exec(compile(request["code"], "<session>", "exec"), namespace)
+            except SystemExit as exc:
+                if isinstance(exc.code, int):
+                    exit_code = exc.code
+                elif exc.code is not None:
+                    print(exc.code, file=sys.stderr)
+                    exit_code = 1
+            except BaseException as exc:
+                # Drop this module's frame so tracebacks start at the user's code
+                traceback.print_exception(type(exc), exc, exc.__traceback__.tb_next)
+                exit_code = 1
+
+        proto_out.write(json.dumps({
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "exit_code": exit_code,
+        }) + "\n")
+        proto_out.flush()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Preloaded zygote process used by the Zygote client.
+
+Started once with a list of modules to pre-import, then forks one child per
+execution request so each run skips interpreter startup and module imports.
+
+Protocol (one JSON object per line):
+  request  → {"id", "path", "args", "cwd", "stdout", "stderr", "timeout", "memory_limit_mb"}
+  started  ← {"id", "pid"}          (the child's pid, which is also its pgid)
+  response ← {"id", "exit_code", "timed_out"}
+
+Children write their output to the stdout/stderr file paths given in the
+request. The zygote stays single-threaded so forking is safe.
+"""
+
+import importlib
+import json
+import os
+import runpy
+import select
+import signal
+import sys
+import time
+import traceback
+
+try:
+    import resource
+except ImportError:  # pragma: no cover — the client never starts us off-POSIX
+    resource = None
+
+
+def _preload(modules: list[str]) -> None:
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # optional modules (e.g. numpy) may not be installed
+
+
+def _child(request: dict, proto_fds: tuple[int, int]) -> None:
+    """Runs in the forked child. Never returns."""
+    exit_code = 1
+    try:
+        os.setpgrp()
+        for fd in proto_fds:
+            os.close(fd)
+
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        out = os.open(request["stdout"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        err = os.open(request["stderr"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(devnull, 0)
+        os.dup2(out, 1)
+        os.dup2(err, 2)
+
+        if resource is not None:
+            cpu = int(request["timeout"]) + 1
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu))
+            if request.get("memory_limit_mb", 0) > 0:
+                limit = request["memory_limit_mb"] * 1024 * 1024
+                resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+        os.chdir(request["cwd"])
+        path = request["path"]
+        sys.argv = [path, *request.get("args", [])]
+        sys.path[0] = os.path.dirname(path)
+
+        try:
+            runpy.run_path(path, run_name="__main__")
+            exit_code = 0
+        except SystemExit as exc:
+            if isinstance(exc.code, int):
+                exit_code = exc.code
+            elif exc.code is None:
+                exit_code = 0
+            else:
+                print(exc.code, file=sys.stderr)
+                exit_code = 1
+        except BaseException as exc:
+            # Start the traceback at the script's own frames, like a fresh interpreter would
+            tb = exc.__traceback__
+            while tb is not None and tb.tb_frame.f_code.co_filename != path:
+                tb = tb.tb_next
+            traceback.print_exception(type(exc), exc, tb or exc.__traceback__)
+            exit_code = 1
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        finally:
+            os._exit(exit_code)
+
+
+def main() -> None:
+    _preload([m for m in sys.argv[1].split(",") if m] if len(sys.argv) > 1 else [])
+
+    proto_in_fd = os.dup(0)
+    proto_out = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDWR)
+    os.dup2(devnull, 0)
+    os.dup2(devnull, 1)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+
+    running: dict[int, dict] = {}  # pid → {"id", "deadline", "timed_out"}
+    buffer = b""
+
+    def respond(payload: dict) -> None:
+        proto_out.write(json.dumps(payload) + "\n")
+        proto_out.flush()
+
+    while True:
+        # Block on requests when idle; otherwise poll so we can reap and enforce deadlines
+        wait = 0.02 if running else None
+        ready, _, _ = select.select([proto_in_fd], [], [], wait)
+        if ready:
+            chunk = os.read(proto_in_fd, 65536)
+            if not chunk:
+                break
+            buffer += chunk
+            while b"\n" in buffer:
+                line, buffer = buffer.split(b"\n", 1)
+                request = json.loads(line)
+                pid = os.fork()
+                if pid == 0:
+                    _child(request, (proto_in_fd, proto_out.fileno()))
+                try:
+                    os.setpgid(pid, pid)  # also done in the child; whichever runs first wins
+                except OSError:
+                    pass
+                # Lets the client kill the group itself if we die before reaping it
+                respond({"id": request["id"], "pid": pid})
+                running[pid] = {
+                    "id": request["id"],
+                    "deadline": time.monotonic() + request["timeout"],
+                    "timed_out": False,
+                }
+
+        now = time.monotonic()
+        for pid, job in running.items():
+            if not job["timed_out"] and now > job["deadline"]:
+                job["timed_out"] = True
+                try:
+                    os.killpg(pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+
+        while running:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            job = running.pop(pid, None)
+            if job:
+                respond({
+                    "id": job["id"],
+                    "exit_code": os.waitstatus_to_exitcode(status),
+                    "timed_out": job["timed_out"],
+                })
+
+    for pid in running:
+        try:
+            os.killpg(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -3,20 +3,38 @@ import subprocess
 import sys
 import tempfile
 import textwrap
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Literal, Type, ClassVar
 
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from src.config.settings import settings
+from src.tools.package_env import PackageEnvError, get_package_env_manager
+from src.tools.python_kernel import current_session, get_kernel_manager
+from src.tools.zygote import ExecResult, get_zygote
+
 logger = logging.getLogger(__name__)
 
 
+class BatchItem(BaseModel):
+    code: str | None = Field(default=None, description="Python code string to execute.")
+    script_path: str | None = Field(default=None, description="Absolute path to a .py file.")
+    label: str | None = Field(default=None, description="Optional name shown in the report.")
+    timeout: int | None = Field(
+        default=None, description="Per-item timeout in seconds. Defaults to the batch timeout."
+    )
+
+
 class CodeExecutorInput(BaseModel):
     action: Literal[
         "run_python",     # Execute a Python code string
         "run_script",     # Execute a .py file by absolute path
-        "install_package" # pip install a package into current env
+        "install_package", # install a package via the local wheelhouse
+        "reset_session",  # Discard the persistent Python session state
+        "run_batch",      # Run several snippets/scripts concurrently
     ] = Field(..., description="Action to perform.")
 
     code: str | None = Field(
@@ -39,27 +57,38 @@ class CodeExecutorInput(BaseModel):
         default=None,
         description="Working directory for execution. Defaults to skill_agent root."
     )
+    items: list[BatchItem] | None = Field(
+        default=None,
+        description="Snippets and/or scripts to run concurrently. Required for 'run_batch'."
+    )
 
 
 class CodeExecutorTool(BaseTool):
     """
     Sandboxed Python code execution tool.
     Can run inline code strings, execute .py scripts, and install packages.
-    All executions are isolated in a subprocess with timeout enforcement.
+    All executions are isolated in a subprocess with timeout enforcement;
+    one-shot runs are forked from a preloaded zygote when available.
+    Inside a conversation thread, run_python uses a persistent kernel so
+    imports and variables survive between calls.
 
     USE THIS TO:
     - Test code snippets before writing them to files
     - Execute scripts from skills/*/scripts/
     - Validate that generated code works
-    - Install missing dependencies at runtime
+    - Install missing dependencies at runtime (resolved from the local wheelhouse)
     """
 
     name: str = "code_executor"
     description: str = (
         "Execute Python code safely. Actions: "
-        "'run_python' → run a code string inline; "
+        "'run_python' → run a code string inline (imports and variables persist "
+        "across calls in the same conversation); "
         "'run_script' → run a .py file by path; "
-        "'install_package' → pip install a package. "
+        "'install_package' → install a package (local wheelhouse first); "
+        "'reset_session' → discard persisted run_python state; "
+        "'run_batch' → run a list of independent snippets/scripts concurrently "
+        "and get one aggregated report (use for multi-test validation). "
         "Always test generated code before writing it to a skill file."
     )
     args_schema: Type[BaseModel] = CodeExecutorInput
@@ -69,7 +98,25 @@ class CodeExecutorTool(BaseTool):
     def _safe_timeout(self, timeout: int) -> int:
         return min(max(timeout, 5), 120)
 
-    def _run_subprocess(self, cmd: list[str], cwd: Path, timeout: int) -> str:
+    def _format_result(self, stdout: str, stderr: str, returncode: int | None) -> str:
+        output = []
+        if stdout.strip():
+            output.append(f"STDOUT:\n{stdout.strip()}")
+        if stderr.strip():
+            output.append(f"STDERR:\n{stderr.strip()}")
+        output.append(f"EXIT CODE: {returncode}")
+
+        status = "✅ Success" if returncode == 0 else "❌ Failed"
+        return f"{status}\n\n" + "\n\n".join(output)
+
+    def _render(self, result: ExecResult, timeout: int) -> str:
+        if result.timed_out:
+            return f"❌ Timeout: execution exceeded {timeout}s limit."
+        if result.error:
+            return f"❌ Execution error: {result.error}"
+        return self._format_result(result.stdout, result.stderr, result.returncode)
+
+    def _exec_subprocess(self, cmd: list[str], cwd: Path, timeout: int) -> ExecResult:
         try:
             result = subprocess.run(
                 cmd,
@@ -78,29 +125,38 @@ class CodeExecutorTool(BaseTool):
                 timeout=timeout,
                 cwd=str(cwd),
             )
-            output = []
-            if result.stdout.strip():
-                output.append(f"STDOUT:\n{result.stdout.strip()}")
-            if result.stderr.strip():
-                output.append(f"STDERR:\n{result.stderr.strip()}")
-            output.append(f"EXIT CODE: {result.returncode}")
-
-            status = "✅ Success" if result.returncode == 0 else "❌ Failed"
-            return f"{status}\n\n" + "\n\n".join(output)
+            return ExecResult(result.stdout, result.stderr, result.returncode)
 
         except subprocess.TimeoutExpired:
-            return f"❌ Timeout: execution exceeded {timeout}s limit."
+            return ExecResult("", "", None, timed_out=True)
         except Exception as e:
             logger.exception("Subprocess error: %s", e)
-            return f"❌ Execution error: {e}"
+            return ExecResult("", "", None, error=str(e))
 
-    def _handle_run_python(self, code: str, timeout: int, working_dir: str | None) -> str:
-        if not code or not code.strip():
-            return "❌ No code provided."
+    def _run_subprocess(self, cmd: list[str], cwd: Path, timeout: int) -> str:
+        return self._render(self._exec_subprocess(cmd, cwd, timeout), timeout)
 
-        cwd = Path(working_dir).resolve() if working_dir else self.BASE_DIR
+    def _execute_file(self, path: Path, cwd: Path, timeout: int) -> ExecResult:
+        """
+        Run a .py file. Skill scripts that declare requirements run in their cached
+        env; everything else forks from the zygote, falling back to a fresh interpreter.
+        """
+        try:
+            python = get_package_env_manager().python_for_script(path)
+        except PackageEnvError as e:
+            return ExecResult("", "", None, error=f"Failed to prepare environment: {e}")
+        if python != sys.executable:
+            return self._exec_subprocess([python, str(path)], cwd=cwd, timeout=timeout)
+
+        zygote = get_zygote()
+        if zygote is not None:
+            result = zygote.run_script(path, [], cwd, timeout)
+            if result is not None:
+                return result
+
+        return self._exec_subprocess([sys.executable, str(path)], cwd=cwd, timeout=timeout)
 
-        # Write to temp file
+    def _write_temp_script(self, code: str) -> Path:
         with tempfile.NamedTemporaryFile(
             mode="w",
             suffix=".py",
@@ -109,17 +165,59 @@ class CodeExecutorTool(BaseTool):
             encoding="utf-8"
         ) as f:
             f.write(textwrap.dedent(code))
-            tmp_path = f.name
+            return Path(f.name)
 
+    def _handle_run_python(self, code: str, timeout: int, working_dir: str | None) -> str:
+        if not code or not code.strip():
+            return "❌ No code provided."
+
+        cwd = Path(working_dir).resolve() if working_dir else self.BASE_DIR
+
+        session_id = current_session()
+        if session_id and settings.KERNEL_ENABLED:
+            return self._run_in_kernel(session_id, code, cwd, self._safe_timeout(timeout))
+
+        tmp_path = self._write_temp_script(code)
         logger.info("Executing inline code from temp file: %s", tmp_path)
         try:
-            return self._run_subprocess(
-                [sys.executable, tmp_path],
-                cwd=cwd,
-                timeout=self._safe_timeout(timeout)
-            )
+            safe_timeout = self._safe_timeout(timeout)
+            return self._render(self._execute_file(tmp_path, cwd, safe_timeout), safe_timeout)
         finally:
-            Path(tmp_path).unlink(missing_ok=True)
+            tmp_path.unlink(missing_ok=True)
+
+    def _run_in_kernel(self, session_id: str, code: str, cwd: Path, timeout: int) -> str:
+        logger.info("Executing inline code in kernel for session %s", session_id)
+        try:
+            result = get_kernel_manager().execute(
+                session_id, textwrap.dedent(code), cwd, timeout
+            )
+        except Exception as e:
+            logger.exception("Kernel error: %s", e)
+            return f"❌ Execution error: {e}"
+
+        notice = ""
+        if result.restarted:
+            notice = "⚠️ Session kernel had stopped and was restarted — earlier state was lost.\n\n"
+        if result.timed_out:
+            return (
+                f"{notice}❌ Timeout: execution exceeded {timeout}s limit. "
+                "Session state was reset."
+            )
+        if result.crashed:
+            return (
+                f"{notice}❌ Session kernel crashed (exit code {result.exit_code}), "
+                "possibly from exceeding its memory limit. State was reset.\n\n"
+                f"{result.stderr}"
+            )
+        return notice + self._format_result(result.stdout, result.stderr, result.exit_code)
+
+    def _handle_reset_session(self) -> str:
+        session_id = current_session()
+        if not session_id:
+            return "⚠️ No active session — run_python state is not persisted outside a conversation."
+        if get_kernel_manager().reset(session_id):
+            return "✅ Session state discarded. The next run_python starts a fresh interpreter."
+        return "✅ No session state to discard."
 
     def _handle_run_script(self, script_path: str, timeout: int, working_dir: str | None) -> str:
         path = Path(script_path).resolve()
@@ -130,11 +228,79 @@ class CodeExecutorTool(BaseTool):
 
         cwd = Path(working_dir).resolve() if working_dir else path.parent
         logger.info("Executing script: %s", path)
-        return self._run_subprocess(
-            [sys.executable, str(path)],
-            cwd=cwd,
-            timeout=self._safe_timeout(timeout)
+        safe_timeout = self._safe_timeout(timeout)
+        return self._render(self._execute_file(path, cwd, safe_timeout), safe_timeout)
+
+    def _run_batch_item(
+        self, item: BatchItem, timeout: int, working_dir: str | None
+    ) -> tuple[ExecResult, float]:
+        start = time.monotonic()
+        if item.code and item.code.strip():
+            cwd = Path(working_dir).resolve() if working_dir else self.BASE_DIR
+            tmp_path = self._write_temp_script(item.code)
+            try:
+                result = self._execute_file(tmp_path, cwd, timeout)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+        elif item.script_path:
+            path = Path(item.script_path).resolve()
+            if not path.exists():
+                result = ExecResult("", "", None, error=f"Script not found: {item.script_path}")
+            elif path.suffix != ".py":
+                result = ExecResult("", "", None, error=f"Only .py scripts supported. Got: {path.suffix}")
+            else:
+                cwd = Path(working_dir).resolve() if working_dir else path.parent
+                result = self._execute_file(path, cwd, timeout)
+        else:
+            result = ExecResult("", "", None, error="Item needs 'code' or 'script_path'.")
+        return result, time.monotonic() - start
+
+    def _handle_run_batch(
+        self, items: list[BatchItem | dict], timeout: int, working_dir: str | None
+    ) -> str:
+        if not items:
+            return "❌ No batch items provided."
+        if len(items) > settings.BATCH_MAX_ITEMS:
+            return f"❌ Too many batch items ({len(items)}). Max: {settings.BATCH_MAX_ITEMS}."
+
+        batch = [BatchItem.model_validate(i) if isinstance(i, dict) else i for i in items]
+        workers = max(1, min(settings.BATCH_MAX_WORKERS, len(batch)))
+        logger.info("Running batch of %d items on %d workers", len(batch), workers)
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="code-batch") as pool:
+            futures = [
+                pool.submit(
+                    self._run_batch_item,
+                    item,
+                    self._safe_timeout(item.timeout or timeout),
+                    working_dir,
+                )
+                for item in batch
+            ]
+            outcomes = [f.result() for f in futures]
+        wall = time.monotonic() - start
+
+        passed = sum(
+            1 for result, _ in outcomes
+            if result.returncode == 0 and not result.timed_out and not result.error
         )
+        status = "✅" if passed == len(batch) else "❌"
+        lines = [
+            f"{status} Batch: {passed}/{len(batch)} passed "
+            f"(wall {wall:.2f}s, {workers} workers)\n",
+            "| # | Item | Result | Time |",
+            "|---|------|--------|------|",
+        ]
+        sections = []
+        for index, (item, (result, elapsed)) in enumerate(zip(batch, outcomes), start=1):
+            label = item.label or (Path(item.script_path).name if item.script_path else "snippet")
+            item_timeout = self._safe_timeout(item.timeout or timeout)
+            rendered = self._render(result, item_timeout)
+            lines.append(f"| {index} | {label} | {rendered.splitlines()[0]} | {elapsed:.2f}s |")
+            sections.append(f"## [{index}] {label}\n\n{rendered}")
+
+        return "\n".join(lines) + "\n\n" + "\n\n".join(sections)
 
     def _handle_install_package(self, package_name: str) -> str:
         if not package_name or not package_name.strip():
@@ -143,11 +309,13 @@ class CodeExecutorTool(BaseTool):
         # Basic safety — no shell injection
         safe_name = package_name.strip().split()[0]
         logger.info("Installing package: %s", safe_name)
-        return self._run_subprocess(
-            [sys.executable, "-m", "pip", "install", safe_name],
-            cwd=self.BASE_DIR,
-            timeout=60
-        )
+        try:
+            result = get_package_env_manager().install_package(safe_name)
+        except PackageEnvError as e:
+            return f"❌ {e}"
+        if result is None:
+            return f"✅ '{safe_name}' is already installed."
+        return self._format_result(result.stdout, result.stderr, result.returncode)
 
     def _run(self, **kwargs) -> str:
         action = kwargs.get("action")
@@ -156,6 +324,7 @@ class CodeExecutorTool(BaseTool):
         package_name = kwargs.get("package_name")
         timeout = kwargs.get("timeout", 30)
         working_dir = kwargs.get("working_dir")
+        items = kwargs.get("items")
 
         if action == "run_python":
             return self._handle_run_python(code or "", timeout, working_dir)
@@ -163,5 +332,12 @@ class CodeExecutorTool(BaseTool):
             return self._handle_run_script(script_path or "", timeout, working_dir)
         elif action == "install_package":
             return self._handle_install_package(package_name or "")
+        elif action == "reset_session":
+            return self._handle_reset_session()
+        elif action == "run_batch":
+            return self._handle_run_batch(items or [], timeout, working_dir)
         else:
-            return f"❌ Unknown action '{action}'. Valid: run_python, run_script, install_package"
+            return (
+                f"❌ Unknown action '{action}'. "
+                "Valid: run_python, run_script, install_package, reset_session, run_batch"
+            )
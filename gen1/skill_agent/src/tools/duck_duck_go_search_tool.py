@@ -1,40 +1,141 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Type
+from urllib.parse import urlparse, urlunparse
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
-from duckduckgo_search import DDGS
+
+from src.config.settings import settings
+from src.tools.rate_limit import RateLimitExceeded
+from src.tools.search_backend import (
+    SearchResult,
+    get_search_backend,
+    get_search_cache,
+    normalize_query,
+)
 
 logger = logging.getLogger(__name__)
 
 class DuckDuckGoSearchInput(BaseModel):
-    search_query: str = Field(..., description="The query to search the web for.")
-    max_results: int = Field(default=5, description="Maximum number of results to return.")
+    search_query: str | None = Field(default=None, description="The query to search the web for.")
+    search_queries: list[str] | None = Field(
+        default=None,
+        description=(
+            "Several queries to run in parallel in ONE call; results are merged, "
+            "deduplicated by URL and tagged with the queries that found them."
+        ),
+    )
+    max_results: int = Field(default=5, description="Maximum number of results to return (per query).")
+
+
+def _canonical_url(url: str) -> str:
+    """Dedup key: lowercased host without www., no fragment, no trailing slash."""
+    parts = urlparse(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    return urlunparse(("https", host, parts.path.rstrip("/"), "", parts.query, ""))
+
 
 class DuckDuckGoSearchTool(BaseTool):
     """
     Search the web using DuckDuckGo.
     Useful for finding current information or discovering skill URLs.
+    Results are cached under a normalized query (SEARCH_CACHE_TTL); the backend
+    is pluggable (SEARCH_BACKEND) so a local stand-in index can replace DDG.
     """
     name: str = "duckduckgo_search"
     description: str = (
         "A search tool that uses DuckDuckGo to find information on the internet. "
         "Useful for searching for skill definitions on skills.sh or GitHub. "
-        "Example query: 'site:skills.sh code-review'"
+        "Example query: 'site:skills.sh code-review'. "
+        "Pass search_queries=[...] to run several queries at once (merged, deduped by URL)."
     )
     args_schema: Type[BaseModel] = DuckDuckGoSearchInput
 
-    def _run(self, search_query: str, max_results: int = 5) -> str:
+    def _search(self, search_query: str, max_results: int) -> list[SearchResult]:
+        backend = get_search_backend()
+        # The normalized form is only the cache key; the backend gets the query as written
+        query = " ".join(search_query.split())
+        key = f"{backend.name}:{max_results}:{normalize_query(query)}"
+        cache = get_search_cache()
+        cached = cache.get(key)
+        if cached is not None:
+            logger.info("Search cache hit: %s", query)
+            return [SearchResult(**r) for r in cached]
+        hits = backend.search(query, max_results)
+        cache.set(key, [h.to_dict() for h in hits])
+        return hits
+
+    def _run_single(self, search_query: str, max_results: int) -> str:
         try:
             results = []
-            with DDGS() as ddgs:
-                ddgs_gen = ddgs.text(search_query, max_results=max_results)
-                for r in ddgs_gen:
-                    results.append(f"Title: {r['title']}\nURL: {r['href']}\nBody: {r['body']}\n")
+            for r in self._search(search_query, max_results):
+                results.append(f"Title: {r.title}\nURL: {r.url}\nBody: {r.body}\n")
             
             if not results:
                 return f"No results found for query: {search_query}"
             
             return "\n---\n".join(results)
+        except RateLimitExceeded as e:
+            return f"❌ Search rate limited ({e}). Try again shortly."
         except Exception as e:
             logger.error(f"Error searching DuckDuckGo: {e}")
             return f"❌ Error searching DuckDuckGo: {e}"
+
+    def _run_multi(self, queries: list[str], max_results: int) -> str:
+        # Drop queries that normalize to the same thing; keep the caller's order
+        unique: dict[str, str] = {}
+        for q in queries:
+            unique.setdefault(normalize_query(q), q)
+        queries = list(unique.values())[: settings.SEARCH_MAX_QUERIES]
+
+        def run(query: str) -> list[SearchResult] | Exception:
+            try:
+                return self._search(query, max_results)
+            except Exception as e:
+                logger.error("Error searching DuckDuckGo for %r: %s", query, e)
+                return e
+
+        with ThreadPoolExecutor(
+            max_workers=min(settings.SEARCH_PARALLEL_QUERIES, len(queries)),
+            thread_name_prefix="search",
+        ) as pool:
+            outcomes = list(pool.map(run, queries))
+
+        # Merge by best rank across queries; ties go to the earlier query
+        merged: dict[str, tuple[tuple[int, int], SearchResult, list[int]]] = {}
+        summary = [f"# Search results for {len(queries)} queries\n"]
+        for qi, (query, outcome) in enumerate(zip(queries, outcomes), start=1):
+            if isinstance(outcome, Exception):
+                summary.append(f"[{qi}] {query} — ❌ {outcome}")
+                continue
+            summary.append(f"[{qi}] {query} — {len(outcome)} result(s)")
+            for rank, hit in enumerate(outcome):
+                key = _canonical_url(hit.url)
+                if key in merged:
+                    merged[key][2].append(qi)
+                else:
+                    merged[key] = ((rank, qi), hit, [qi])
+
+        if not merged:
+            return "\n".join(summary) + "\n\nNo results found for any query."
+
+        results = []
+        for _, hit, found_by in sorted(merged.values(), key=lambda item: item[0]):
+            tags = ", ".join(f"[{qi}]" for qi in found_by)
+            results.append(f"Title: {hit.title}\nURL: {hit.url}\nFound by: {tags}\nBody: {hit.body}\n")
+        return "\n".join(summary) + "\n\n" + "\n---\n".join(results)
+
+    def _run(
+        self,
+        search_query: str | None = None,
+        max_results: int = 5,
+        search_queries: list[str] | None = None,
+    ) -> str:
+        queries = [q for q in (search_queries or []) if q and q.strip()]
+        if search_query and search_query.strip():
+            queries.insert(0, search_query)
+        if not queries:
+            return "❌ Provide search_query or search_queries."
+        if len(queries) == 1:
+            return self._run_single(queries[0], max_results)
+        return self._run_multi(queries, max_results)
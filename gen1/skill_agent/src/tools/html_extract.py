@@ -0,0 +1,198 @@
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+# Elements whose content is never shown to the agent
+_SKIP_TAGS = {"script", "style", "noscript", "template", "svg", "iframe", "head"}
+# Elements set off by a blank line / by a line break
+_PARAGRAPH_TAGS = {"p", "blockquote", "table", "ul", "ol", "dl", "figure", "section", "article"}
+_BLOCK_TAGS = {"div", "main", "header", "footer", "nav", "aside", "tr", "form", "dt", "dd"}
+_HEADINGS = {"h1": 1, "h2": 2, "h3": 3, "h4": 4, "h5": 5, "h6": 6}
+
+_SPACES = re.compile(r"[ \t\r\f\v\n]+")
+
+
+class HTMLTextExtractor(HTMLParser):
+    """
+    Single-pass HTML → markdown-ish text.
+
+    Drops script/style (and other non-visible) content, decodes entities,
+    keeps headings as `#` lines, <pre> as fenced code, inline <code> as
+    backticks and links as [text](href). A link wrapping block elements (a
+    card around a heading) keeps its blocks and becomes `text (href)`. Feed it chunks as they arrive and
+    stop once `exhausted` is true — output beyond `budget` chars is dropped.
+    """
+
+    def __init__(self, budget: Optional[int] = None) -> None:
+        super().__init__(convert_charrefs=True)
+        self.budget = budget
+        self.chars = 0
+        self._parts: List[str] = []
+        self._trailing_newlines = 0
+        self._skip_depth = 0
+        self._pre_depth = 0
+        # (href, index of the "[" part, still bracketed)
+        self._links: List[Tuple[str, int, bool]] = []
+
+    @property
+    def exhausted(self) -> bool:
+        return self.budget is not None and self.chars > self.budget
+
+    def _emit(self, text: str) -> None:
+        if self.budget is not None:
+            text = text[: self.budget + 1 - self.chars]
+        if not text:
+            return
+        self._parts.append(text)
+        self.chars += len(text)
+        stripped = text.rstrip("\n")
+        if stripped:
+            self._trailing_newlines = len(text) - len(stripped)
+        else:
+            self._trailing_newlines += len(text)
+
+    def _recount_newlines(self) -> None:
+        self._trailing_newlines = 0
+        for part in reversed(self._parts):
+            stripped = part.rstrip("\n")
+            self._trailing_newlines += len(part) - len(stripped)
+            if stripped:
+                break
+
+    def _unbracket_links(self) -> None:
+        """A block inside [...] would break the markdown — drop the "[" and finish as `text (href)`."""
+        for i, (href, start, bracketed) in enumerate(self._links):
+            if not bracketed or start >= len(self._parts):
+                continue
+            self._links[i] = (href, start, False)
+            self.chars -= 1
+            if start == len(self._parts) - 1:
+                self._parts.pop()
+                self._recount_newlines()
+            else:
+                self._parts[start] = ""
+
+    def _break(self, newlines: int) -> None:
+        """End the current line; `newlines=2` leaves one blank line. Never stacks more."""
+        if self._links:
+            self._unbracket_links()
+        if not self._parts:
+            return
+        if not self._trailing_newlines:
+            last = self._parts[-1]
+            stripped = last.rstrip(" ")
+            self.chars -= len(last) - len(stripped)
+            if stripped:
+                self._parts[-1] = stripped
+            else:
+                self._parts.pop()
+        self._emit("\n" * max(0, newlines - self._trailing_newlines))
+
+    def _emit_before_newlines(self, text: str) -> None:
+        """Append to the last line of text, keeping the line breaks after it."""
+        newlines = self._trailing_newlines
+        while self._trailing_newlines:
+            last = self._parts.pop()
+            stripped = last.rstrip("\n")
+            self.chars -= len(last) - len(stripped)
+            if stripped:
+                self._parts.append(stripped)
+            self._recount_newlines()
+        self._emit(text)
+        self._emit("\n" * newlines)
+
+    def _at_line_start(self) -> bool:
+        return not self._parts or self._trailing_newlines > 0
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        if tag == "body":
+            self._skip_depth = 0  # an unclosed <head> must not hide the page
+        elif tag in _SKIP_TAGS:
+            self._skip_depth += 1
+        elif self._skip_depth:
+            return
+        elif tag in _HEADINGS:
+            self._break(2)
+            self._emit("#" * _HEADINGS[tag] + " ")
+        elif tag == "pre":
+            self._pre_depth += 1
+            self._break(2)
+            self._emit("```\n")
+        elif tag == "code" and not self._pre_depth:
+            self._emit("`")
+        elif tag == "li":
+            self._break(1)
+            self._emit("- ")
+        elif tag in ("br", "hr"):
+            self._break(1)
+        elif tag in ("td", "th"):
+            self._emit("| " if self._at_line_start() else " | ")
+        elif tag == "a":
+            href = dict(attrs).get("href") or ""
+            if href and not href.startswith(("#", "javascript:")):
+                self._links.append((href, len(self._parts), True))
+                self._emit("[")
+        elif tag in _PARAGRAPH_TAGS:
+            self._break(2)
+        elif tag in _BLOCK_TAGS:
+            self._break(1)
+
+    def handle_startendtag(self, tag: str, attrs) -> None:
+        if tag in ("br", "hr") and not self._skip_depth:
+            self._break(1)
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in _SKIP_TAGS:
+            self._skip_depth = max(0, self._skip_depth - 1)
+        elif self._skip_depth:
+            return
+        elif tag in _HEADINGS:
+            self._break(2)
+        elif tag == "pre":
+            self._pre_depth = max(0, self._pre_depth - 1)
+            self._break(1)
+            self._emit("```")
+            self._break(2)
+        elif tag == "code" and not self._pre_depth:
+            self._emit("`")
+        elif tag == "a" and self._links:
+            href, start, bracketed = self._links.pop()
+            if not bracketed:
+                if "".join(self._parts[start:]).strip():
+                    self._emit_before_newlines(f" ({href})")
+                return
+            if start >= len(self._parts):
+                return  # "[" was dropped by the budget
+            if start == len(self._parts) - 1:
+                self._parts.pop()  # no link text — drop the dangling "["
+                self.chars -= 1
+            else:
+                self._emit(f"]({href})")
+        elif tag in _PARAGRAPH_TAGS:
+            self._break(2)
+        elif tag in _BLOCK_TAGS:
+            self._break(1)
+
+    def handle_data(self, data: str) -> None:
+        if self._skip_depth or self.exhausted:
+            return
+        if self._pre_depth:
+            self._emit(data)
+            return
+        text = _SPACES.sub(" ", data)
+        if self._at_line_start() or self._parts[-1][-1:] in (" ", "["):
+            text = text.lstrip()
+        self._emit(text)
+
+    def text(self) -> str:
+        """Extracted text so far. Not stripped at the end once the budget is hit."""
+        text = "".join(self._parts)
+        return text.lstrip() if self.exhausted else text.strip()
+
+
+def html_to_text(html: str, budget: Optional[int] = None) -> str:
+    """Extract text from a complete HTML document (see HTMLTextExtractor)."""
+    extractor = HTMLTextExtractor(budget)
+    extractor.feed(html)
+    extractor.close()
+    return extractor.text()
@@ -0,0 +1,162 @@
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    url           TEXT PRIMARY KEY,
+    status        INTEGER NOT NULL,
+    body          TEXT NOT NULL DEFAULT '',
+    etag          TEXT,
+    last_modified TEXT,
+    expires_at    REAL NOT NULL,
+    last_access   REAL NOT NULL,
+    size          INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_responses_access ON responses (last_access);
+"""
+
+
+@dataclass
+class CachedResponse:
+    url: str
+    status: int
+    body: str
+    etag: str | None
+    last_modified: str | None
+    expires_at: float
+
+    @property
+    def fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Conditional request headers for revalidating this entry."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HTTPResponseCache:
+    """
+    Persistent response cache for marketplace fetches, backed by SQLite.
+
+    - Fresh entries are served without touching the network.
+    - Stale entries with an ETag / Last-Modified are revalidated; a 304
+      only extends the expiry.
+    - 404s are stored as negative entries so repeated fetch_skill probes
+      for a missing skill stay local.
+    - Total body size is capped; least recently used entries go first.
+    """
+
+    def __init__(self, db_path: Path, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def get(self, url: str) -> CachedResponse | None:
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT url, status, body, etag, last_modified, expires_at "
+                "FROM responses WHERE url = ?",
+                (url,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+        return CachedResponse(**dict(row))
+
+    def put(
+        self,
+        url: str,
+        status: int,
+        body: str,
+        ttl: float,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        now = time.time()
+        size = len(body.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status, body, etag, last_modified, expires_at, last_access, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, status, body, etag, last_modified, now + ttl, now, size),
+            )
+            self._evict()
+
+    def refresh(self, url: str, ttl: float) -> None:
+        """Extend an entry's expiry after a 304 Not Modified."""
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, last_access = ? WHERE url = ?",
+                (now + ttl, now, url),
+            )
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the total size fits. Caller holds the lock."""
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT url, size FROM responses ORDER BY last_access"
+        ).fetchall()
+        victims = []
+        for row in rows:
+            if total <= self.max_bytes:
+                break
+            victims.append((row["url"],))
+            total -= row["size"]
+        self._conn.executemany("DELETE FROM responses WHERE url = ?", victims)
+        logger.info("HTTP cache evicted %d entr(y/ies)", len(victims))
+
+    def clear(self) -> None:
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM responses")
+
+
+_cache: HTTPResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache() -> HTTPResponseCache | None:
+    """Return the shared response cache, or None when HTTP_CACHE_ENABLED is off."""
+    global _cache
+    if not settings.HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HTTPResponseCache(
+                db_path=settings.HTTP_CACHE_PATH,
+                max_bytes=settings.HTTP_CACHE_MAX_MB * 1024 * 1024,
+            )
+        return _cache
+
+
+def set_http_cache(cache: HTTPResponseCache | None) -> None:
+    """Swap the shared cache, e.g. for a temporary one in benchmarks."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
@@ -0,0 +1,131 @@
+import contextlib
+import importlib.util
+import itertools
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterator
+from urllib.parse import urlparse
+
+import httpx
+
+from src.config.settings import settings
+from src.tools.rate_limit import RETRY_STATUSES, OutboundGovernor, get_governor
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "skill-agent/1.0 (skill discovery bot)"
+
+
+class PooledHTTPClient:
+    """
+    Process-wide HTTP client shared by all outbound tools.
+
+    Keeps connections alive between requests (no TCP/TLS handshake per URL)
+    and negotiates HTTP/2 when the `h2` package is installed. Every request
+    goes through the outbound governor (per-domain rate limit + concurrency
+    cap); 429/5xx responses are retried with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        max_connections: int,
+        max_keepalive: int,
+        keepalive_expiry: float,
+        http2: bool,
+        transport: httpx.BaseTransport | None = None,
+        governor: OutboundGovernor | None = None,
+    ) -> None:
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self.governor = governor or get_governor()
+        self._client = httpx.Client(
+            follow_redirects=True,
+            http2=self.http2,
+            headers={"User-Agent": USER_AGENT},
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            transport=transport,
+        )
+
+    def get(self, url: str, timeout: float, headers: dict[str, str] | None = None) -> httpx.Response:
+        with self.stream(url, timeout=timeout, headers=headers) as response:
+            response.read()
+            return response
+
+    @contextlib.contextmanager
+    def stream(
+        self, url: str, timeout: float, headers: dict[str, str] | None = None
+    ) -> Iterator[httpx.Response]:
+        """GET with a streamed body; the connection is released when the block exits."""
+        host = urlparse(url).hostname or ""
+        for attempt in itertools.count():
+            with self.governor.slot(host), self._client.stream(
+                "GET", url, timeout=timeout, headers=headers
+            ) as response:
+                delay = None
+                if response.status_code in RETRY_STATUSES:
+                    response.read()  # error bodies are short; keeps the connection reusable
+                    delay = self.governor.throttled(host, attempt, _retry_after(response))
+                if delay is None:
+                    yield response
+                    return
+            time.sleep(delay)  # outside the slot, so others can use it meanwhile
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def close(self) -> None:
+        self._client.close()
+
+
+def _retry_after(response: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds or HTTP date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+_client: PooledHTTPClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> PooledHTTPClient:
+    """Return the shared client, (re)creating it if missing or closed."""
+    global _client
+    with _client_lock:
+        if _client is None or _client.closed:
+            _client = PooledHTTPClient(
+                max_connections=settings.HTTP_MAX_CONNECTIONS,
+                max_keepalive=settings.HTTP_MAX_KEEPALIVE,
+                keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+                http2=settings.HTTP2_ENABLED,
+            )
+            logger.info("HTTP client pool created (http2=%s)", _client.http2)
+        return _client
+
+
+def set_http_client(client: PooledHTTPClient | None) -> None:
+    """Swap the shared client, e.g. for one bound to a stand-in transport."""
+    global _client
+    with _client_lock:
+        if _client is not None and _client is not client:
+            _client.close()
+        _client = client
+
+
+def close_http_client() -> None:
+    """Close pooled connections. Called from the FastAPI lifespan on shutdown."""
+    set_http_client(None)
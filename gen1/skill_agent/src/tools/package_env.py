@@ -0,0 +1,195 @@
+import contextlib
+import hashlib
+import importlib.metadata
+import logging
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Iterator
+
+
+from src.config.settings import settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — non-POSIX platforms fall back to in-process locks
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_REQUIREMENT_NAME = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*")
+_MARKER = ".complete"
+
+
+class PackageEnvError(RuntimeError):
+    """A managed environment could not be built or a package not installed."""
+
+
+def skill_dir_for(path: Path) -> Path | None:
+    """Return the skill directory a path lives under, if any."""
+    try:
+        relative = path.resolve().relative_to(settings.SKILLS_DIR.resolve())
+    except ValueError:
+        return None
+    return settings.SKILLS_DIR / relative.parts[0] if relative.parts else None
+
+
+class PackageEnvManager:
+    """
+    Managed package layer for code execution.
+
+    - Packages resolve from a local wheelhouse first (WHEELHOUSE_DIR); the
+      wheelhouse is only topped up from the network when PACKAGE_OFFLINE is off.
+    - Skills that declare `requirements:` get a virtualenv built once and
+      reused by content hash (python version + sorted requirements).
+    - File locks serialize concurrent builds/installs across threads and workers.
+    """
+
+    def __init__(self, wheelhouse: Path, venv_dir: Path, offline: bool, timeout: int) -> None:
+        self.wheelhouse = wheelhouse
+        self.venv_dir = venv_dir
+        self.offline = offline
+        self.timeout = timeout
+        self._thread_locks: dict[str, threading.Lock] = {}
+        self._registry_lock = threading.Lock()
+        wheelhouse.mkdir(parents=True, exist_ok=True)
+        venv_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------------------------------------------
+    # Locking
+    # ------------------------------------------------------------------
+
+    @contextlib.contextmanager
+    def _lock(self, name: str) -> Iterator[None]:
+        with self._registry_lock:
+            thread_lock = self._thread_locks.setdefault(name, threading.Lock())
+        with thread_lock:
+            if fcntl is None:
+                yield
+                return
+            lock_path = self.venv_dir / f".{name}.lock"
+            with open(lock_path, "w") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    # ------------------------------------------------------------------
+    # pip helpers
+    # ------------------------------------------------------------------
+
+    def _pip(self, python: str, *args: str) -> subprocess.CompletedProcess:
+        cmd = [python, "-m", "pip", *args, "--disable-pip-version-check", "--no-input"]
+        logger.info("pip: %s", " ".join(cmd))
+        try:
+            return subprocess.run(cmd, capture_output=True, text=True, timeout=self.timeout)
+        except subprocess.TimeoutExpired:
+            raise PackageEnvError(f"pip timed out after {self.timeout}s: {' '.join(args)}")
+
+    def _install(self, python: str, requirements: list[str]) -> subprocess.CompletedProcess:
+        """Install from the wheelhouse; download into it first only if that fails and we're online."""
+        local = ["install", "--no-index", "--find-links", str(self.wheelhouse), *requirements]
+        result = self._pip(python, *local)
+        if result.returncode == 0 or self.offline:
+            return result
+
+        download = self._pip(
+            python, "download", "--dest", str(self.wheelhouse),
+            "--find-links", str(self.wheelhouse), *requirements,
+        )
+        if download.returncode != 0:
+            return download
+        return self._pip(python, *local)
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    def env_hash(self, requirements: list[str]) -> str:
+        normalized = sorted({r.strip().lower() for r in requirements if r.strip()})
+        key = f"{sys.version_info.major}.{sys.version_info.minor}\n" + "\n".join(normalized)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def ensure_env(self, requirements: list[str]) -> Path:
+        """Return the python executable of a cached env satisfying `requirements`."""
+        digest = self.env_hash(requirements)
+        env_path = self.venv_dir / digest
+        bin_dir = "Scripts" if sys.platform == "win32" else "bin"
+        python = env_path / bin_dir / ("python.exe" if sys.platform == "win32" else "python")
+
+        if (env_path / _MARKER).exists():
+            return python
+
+        with self._lock(digest):
+            if (env_path / _MARKER).exists():
+                return python  # built by another worker while we waited
+
+            shutil.rmtree(env_path, ignore_errors=True)  # leftovers of a failed build
+            logger.info("Building cached env %s for: %s", digest, requirements)
+            try:
+                subprocess.run(
+                    [sys.executable, "-m", "venv", "--system-site-packages", str(env_path)],
+                    check=True, capture_output=True, text=True, timeout=self.timeout,
+                )
+            except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+                shutil.rmtree(env_path, ignore_errors=True)
+                raise PackageEnvError(f"venv creation failed: {e}")
+
+            result = self._install(str(python), requirements)
+            if result.returncode != 0:
+                shutil.rmtree(env_path, ignore_errors=True)
+                raise PackageEnvError(
+                    f"Installing {requirements} failed:\n{result.stderr.strip()[-2000:]}"
+                )
+
+            (env_path / "requirements.txt").write_text("\n".join(requirements), encoding="utf-8")
+            (env_path / _MARKER).touch()
+        return python
+
+    def python_for_script(self, path: Path) -> str:
+        """Interpreter for a script: its skill's cached env, or the server's own."""
+        # Deferred: skills_manager_tool imports this module
+        from src.tools.skills_manager_tool import skill_requirements
+
+        requirements = skill_requirements(path)
+        if not requirements:
+            return sys.executable
+        return str(self.ensure_env(requirements))
+
+    def install_package(self, requirement: str) -> subprocess.CompletedProcess | None:
+        """
+        Install into the server environment via the wheelhouse.
+        Returns None when the package is already installed (nothing to do).
+        """
+        match = _REQUIREMENT_NAME.match(requirement)
+        if match and match.group(0) == requirement:
+            try:
+                importlib.metadata.version(requirement)
+                return None
+            except importlib.metadata.PackageNotFoundError:
+                pass
+
+        with self._lock("server-env"):
+            return self._install(sys.executable, [requirement])
+
+
+_manager: PackageEnvManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_package_env_manager() -> PackageEnvManager:
+    """Return the shared package layer, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = PackageEnvManager(
+                wheelhouse=settings.WHEELHOUSE_DIR,
+                venv_dir=settings.VENV_CACHE_DIR,
+                offline=settings.PACKAGE_OFFLINE,
+                timeout=settings.PACKAGE_INSTALL_TIMEOUT,
+            )
+        return _manager
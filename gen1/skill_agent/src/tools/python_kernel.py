@@ -0,0 +1,288 @@
+import atexit
+import contextlib
+import contextvars
+import json
+import logging
+import os
+import select
+import subprocess
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from src.config.settings import settings
+
+try:
+    import resource
+except ImportError:  # pragma: no cover — non-POSIX platforms
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+_WORKER_PATH = Path(__file__).with_name("_kernel_worker.py")
+
+# Session (conversation thread) the current crew run belongs to
+_current_session: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "kernel_session", default=None
+)
+
+
+@contextlib.contextmanager
+def session_scope(session_id: str | None) -> Iterator[None]:
+    """Bind tool calls made inside this block to a kernel session."""
+    token = _current_session.set(session_id)
+    try:
+        yield
+    finally:
+        _current_session.reset(token)
+
+
+def current_session() -> str | None:
+    return _current_session.get()
+
+
+@dataclass
+class KernelResult:
+    stdout: str
+    stderr: str
+    exit_code: int | None
+    timed_out: bool = False
+    restarted: bool = False
+    crashed: bool = False
+
+
+class KernelCrashed(RuntimeError):
+    """The kernel process exited while executing a request."""
+
+
+# ---------------------------------------------------------------------------
+# Single kernel process
+# ---------------------------------------------------------------------------
+
+
+class PythonKernel:
+    """
+    A long-lived interpreter speaking a line-delimited JSON protocol.
+    Globals persist between executions until the process is restarted.
+    """
+
+    def __init__(self, session_id: str, memory_limit_mb: int) -> None:
+        self.session_id = session_id
+        self.memory_limit_mb = memory_limit_mb
+        self.last_used = time.monotonic()
+        self.lock = threading.Lock()
+        # Managed by KernelManager under its lock: callers holding this kernel,
+        # and whether it was removed from the registry (stopped once unused)
+        self.in_use = 0
+        self.retired = False
+        self._proc: subprocess.Popen | None = None
+        self._buffer = b""
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _limit_resources(self) -> None:
+        if resource is None or self.memory_limit_mb <= 0:
+            return
+        limit = self.memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    def start(self) -> None:
+        self._buffer = b""
+        self._proc = subprocess.Popen(
+            [sys.executable, "-u", str(_WORKER_PATH)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            preexec_fn=self._limit_resources if os.name == "posix" else None,
+        )
+        logger.info("Started Python kernel for session %s (pid %d)", self.session_id, self._proc.pid)
+
+    def stop(self) -> None:
+        if self._proc is None:
+            return
+        if self._proc.poll() is None:
+            self._proc.kill()
+        self._proc.wait()
+        for stream in (self._proc.stdin, self._proc.stdout):
+            if stream:
+                stream.close()
+        self._proc = None
+
+    def _read_line(self, deadline: float) -> bytes | None:
+        """Read one protocol line, or None on timeout."""
+        fd = self._proc.stdout.fileno()
+        while b"\n" not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise KernelCrashed(f"kernel exited with code {self._proc.wait()}")
+            self._buffer += chunk
+        line, self._buffer = self._buffer.split(b"\n", 1)
+        return line
+
+    def execute(self, code: str, cwd: Path, timeout: int) -> KernelResult:
+        """Run code in the kernel. The caller must hold `self.lock`."""
+        self.last_used = time.monotonic()
+        restarted = False
+        if not self.alive:
+            restarted = self._proc is not None
+            self.stop()
+            self.start()
+
+        request = json.dumps({"code": code, "cwd": str(cwd)}) + "\n"
+        try:
+            self._proc.stdin.write(request.encode("utf-8"))
+            self._proc.stdin.flush()
+            line = self._read_line(time.monotonic() + timeout)
+        except (BrokenPipeError, KernelCrashed) as exc:
+            logger.warning("Kernel for session %s crashed: %s", self.session_id, exc)
+            exit_code = self._proc.wait() if self._proc else None
+            self.stop()
+            return KernelResult("", str(exc), exit_code, restarted=restarted, crashed=True)
+        finally:
+            self.last_used = time.monotonic()
+
+        if line is None:
+            # State is unrecoverable once a request hangs — kill and restart lazily
+            self.stop()
+            return KernelResult("", "", None, timed_out=True, restarted=restarted)
+
+        payload = json.loads(line)
+        return KernelResult(
+            stdout=payload["stdout"],
+            stderr=payload["stderr"],
+            exit_code=payload["exit_code"],
+            restarted=restarted,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Session manager
+# ---------------------------------------------------------------------------
+
+
+class KernelManager:
+    """
+    Process-wide registry of kernels keyed by session (thread) ID.
+    Enforces a max-sessions limit (LRU eviction) and evicts idle kernels.
+    """
+
+    def __init__(self, max_sessions: int, idle_timeout: int, memory_limit_mb: int) -> None:
+        self.max_sessions = max(1, max_sessions)
+        self.idle_timeout = idle_timeout
+        self.memory_limit_mb = memory_limit_mb
+        self._kernels: OrderedDict[str, PythonKernel] = OrderedDict()
+        self._lock = threading.Lock()
+        self._reaper: threading.Thread | None = None
+
+    def _evict(self, session_id: str) -> None:
+        """Remove a kernel; it is stopped now, or by its last caller if in use. Caller holds the lock."""
+        kernel = self._kernels.pop(session_id, None)
+        if kernel:
+            kernel.retired = True
+            if not kernel.in_use:
+                kernel.stop()
+            logger.info("Evicted Python kernel for session %s", session_id)
+
+    def _evict_idle(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            idle = [
+                sid for sid, kernel in self._kernels.items()
+                if now - kernel.last_used > self.idle_timeout and not kernel.in_use
+            ]
+            for sid in idle:
+                self._evict(sid)
+
+    def _reap_forever(self) -> None:
+        interval = max(5, min(60, self.idle_timeout // 4))
+        while True:
+            time.sleep(interval)
+            self._evict_idle()
+
+    def _acquire(self, session_id: str) -> PythonKernel:
+        """The session's kernel, marked in use so eviction leaves it alone until _release."""
+        with self._lock:
+            if self._reaper is None:
+                self._reaper = threading.Thread(
+                    target=self._reap_forever, name="kernel-reaper", daemon=True
+                )
+                self._reaper.start()
+
+            kernel = self._kernels.get(session_id)
+            if kernel:
+                self._kernels.move_to_end(session_id)
+            else:
+                # Evict least-recently-used idle kernels; ones in use are never killed here
+                for sid in list(self._kernels):
+                    if len(self._kernels) < self.max_sessions:
+                        break
+                    if not self._kernels[sid].in_use:
+                        self._evict(sid)
+
+                kernel = PythonKernel(session_id, self.memory_limit_mb)
+                self._kernels[session_id] = kernel
+            kernel.in_use += 1
+            return kernel
+
+    def _release(self, kernel: PythonKernel) -> None:
+        with self._lock:
+            kernel.in_use -= 1
+            orphaned = kernel.retired and not kernel.in_use
+        if orphaned:
+            kernel.stop()
+
+    def execute(self, session_id: str, code: str, cwd: Path, timeout: int) -> KernelResult:
+        self._evict_idle()
+        while True:
+            kernel = self._acquire(session_id)
+            try:
+                with kernel.lock:
+                    if not kernel.retired:
+                        return kernel.execute(code, cwd, timeout)
+            finally:
+                self._release(kernel)
+            # Reset (or shut down) while waiting for the lock: run on the session's new kernel
+
+    def reset(self, session_id: str) -> bool:
+        with self._lock:
+            existed = session_id in self._kernels
+            self._evict(session_id)
+        return existed
+
+    def shutdown(self) -> None:
+        with self._lock:
+            for session_id in list(self._kernels):
+                self._evict(session_id)
+
+    def session_count(self) -> int:
+        return len(self._kernels)
+
+
+_manager: KernelManager | None = None
+_manager_lock = threading.Lock()
+
+
+def get_kernel_manager() -> KernelManager:
+    """Return the shared kernel manager, creating it on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = KernelManager(
+                max_sessions=settings.KERNEL_MAX_SESSIONS,
+                idle_timeout=settings.KERNEL_IDLE_TIMEOUT,
+                memory_limit_mb=settings.KERNEL_MEMORY_LIMIT_MB,
+            )
+            atexit.register(_manager.shutdown)
+        return _manager
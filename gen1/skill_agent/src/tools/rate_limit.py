@@ -0,0 +1,239 @@
+import contextlib
+import logging
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class DomainLimit:
+    rate: float       # sustained requests per second
+    burst: int        # bucket capacity
+    concurrency: int  # requests in flight at once
+
+
+# Per-domain limits; subdomains inherit. Anything else gets the settings defaults.
+DOMAIN_LIMITS: Dict[str, DomainLimit] = {
+    "skills.sh": DomainLimit(rate=5, burst=10, concurrency=6),
+    "skillhub.club": DomainLimit(rate=5, burst=10, concurrency=6),
+    "raw.githubusercontent.com": DomainLimit(rate=20, burst=40, concurrency=8),
+    "api.github.com": DomainLimit(rate=1, burst=5, concurrency=4),
+    "duckduckgo.com": DomainLimit(rate=1, burst=3, concurrency=2),
+}
+
+# Responses that mean "slow down" and are retried with backoff
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RateLimitExceeded(RuntimeError):
+    """No slot/token for a domain within the maximum wait."""
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. `reserve()` takes a token immediately (the
+    balance may go negative) and returns how long to wait before using it,
+    so concurrent callers queue fairly instead of polling.
+    """
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            return max(wait, self._paused_until - now)
+
+    def refund(self) -> None:
+        with self._lock:
+            self._tokens = min(self.capacity, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """Hold every caller back for `seconds` (server asked us to back off)."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+class _DomainState:
+    def __init__(self, limit: DomainLimit) -> None:
+        self.limit = limit
+        self.bucket = TokenBucket(limit.rate, limit.burst)
+        self.slots = threading.BoundedSemaphore(max(1, limit.concurrency))
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.in_flight = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.rejections = 0
+        self.throttled = 0
+        self.retries = 0
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self.lock:
+            return {
+                "rate": self.limit.rate,
+                "burst": self.limit.burst,
+                "concurrency": self.limit.concurrency,
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "wait_total_s": round(self.wait_total, 3),
+                "wait_avg_ms": round(1000 * self.wait_total / self.requests, 1) if self.requests else 0.0,
+                "wait_max_ms": round(1000 * self.wait_max, 1),
+                "rejections": self.rejections,
+                "throttled": self.throttled,
+                "retries": self.retries,
+            }
+
+
+class OutboundGovernor:
+    """
+    Process-wide coordination for outbound tool traffic.
+
+    Every request to a domain takes a concurrency slot and a token from that
+    domain's bucket, waiting at most `max_wait` seconds (then RateLimitExceeded).
+    Throttling responses (429/5xx) back off with full jitter and pause the
+    domain's bucket, so all callers slow down together.
+    """
+
+    def __init__(
+        self,
+        limits: Dict[str, DomainLimit],
+        default: DomainLimit,
+        max_wait: float,
+        max_retries: int,
+        backoff_base: float,
+        backoff_max: float,
+    ) -> None:
+        self.limits = limits
+        self.default = default
+        self.max_wait = max_wait
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._states: Dict[str, _DomainState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _DomainState:
+        host = host.lower().removeprefix("www.")
+        key, limit = host, self.default
+        for domain, domain_limit in self.limits.items():
+            if host == domain or host.endswith("." + domain):
+                key, limit = domain, domain_limit
+                break
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = self._states[key] = _DomainState(limit)
+            return state
+
+    @contextlib.contextmanager
+    def slot(self, host: str) -> Iterator[None]:
+        state = self._state(host)
+        start = time.monotonic()
+        if not state.slots.acquire(timeout=self.max_wait):
+            with state.lock:
+                state.rejections += 1
+            raise RateLimitExceeded(f"no free slot for {host} within {self.max_wait}s")
+        try:
+            delay = state.bucket.reserve()
+            if delay > self.max_wait - (time.monotonic() - start):
+                state.bucket.refund()
+                with state.lock:
+                    state.rejections += 1
+                raise RateLimitExceeded(f"rate limit for {host} would delay {delay:.1f}s")
+            if delay > 0:
+                time.sleep(delay)
+            waited = time.monotonic() - start
+            with state.lock:
+                state.requests += 1
+                state.in_flight += 1
+                state.wait_total += waited
+                state.wait_max = max(state.wait_max, waited)
+            try:
+                yield
+            finally:
+                with state.lock:
+                    state.in_flight -= 1
+        finally:
+            state.slots.release()
+
+    def throttled(self, host: str, attempt: int, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Record a throttling response. Returns the jittered delay before retry
+        `attempt + 1` (and pauses the domain for it), or None when out of retries.
+        """
+        state = self._state(host)
+        with state.lock:
+            state.throttled += 1
+        if attempt >= self.max_retries:
+            return None
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.backoff_max))
+        state.bucket.pause(delay)
+        with state.lock:
+            state.retries += 1
+        logger.info("Throttled by %s; retry %d in %.2fs", host, attempt + 1, delay)
+        return delay
+
+    def call(self, host: str, fn: Callable[[], T], is_throttled: Callable[[Exception], bool]) -> T:
+        """Run `fn` under the domain's limits, retrying throttling exceptions with backoff."""
+        attempt = 0
+        while True:
+            with self.slot(host):
+                try:
+                    return fn()
+                except Exception as e:
+                    if not is_throttled(e):
+                        raise
+                    delay = self.throttled(host, attempt)
+                    if delay is None:
+                        raise
+            time.sleep(delay)  # outside the slot, so others can use it meanwhile
+            attempt += 1
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            states = dict(self._states)
+        return {domain: state.snapshot() for domain, state in sorted(states.items())}
+
+
+_governor: OutboundGovernor | None = None
+_governor_lock = threading.Lock()
+
+
+def get_governor() -> OutboundGovernor:
+    """Return the process-wide governor shared by all outbound tools."""
+    global _governor
+    with _governor_lock:
+        if _governor is None:
+            _governor = OutboundGovernor(
+                limits=DOMAIN_LIMITS,
+                default=DomainLimit(
+                    rate=settings.RATE_LIMIT_DEFAULT_RPS,
+                    burst=settings.RATE_LIMIT_DEFAULT_BURST,
+                    concurrency=settings.HTTP_MAX_PER_HOST,
+                ),
+                max_wait=settings.RATE_LIMIT_MAX_WAIT,
+                max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+                backoff_base=settings.RATE_LIMIT_BACKOFF_BASE,
+                backoff_max=settings.RATE_LIMIT_BACKOFF_MAX,
+            )
+        return _governor
@@ -0,0 +1,190 @@
+import json
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from duckduckgo_search import DDGS
+from duckduckgo_search.exceptions import RatelimitException
+
+from src.config.settings import settings
+from src.tools.rate_limit import get_governor
+from src.tools.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_SITE = re.compile(r"\bsite:(\S+)", re.IGNORECASE)
+_TOKENS = re.compile(r'"[^"]+"|\S+')
+# Search operators are case-sensitive ("pdf OR docx" is not "pdf or docx")
+OPERATORS = frozenset({"OR", "AND", "NOT"})
+
+
+@dataclass
+class SearchResult:
+    title: str
+    url: str
+    body: str
+
+    def to_dict(self) -> Dict[str, str]:
+        return asdict(self)
+
+
+def _normalize_site(value: str) -> str:
+    """`host/path` of a `site:` value or URL: host lowercased without www., path kept."""
+    parts = urlparse(value if "//" in value else f"//{value}")
+    host = (parts.netloc or value).lower().removeprefix("www.")
+    return (host + parts.path).rstrip("/")
+
+
+def _site_matches(url: str, site: str) -> bool:
+    host, _, path = site.partition("/")
+    doc_host, _, doc_path = _normalize_site(url).partition("/")
+    if doc_host != host and not doc_host.endswith("." + host):
+        return False
+    return not path or doc_path == path or doc_path.startswith(path + "/")
+
+
+def normalize_query(query: str) -> str:
+    """
+    Cache key for a query (never sent to the backend): whitespace collapsed,
+    terms case folded except operators (OR / AND / NOT), `site:` filters
+    reduced to host + path and moved to the front (deduped). Quoted phrases
+    are kept intact.
+    """
+    sites = sorted({_normalize_site(s) for s in _SITE.findall(query)})
+    rest = _SITE.sub(" ", query)
+    terms = [t if t in OPERATORS else t.casefold() for t in _TOKENS.findall(rest)]
+    return " ".join([f"site:{s}" for s in sites] + terms)
+
+
+class SearchBackend(ABC):
+    """A web search provider behind `duckduckgo_search`."""
+
+    name: str = "backend"
+
+    @abstractmethod
+    def search(self, query: str, max_results: int) -> List[SearchResult]:
+        """Run one query (whitespace collapsed, otherwise as the agent wrote it)."""
+
+
+class DuckDuckGoBackend(SearchBackend):
+    """
+    DuckDuckGo text search. Reuses one DDGS session per thread (keeps its
+    HTTP client and cookies) and goes through the shared outbound governor,
+    retrying DDG rate-limit errors with backoff.
+    """
+
+    name = "duckduckgo"
+
+    def __init__(self, timeout: int = 10) -> None:
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _session(self) -> DDGS:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = DDGS(timeout=self.timeout)
+        return session
+
+    def search(self, query: str, max_results: int) -> List[SearchResult]:
+        def run() -> List[SearchResult]:
+            try:
+                hits = self._session().text(query, max_results=max_results) or []
+            except RatelimitException:
+                raise
+            except Exception:
+                self._local.session = None  # start over with a fresh session next time
+                raise
+            return [SearchResult(h.get("title", ""), h.get("href", ""), h.get("body", "")) for h in hits]
+
+        return get_governor().call(
+            "duckduckgo.com", run, lambda e: isinstance(e, RatelimitException)
+        )
+
+
+class LocalIndexBackend(SearchBackend):
+    """
+    In-process stand-in index for tests and load benchmarks. Scores documents
+    by term frequency (title > url > body), honours `site:` and requires
+    quoted phrases to appear verbatim. No network.
+    """
+
+    name = "local"
+
+    def __init__(self, documents: List[SearchResult]) -> None:
+        self.documents = documents
+
+    @classmethod
+    def from_file(cls, path: Path) -> "LocalIndexBackend":
+        """Load a JSON list of {"title", "url", "body"} objects."""
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return cls([SearchResult(d["title"], d["url"], d.get("body", "")) for d in data])
+
+    def search(self, query: str, max_results: int) -> List[SearchResult]:
+        sites = [_normalize_site(s) for s in _SITE.findall(query)]
+        tokens = [t.lower() for t in _TOKENS.findall(_SITE.sub(" ", query)) if t not in OPERATORS]
+        phrases = [t.strip('"') for t in tokens if t.startswith('"')]
+        terms = [t for t in tokens if not t.startswith('"')]
+
+        scored = []
+        for doc in self.documents:
+            if sites and not any(_site_matches(doc.url, s) for s in sites):
+                continue
+            title, url, body = doc.title.lower(), doc.url.lower(), doc.body.lower()
+            text = f"{title} {url} {body}"
+            if any(p not in text for p in phrases):
+                continue
+            score = sum(3 * title.count(t) + 2 * url.count(t) + body.count(t) for t in terms)
+            if score or (not terms and (sites or phrases)):
+                scored.append((score, doc))
+        scored.sort(key=lambda item: item[0], reverse=True)
+        return [doc for _, doc in scored[:max_results]]
+
+
+_backend: Optional[SearchBackend] = None
+_cache: Optional[TTLCache] = None
+_lock = threading.Lock()
+
+
+def get_search_backend() -> SearchBackend:
+    """Return the configured backend (SEARCH_BACKEND: duckduckgo | local)."""
+    global _backend
+    with _lock:
+        if _backend is None:
+            if settings.SEARCH_BACKEND == "local":
+                _backend = LocalIndexBackend.from_file(settings.SEARCH_LOCAL_INDEX)
+            else:
+                _backend = DuckDuckGoBackend()
+            logger.info("Search backend: %s", _backend.name)
+        return _backend
+
+
+def set_search_backend(backend: Optional[SearchBackend]) -> None:
+    """Swap the backend, e.g. for a LocalIndexBackend in benchmarks."""
+    global _backend
+    with _lock:
+        _backend = backend
+
+
+def get_search_cache() -> TTLCache:
+    """Return the shared result cache (memory tier + optional disk tier)."""
+    global _cache
+    with _lock:
+        if _cache is None:
+            _cache = TTLCache(
+                ttl=settings.SEARCH_CACHE_TTL,
+                max_entries=settings.SEARCH_CACHE_MAX_ENTRIES,
+                disk_path=settings.SEARCH_CACHE_PATH if settings.SEARCH_CACHE_DISK else None,
+            )
+        return _cache
+
+
+def set_search_cache(cache: Optional[TTLCache]) -> None:
+    """Swap the result cache, e.g. for a temporary one in benchmarks."""
+    global _cache
+    with _lock:
+        _cache = cache
@@ -1,5 +1,6 @@
 import logging
 import subprocess
+import threading
 import yaml
 from pathlib import Path
 from typing import Any, Literal, Type
@@ -8,27 +9,54 @@ from crewai.tools import BaseTool
 from pydantic import BaseModel, Field, model_validator
 
 from src.config.settings import settings
+from src.tools.package_env import PackageEnvError, get_package_env_manager, skill_dir_for
+from src.tools.tool_cache import get_tool_cache
 
 logger = logging.getLogger(__name__)
 
+# Read-only actions served from the shared tool-result cache
+CACHED_ACTIONS = ("list_skills", "load_skill", "list_resources", "read_resource")
+# Actions that change skills on disk; each one invalidates the cache
+MUTATING_ACTIONS = ("create_skill", "write_file", "delete_skill", "refresh_cache")
+
+# registry_summary(): description characters and triggers kept per skill
+SUMMARY_DESCRIPTION_CHARS = 160
+SUMMARY_MAX_TRIGGERS = 5
+
 
 # ---------------------------------------------------------------------------
 # Internal skill metadata (not exposed outside this module)
 # ---------------------------------------------------------------------------
 
 class _SkillMetadata:
-    __slots__ = ("name", "description", "path", "triggers")
-
-    def __init__(self, name: str, description: str, path: Path, triggers: list[str]) -> None:
+    __slots__ = ("name", "description", "path", "triggers", "requirements")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        path: Path,
+        triggers: list[str],
+        requirements: list[str] | None = None,
+    ) -> None:
         self.name = name
         self.description = description
         self.path = path
         self.triggers = triggers
+        self.requirements = requirements or []
 
     def to_prompt_line(self) -> str:
         trigger_str = f" | triggers: {', '.join(self.triggers)}" if self.triggers else ""
         return f"- **{self.name}**: {self.description}{trigger_str}"
 
+    def to_summary_line(self) -> str:
+        description = " ".join(str(self.description).split())
+        if len(description) > SUMMARY_DESCRIPTION_CHARS:
+            description = description[:SUMMARY_DESCRIPTION_CHARS - 1].rstrip() + "…"
+        triggers = self.triggers[:SUMMARY_MAX_TRIGGERS]
+        trigger_str = f" [{', '.join(map(str, triggers))}]" if triggers else ""
+        return f"- {self.name}: {description}{trigger_str}"
+
 
 # ---------------------------------------------------------------------------
 # Input schema
@@ -119,7 +147,8 @@ class SkillsManagerTool(BaseTool):
         "'delete_skill' → remove a skill directory entirely; "
         "'refresh_cache' → force reload skills from disk; "
         "'run_script' → execute a utility script from a skill. "
-        "Always call list_skills first, then load_skill before using any capability."
+        "Pick a skill from the registry in your task (or call list_skills), "
+        "then load_skill before using any capability."
     )
     args_schema: Type[BaseModel] = SkillsManagerInput
 
@@ -183,7 +212,16 @@ class SkillsManagerTool(BaseTool):
         name: str = front_matter.get("name", skill_dir.name)
         description: str = front_matter.get("description", "No description provided.")
         triggers: list[str] = front_matter.get("triggers", [])
-        return _SkillMetadata(name=name, description=description, path=skill_dir, triggers=triggers)
+        requirements = front_matter.get("requirements") or []
+        if isinstance(requirements, str):
+            requirements = requirements.split()
+        return _SkillMetadata(
+            name=name,
+            description=description,
+            path=skill_dir,
+            triggers=triggers,
+            requirements=[str(r) for r in requirements],
+        )
 
     def _get_cache(self) -> dict[str, _SkillMetadata]:
         if self._needs_refresh():
@@ -210,6 +248,22 @@ class SkillsManagerTool(BaseTool):
             )
             return None
 
+    def _dependencies(self, action: str, skill_name: str, resource_path: str) -> list[Path]:
+        """Files a cached result of `action` was built from; editing any of them invalidates it."""
+        if action == "list_skills":
+            return [self._get_skills_dir()] + [meta.path / "skill.md" for meta in self._get_cache().values()]
+        meta = self._resolve_skill(skill_name)
+        if not meta:
+            return []
+        deps = [meta.path / "skill.md"]
+        if action == "list_resources":
+            deps += [meta.path / "references", meta.path / "scripts"]
+        elif action == "read_resource":
+            full_path = self._safe_resolve(meta, resource_path)
+            if full_path:
+                deps.append(full_path)
+        return deps
+
     # ------------------------------------------------------------------
     # Action handlers
     # ------------------------------------------------------------------
@@ -306,7 +360,15 @@ class SkillsManagerTool(BaseTool):
                 "Call action='list_resources' to see available scripts."
             )
 
-        cmd = ["python", str(script_path)] + ([a for a in script_args.split() if a] if script_args else [])
+        python = "python"
+        if meta.requirements:
+            try:
+                python = str(get_package_env_manager().ensure_env(meta.requirements))
+            except PackageEnvError as exc:
+                logger.error("Environment for '%s' failed: %s", skill_name, exc)
+                return f"❌ Failed to prepare environment for '{skill_name}': {exc}"
+
+        cmd = [python, str(script_path)] + ([a for a in script_args.split() if a] if script_args else [])
         logger.info("Running script: %s", " ".join(cmd))
 
         try:
@@ -411,6 +473,24 @@ class SkillsManagerTool(BaseTool):
             logger.error("Failed to delete skill '%s': %s", skill_name, e)
             return f"❌ Failed to delete skill: {str(e)}"
 
+    def registry_summary(self) -> str:
+        """
+        One line per skill for the task prompt, so the agent can go straight to
+        load_skill. Shared through the tool-result cache until a skill changes.
+        """
+        def build() -> str:
+            skills = self._get_cache()
+            if not skills:
+                return "(no skills installed)"
+            return "\n".join(meta.to_summary_line() for meta in skills.values())
+
+        cache = get_tool_cache()
+        if cache is None:
+            return build()
+        return cache.cached(
+            f"{self.name}.registry_summary", {}, lambda: self._dependencies("list_skills", "", ""), build
+        )
+
     def _run(self, **kwargs: Any) -> str:
         action = kwargs["action"]
         skill_name = kwargs.get("skill_name") or ""
@@ -435,4 +515,43 @@ class SkillsManagerTool(BaseTool):
         if not handler:
             return f"❌ Unknown action '{action}'. Valid: {list(dispatch.keys())}"
 
-        return handler()
+        cache = get_tool_cache()
+        if cache is None:
+            return handler()
+        if action in CACHED_ACTIONS:
+            return cache.cached(
+                f"{self.name}.{action}",
+                {"skill_name": skill_name, "resource_path": resource_path},
+                lambda: self._dependencies(action, skill_name, resource_path),
+                handler,
+            )
+        try:
+            return handler()
+        finally:
+            if action in MUTATING_ACTIONS:
+                cache.bump(action)
+
+
+_registry: SkillsManagerTool | None = None
+_registry_lock = threading.Lock()
+
+
+def skill_requirements(path: Path) -> list[str]:
+    """
+    Declared `requirements:` of the skill `path` lives under, from the skills
+    manager's parsed metadata. [] outside the skills directory, and for skills
+    it skipped (e.g. unparseable front matter).
+    """
+    global _registry
+    skill_dir = skill_dir_for(path)
+    if skill_dir is None:
+        return []
+    with _registry_lock:
+        if _registry is None:
+            _registry = SkillsManagerTool()
+        skills = _registry._get_cache()
+    target = skill_dir.resolve()
+    for meta in skills.values():
+        if meta.path.resolve() == target:
+            return meta.requirements
+    return []
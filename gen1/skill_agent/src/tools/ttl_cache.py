@@ -0,0 +1,97 @@
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_expiry ON entries (expires_at);
+"""
+
+
+class TTLCache:
+    """
+    Two-tier TTL cache for JSON-serializable values.
+
+    The memory tier is an LRU bounded by `max_entries`. The optional disk tier
+    (SQLite at `disk_path`) survives restarts and is shared between workers;
+    disk hits are promoted into memory. Expired entries are dropped on read
+    and purged from disk on write.
+    """
+
+    def __init__(self, ttl: float, max_entries: int, disk_path: Optional[Path] = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._memory: "OrderedDict[str, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self.hits = self.misses = 0
+        if disk_path is not None:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(disk_path), check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._memory.pop(key, None)
+
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM entries WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row:
+                    value = json.loads(row[0])
+                    self._remember(key, row[1], value)
+                    self.hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO entries (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, json.dumps(value), expires_at),
+                    )
+                    self._conn.execute("DELETE FROM entries WHERE expires_at <= ?", (time.time(),))
+
+    def _remember(self, key: str, expires_at: float, value: Any) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full. Caller holds the lock."""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM entries")
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._memory), "hits": self.hits, "misses": self.misses}
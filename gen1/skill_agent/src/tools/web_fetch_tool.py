@@ -1,12 +1,20 @@
+import codecs
+import itertools
 import logging
-import re
-from typing import Literal, Type, List, Set, ClassVar
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Literal, Type, List, Set, ClassVar, Optional, Tuple
 from urllib.parse import urlparse
 
 import httpx
 from crewai.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from src.config.settings import settings
+from src.tools.html_extract import HTMLTextExtractor, html_to_text
+from src.tools.http_cache import get_http_cache
+from src.tools.http_client import get_http_client
+from src.tools.rate_limit import RateLimitExceeded
+
 logger = logging.getLogger(__name__)
 
 # Allowlisted domains — agent can only fetch from these
@@ -17,6 +25,20 @@ ALLOWED_DOMAINS: Set[str] = {
     "api.github.com",
 }
 
+# Response cache TTLs (seconds) per allowlisted domain; others use HTTP_CACHE_DEFAULT_TTL
+DOMAIN_CACHE_TTLS: Dict[str, int] = {
+    "skills.sh": 3600,
+    "skillhub.club": 3600,
+    "raw.githubusercontent.com": 300,
+    "api.github.com": 60,
+}
+
+_HTML_TYPES = ("text/html", "application/xhtml+xml")
+
+
+class UnsupportedContent(Exception):
+    """Response body is binary / not extractable as text."""
+
 class WebFetchInput(BaseModel):
     action: Literal[
         "fetch_url",        # Fetch raw content from an allowed URL
@@ -72,6 +94,9 @@ class WebFetchTool(BaseTool):
     args_schema: Type[BaseModel] = WebFetchInput
 
     ALLOWED_DOMAINS: ClassVar[Set[str]] = ALLOWED_DOMAINS
+    DOMAIN_CACHE_TTLS: ClassVar[Dict[str, int]] = DOMAIN_CACHE_TTLS
+    # Extraction budget: characters of text returned to the agent
+    MAX_CONTENT_CHARS: ClassVar[int] = 8000
 
     KNOWN_OWNERS: ClassVar[List[str]] = [
         "anthropics/skills",
@@ -83,37 +108,132 @@ class WebFetchTool(BaseTool):
         "expo/skills",
     ]
 
+    @staticmethod
+    def _domain(url: str) -> str:
+        return (urlparse(url).hostname or "").removeprefix("www.")
+
     def _is_allowed(self, url: str) -> bool:
         try:
-            domain = urlparse(url).netloc.lstrip("www.")
-            return any(domain == d or domain.endswith("." + d) for d in ALLOWED_DOMAINS)
+            domain = self._domain(url)
+            return any(domain == d or domain.endswith("." + d) for d in self.ALLOWED_DOMAINS)
         except Exception:
             return False
 
+    def _cache_ttl(self, url: str) -> int:
+        domain = self._domain(url)
+        for d, ttl in self.DOMAIN_CACHE_TTLS.items():
+            if domain == d or domain.endswith("." + d):
+                return ttl
+        return settings.HTTP_CACHE_DEFAULT_TTL
+
+    def _render(self, url: str, content: str) -> str:
+        # Truncate to the budget to avoid context overflow
+        if len(content) > self.MAX_CONTENT_CHARS:
+            content = (
+                content[: self.MAX_CONTENT_CHARS]
+                + f"\n\n[TRUNCATED — showing first {self.MAX_CONTENT_CHARS} chars]"
+            )
+        return f"# Content from: {url}\n\n{content}"
+
+    @staticmethod
+    def _sniff(content_type: str, first_chunk: bytes) -> Optional[str]:
+        """Classify a body as 'html' or 'text' from its header and first chunk; None if binary."""
+        mime = content_type.split(";")[0].strip().lower()
+        if mime in _HTML_TYPES:
+            return "html"
+        if b"\x00" in first_chunk[:1024]:
+            return None
+        head = first_chunk[:512].lstrip().lower()
+        if head.startswith(b"<!doctype html") or b"<html" in head:
+            return "html"
+        return "text"
+
+    def _extract(self, response: httpx.Response) -> str:
+        """
+        Stream the body, decoding incrementally, and stop reading once the
+        extraction budget is exceeded or WEB_FETCH_MAX_BYTES raw bytes are in.
+        """
+        chunks = response.iter_bytes()
+        first = next(chunks, b"")
+        kind = self._sniff(response.headers.get("Content-Type", ""), first)
+        if kind is None:
+            raise UnsupportedContent(response.headers.get("Content-Type") or "binary")
+
+        try:
+            decoder = codecs.getincrementaldecoder(response.charset_encoding or "utf-8")(errors="replace")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+
+        parts: List[str] = []
+        extractor = HTMLTextExtractor(self.MAX_CONTENT_CHARS) if kind == "html" else None
+        raw_bytes = text_chars = 0
+        for chunk in itertools.chain([first], chunks):
+            raw_bytes += len(chunk)
+            decoded = decoder.decode(chunk)
+            if extractor:
+                extractor.feed(decoded)
+                if extractor.exhausted:
+                    break
+            else:
+                parts.append(decoded)
+                text_chars += len(decoded)
+                if text_chars > self.MAX_CONTENT_CHARS:
+                    break
+            if raw_bytes >= settings.WEB_FETCH_MAX_BYTES:
+                logger.info("Stopped reading %s at the %d byte cap", response.url, raw_bytes)
+                break
+        else:
+            if extractor:
+                extractor.feed(decoder.decode(b"", final=True))
+                extractor.close()
+            else:
+                parts.append(decoder.decode(b"", final=True))
+
+        return extractor.text() if extractor else "".join(parts)
+
     def _fetch(self, url: str, timeout: int = 15) -> str:
         if not self._is_allowed(url):
             return (
-                f"❌ Domain not in allowlist. Allowed: {sorted(ALLOWED_DOMAINS)}\n"
+                f"❌ Domain not in allowlist. Allowed: {sorted(self.ALLOWED_DOMAINS)}\n"
                 f"Requested: {url}"
             )
-        try:
-            headers = {"User-Agent": "skill-agent/1.0 (skill discovery bot)"}
-            with httpx.Client(follow_redirects=True, timeout=timeout) as client:
-                response = client.get(url, headers=headers)
-                response.raise_for_status()
 
-            content = response.text
-            # Strip HTML tags if it's a webpage
-            if "<html" in content.lower()[:200]:
-                content = self._strip_html(content)
+        cache = get_http_cache()
+        cached = cache.get(url) if cache else None
+        if cached and cached.fresh:
+            logger.info("Cache hit %s (HTTP %d)", url, cached.status)
+            if cached.status == 404:
+                return f"❌ HTTP 404: {url}"
+            return self._render(url, cached.body)
+
+        try:
+            headers = cached.validators if cached and cached.status == 200 else None
+            with get_http_client().stream(url, timeout=timeout, headers=headers) as response:
+                if response.status_code in (304, 404):
+                    response.read()  # drain the (empty/short) body so the connection is reused
+                if response.status_code == 304 and cached:
+                    cache.refresh(url, self._cache_ttl(url))
+                    logger.info("Revalidated %s (304)", url)
+                    return self._render(url, cached.body)
 
-            # Truncate to 8000 chars to avoid context overflow
-            if len(content) > 8000:
-                content = content[:8000] + f"\n\n[TRUNCATED — {len(content)} total chars]"
+                if response.status_code == 404 and cache:
+                    cache.put(url, 404, "", settings.HTTP_CACHE_NEGATIVE_TTL)
+                response.raise_for_status()
 
+                content = self._extract(response)
+                if cache and "no-store" not in response.headers.get("Cache-Control", ""):
+                    cache.put(
+                        url, 200, content, self._cache_ttl(url),
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                    )
             logger.info("Fetched %s (%d chars)", url, len(content))
-            return f"# Content from: {url}\n\n{content}"
+            return self._render(url, content)
 
+        except UnsupportedContent as e:
+            return f"❌ Unsupported content ({e}): {url}"
+        except RateLimitExceeded as e:
+            return f"❌ Rate limited ({e}): {url}"
         except httpx.HTTPStatusError as e:
             return f"❌ HTTP {e.response.status_code}: {url}"
         except httpx.TimeoutException:
@@ -122,18 +242,36 @@ class WebFetchTool(BaseTool):
             logger.exception("Fetch error: %s", e)
             return f"❌ Fetch error: {e}"
 
+    def _fetch_first(self, urls: List[str]) -> Tuple[str | None, Dict[str, str]]:
+        """
+        Fetch candidate URLs concurrently (capped at FETCH_FANOUT_CONCURRENCY)
+        and return the first successful result, or None if all fail, along
+        with the error message of each URL that failed.
+        Pending candidates are cancelled once one succeeds; in-flight ones are
+        left to finish in the background, bounded by their timeout.
+        """
+        pool = ThreadPoolExecutor(
+            max_workers=max(1, min(settings.FETCH_FANOUT_CONCURRENCY, len(urls))),
+            thread_name_prefix="fetch-fanout",
+        )
+        errors: Dict[str, str] = {}
+        try:
+            futures = {pool.submit(self._fetch, url): url for url in urls}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    content = future.result()
+                    if "❌" not in content[:10]:
+                        return content, errors
+                    errors[futures[future]] = content
+            return None, errors
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
+
     def _strip_html(self, html: str) -> str:
-        """Basic HTML stripping — removes tags, decodes common entities."""
-        text = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<style[^>]*>.*?</style>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'&nbsp;', ' ', text)
-        text = re.sub(r'&amp;', '&', text)
-        text = re.sub(r'&lt;', '<', text)
-        text = re.sub(r'&gt;', '>', text)
-        text = re.sub(r'&quot;', '"', text)
-        text = re.sub(r'\s{3,}', '\n\n', text)
-        return text.strip()
+        """HTML → text: drops script/style, decodes entities, keeps headings and code as markdown."""
+        return html_to_text(html)
 
     def _handle_search_skills_sh(self, topic: str) -> str:
         results = [f"# skills.sh — Search Results for: '{topic}'\n"]
@@ -159,23 +297,42 @@ class WebFetchTool(BaseTool):
             if owner:
                 url = f"https://skills.sh/{owner.rstrip('/')}/{slug}"
             else:
-                # Try known owners in order
-                results = []
-                for o in self.KNOWN_OWNERS:
+                # Try known owners concurrently — first success wins
+                candidates = [
+                    url
+                    for o in self.KNOWN_OWNERS
                     # Try both direct and /skills/ subpath
-                    variants = [
-                        f"https://skills.sh/{o}/{slug}",
-                        f"https://skills.sh/{o}/skills/{slug}",
-                    ]
-                    for url in variants:
-                        content = self._fetch(url)
-                        if "❌" not in content[:10]:
-                            return content
-                        results.append(f"Not found at: {url}")
+                    for url in (f"https://skills.sh/{o}/{slug}", f"https://skills.sh/{o}/skills/{slug}")
+                ]
+                content, errors = self._fetch_first(candidates)
+                if content is not None:
+                    return content
+                missing = [url for url in candidates if errors[url].startswith("❌ HTTP 404")]
+                failed = [errors[url] for url in candidates if url not in missing]
+                results = [f"Not found at: {url}" for url in missing] + failed
+                if not failed:
+                    return (
+                        f"❌ Skill '{slug}' not found in known collections on skills.sh.\n"
+                        + "\n".join(results)
+                        + "\n\nTry fetch_url with a specific URL."
+                    )
+                # Throttled / slow / erroring lookups say nothing about whether the skill exists
+                rate_limited = sum("Rate limited" in e for e in failed)
+                timed_out = sum("Timeout" in e for e in failed)
+                reasons = [
+                    f"{n} {label}"
+                    for n, label in (
+                        (rate_limited, "rate limited"),
+                        (timed_out, "timed out"),
+                        (len(failed) - rate_limited - timed_out, "failed"),
+                    )
+                    if n
+                ]
                 return (
-                    f"❌ Skill '{slug}' not found in known collections on skills.sh.\n"
+                    f"❌ Could not check every collection for skill '{slug}' on skills.sh "
+                    f"({', '.join(reasons)} of {len(candidates)} lookups); it may still exist.\n"
                     + "\n".join(results)
-                    + "\n\nTry fetch_url with a specific URL."
+                    + "\n\nRetry shortly, or use fetch_url / owner for a specific collection."
                 )
             return self._fetch(url)
 
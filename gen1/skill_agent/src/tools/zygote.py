@@ -0,0 +1,192 @@
+import atexit
+import itertools
+import json
+import logging
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+_WORKER_PATH = Path(__file__).with_name("_zygote_worker.py")
+
+# Extra seconds to wait for the zygote's own timeout report before giving up
+_RESPONSE_GRACE = 5
+
+
+@dataclass
+class ExecResult:
+    stdout: str
+    stderr: str
+    returncode: int | None
+    timed_out: bool = False
+    error: str | None = None
+
+
+class Zygote:
+    """
+    Client for a preloaded zygote process.
+
+    The zygote imports ZYGOTE_PRELOAD once, then forks a child per execution,
+    so each run skips interpreter startup and those imports. Children get their
+    own cwd, CPU/memory rlimits and a hard timeout. Thread-safe.
+    """
+
+    def __init__(self, preload: list[str], memory_limit_mb: int) -> None:
+        self.preload = preload
+        self.memory_limit_mb = memory_limit_mb
+        self._proc: subprocess.Popen | None = None
+        self._write_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._ids = itertools.count()
+        self._waiters: dict[int, tuple[threading.Event, dict]] = {}
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.poll() is None
+
+    def _ensure_started(self) -> subprocess.Popen:
+        with self._start_lock:
+            if self.alive:
+                return self._proc
+            env = os.environ.copy()
+            # Forking after native thread pools spin up is unsafe; keep BLAS single-threaded
+            for var in ("OPENBLAS_NUM_THREADS", "OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+                env.setdefault(var, "1")
+            self._proc = subprocess.Popen(
+                [sys.executable, "-u", str(_WORKER_PATH), ",".join(self.preload)],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=env,
+            )
+            threading.Thread(
+                target=self._read_responses, args=(self._proc,), name="zygote-reader", daemon=True
+            ).start()
+            logger.info(
+                "Started zygote (pid %d) preloading: %s", self._proc.pid, ", ".join(self.preload)
+            )
+            return self._proc
+
+    def _read_responses(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            payload = json.loads(line)
+            waiter = self._waiters.get(payload["id"])
+            if not waiter:
+                continue
+            event, slot = waiter
+            if "exit_code" not in payload:
+                slot["pgid"] = payload["pid"]  # child forked; result follows
+                continue
+            slot.update(payload)
+            event.set()
+        # EOF can arrive before the zygote is reapable, so poll() may still say alive here
+        proc.wait()
+        # Zygote exited — its children have their own process groups and would keep
+        # running unsupervised, so kill them and release anyone still waiting on it
+        for event, slot in list(self._waiters.values()):
+            if "exit_code" not in slot:
+                _kill_group(slot.get("pgid"))
+                slot["zygote_exited"] = True
+            event.set()
+
+    def run_script(
+        self, path: Path, args: list[str], cwd: Path, timeout: int
+    ) -> ExecResult | None:
+        """
+        Execute a .py file in a forked child.
+        Returns None if the zygote is unavailable, so callers can fall back.
+        """
+        try:
+            proc = self._ensure_started()
+        except OSError as e:
+            logger.warning("Zygote unavailable: %s", e)
+            return None
+
+        request_id = next(self._ids)
+        event, slot = threading.Event(), {}
+        self._waiters[request_id] = (event, slot)
+
+        with tempfile.TemporaryDirectory(prefix="skill_zygote_") as tmp:
+            out_path, err_path = Path(tmp) / "stdout", Path(tmp) / "stderr"
+            request = {
+                "id": request_id,
+                "path": str(path),
+                "args": args,
+                "cwd": str(cwd),
+                "stdout": str(out_path),
+                "stderr": str(err_path),
+                "timeout": timeout,
+                "memory_limit_mb": self.memory_limit_mb,
+            }
+            try:
+                with self._write_lock:
+                    proc.stdin.write((json.dumps(request) + "\n").encode("utf-8"))
+                    proc.stdin.flush()
+                event.wait(timeout + _RESPONSE_GRACE)
+            except (BrokenPipeError, OSError) as e:
+                logger.warning("Zygote request failed: %s", e)
+                return None
+            finally:
+                self._waiters.pop(request_id, None)
+
+            stdout = out_path.read_text(encoding="utf-8", errors="replace") if out_path.exists() else ""
+            stderr = err_path.read_text(encoding="utf-8", errors="replace") if err_path.exists() else ""
+
+            if "exit_code" not in slot:
+                if slot.get("zygote_exited"):
+                    # The request was delivered, so the script may already have run
+                    # (partly); running it again could repeat its side effects.
+                    logger.warning("Zygote exited mid-request; script stopped, not re-run.")
+                    return ExecResult(
+                        stdout, stderr, None,
+                        error="the executor process exited while the script was running; "
+                              "it was stopped and not re-run",
+                    )
+                _kill_group(slot.get("pgid"))  # zygote is wedged; don't leave the child behind
+                return ExecResult(stdout, stderr, None, timed_out=True)
+
+        return ExecResult(stdout, stderr, slot["exit_code"], timed_out=slot["timed_out"])
+
+    def stop(self) -> None:
+        if self._proc and self._proc.poll() is None:
+            self._proc.stdin.close()  # EOF → zygote kills children and exits
+            try:
+                self._proc.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._proc.kill()
+
+
+def _kill_group(pgid: int | None) -> None:
+    if pgid is None:
+        return
+    try:
+        os.killpg(pgid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+_zygote: Zygote | None = None
+_zygote_lock = threading.Lock()
+
+
+def get_zygote() -> Zygote | None:
+    """Return the shared zygote, or None when disabled or unsupported (no fork)."""
+    global _zygote
+    if not settings.ZYGOTE_ENABLED or not hasattr(os, "fork"):
+        return None
+    with _zygote_lock:
+        if _zygote is None:
+            _zygote = Zygote(
+                preload=[m.strip() for m in settings.ZYGOTE_PRELOAD.split(",") if m.strip()],
+                memory_limit_mb=settings.EXEC_MEMORY_LIMIT_MB,
+            )
+            atexit.register(_zygote.stop)
+        return _zygote
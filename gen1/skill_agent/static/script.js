@@ -31,7 +31,7 @@ document.addEventListener('DOMContentLoaded', () => {
         startTime = Date.now();
 
         try {
-            const response = await fetch('/api/v1/run', {
+            const response = await fetch('/api/v1/jobs', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
@@ -40,21 +40,78 @@ document.addEventListener('DOMContentLoaded', () => {
                 })
             });
 
-            const data = await response.json();
+            const job = await response.json();
+            if (!response.ok) {
+                thinkingMsg.remove();
+                addMessage('system', `❌ Error: ${job.detail || response.statusText}`, 'error');
+                return;
+            }
 
-            // Remove Thinking Animation
+            currentThreadId = job.thread_id;
+            followJob(job.id, thinkingMsg);
+        } catch (error) {
             thinkingMsg.remove();
+            addMessage('system', `❌ Connection failed: ${error.message}`, 'error');
+        }
+    }
 
-            if (data.success) {
-                currentThreadId = data.thread_id;
-                addMessage('agent', data.result);
+    function followJob(jobId, thinkingMsg) {
+        // EventSource reconnects on its own and resumes from Last-Event-ID
+        const events = new EventSource(`/api/v1/jobs/${jobId}/events`);
+        const stepsList = thinkingMsg.querySelector('.thinking-steps');
+        const draft = thinkingMsg.querySelector('.thinking-draft');
+        let pendingTool = null;
+        thinkingMsg.querySelector('.stop-btn').onclick = () => {
+            fetch(`/api/v1/jobs/${jobId}`, { method: 'DELETE' });
+        };
+
+        const addStep = (text) => {
+            const li = document.createElement('li');
+            li.textContent = text;
+            stepsList.appendChild(li);
+            chatHistory.scrollTop = chatHistory.scrollHeight;
+            return li;
+        };
+
+        // LLM output as it is generated; replaced by a step line once the step completes
+        events.addEventListener('token', (e) => {
+            draft.textContent += JSON.parse(e.data).text;
+            draft.classList.remove('hidden');
+            chatHistory.scrollTop = chatHistory.scrollHeight;
+        });
+
+        events.addEventListener('tool', (e) => {
+            const call = JSON.parse(e.data);
+            pendingTool = addStep(`🔧 ${call.tool}…`);
+        });
+
+        events.addEventListener('step', (e) => {
+            const step = JSON.parse(e.data);
+            draft.textContent = '';
+            draft.classList.add('hidden');
+            if (step.kind === 'tool') {
+                const li = pendingTool || addStep('');
+                li.textContent = `🔧 ${step.tool} ✓`;
+                pendingTool = null;
             } else {
-                addMessage('system', `❌ Error: ${data.message}`, 'error');
+                addStep('✅ Final answer ready');
             }
-        } catch (error) {
+        });
+
+        events.addEventListener('status', (e) => {
+            const update = JSON.parse(e.data);
+            if (update.status === 'completed') {
+                addMessage('agent', update.result);
+            } else if (update.status === 'failed') {
+                addMessage('system', `❌ Error: ${update.error}`, 'error');
+            } else if (update.status === 'cancelled') {
+                addMessage('system', '⏹️ Run cancelled.');
+            } else {
+                return;
+            }
+            events.close();
             thinkingMsg.remove();
-            addMessage('system', `❌ Connection failed: ${error.message}`, 'error');
-        }
+        });
     }
 
     function showThinking() {
@@ -66,6 +123,9 @@ document.addEventListener('DOMContentLoaded', () => {
                 <div class="dot-pulse">
                     <span></span><span></span><span></span>
                 </div>
+                <button class="stop-btn" title="Stop this run">Stop</button>
+                <ul class="thinking-steps"></ul>
+                <pre class="thinking-draft hidden"></pre>
             </div>
         `;
         chatHistory.appendChild(msgDiv);
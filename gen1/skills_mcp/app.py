@@ -8,6 +8,11 @@ Endpoints:
   /mcp          → FastMCP streamable HTTP transport (MCP clients)
   /health       → REST health check
   /api/skills   → REST: list skill names
+  /api/jobs     → REST: background script jobs (submit / status / result / cancel)
+  /api/v1/run   → REST: run the Skills crew (bounded worker pool, 503 when saturated);
+                  slash commands and plain skill requests skip the crew, identical
+                  concurrent requests share one run
+  /api/v1/metrics → REST: run queue depth, active runs, crew pool, tool calls, LLM / tool caches, router, coalescing
   /docs         → FastAPI Swagger UI
 
 Transports:
@@ -20,9 +25,11 @@ Usage:
 
 import logging
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.applications import Starlette
 from starlette.middleware import Middleware
@@ -34,7 +41,15 @@ sys.path.append(str(Path(__file__).parent))
 
 # --- Core ---
 from core.settings import settings
-from core.crew import SkillsCrew
+from core.command_router import get_command_router, run_command
+from core.crew_pool import get_crew_pool
+from core.llm import get_llm_cache
+from core.tool_cache import get_tool_cache
+from core.local_tools import get_tool_source
+from core.mcp_pool import close_mcp_pool
+from core.run_executor import ExecutorSaturated, get_run_executor
+from core.single_flight import get_single_flight, run_key
+from core.job_queue import get_job_queue
 
 # --- MCP (imports tools + resources via __init__.py) ---
 import mcp_server  # noqa: F401 — registers all tools + resources
@@ -96,6 +111,24 @@ def health_check():
     }
 
 
+@api.get("/api/v1/metrics", tags=["Monitoring"])
+def get_metrics():
+    """Crew run queue / active runs, crew pool usage, MCP tool calls, LLM and tool cache hits, routed and coalesced runs."""
+    llm_cache = get_llm_cache()
+    tool_cache = get_tool_cache()
+    router = get_command_router()
+    single_flight = get_single_flight()
+    return {
+        "runs": get_run_executor().stats(),
+        "crew_pool": get_crew_pool().stats(),
+        "tools": get_tool_source().stats(),
+        "llm_cache": llm_cache.stats() if llm_cache else None,
+        "tool_cache": tool_cache.stats() if tool_cache else None,
+        "router": router.stats() if router else None,
+        "coalesce": single_flight.stats() if single_flight else None,
+    }
+
+
 @api.get("/api/skills", tags=["Skills"])
 def list_skill_names():
     """Return sorted list of all available skill slugs."""
@@ -104,25 +137,112 @@ def list_skill_names():
     return {"skills": manager.get_skill_names()}
 
 
-# --- CrewAI Integration ---
+# --- Background script jobs ---
 from pydantic import BaseModel, Field
 from typing import Dict, Any
 
+
+class ScriptJobRequest(BaseModel):
+    skill_name: str = Field(..., description="Skill slug.")
+    script_name: str = Field(..., description="Script filename inside scripts/.")
+    script_args: str = Field(default="", description="Space-separated script args.")
+    priority: int = Field(default=0, description="Higher runs first.")
+
+
+@api.post("/api/jobs", tags=["Jobs"], status_code=202)
+def submit_script_job(request: ScriptJobRequest):
+    """Queue a skill script for background execution and return its job handle."""
+    from core.skills_manager import SkillsManager
+    prepared = SkillsManager()._prepare_script(
+        request.skill_name, request.script_name, request.script_args
+    )
+    if isinstance(prepared, str):
+        raise HTTPException(status_code=404, detail=prepared)
+    cmd, cwd = prepared
+    job = get_job_queue().submit(
+        request.skill_name, request.script_name, request.script_args,
+        cmd, cwd, priority=request.priority,
+    )
+    return job.to_dict(include_output=False)
+
+
+@api.get("/api/jobs", tags=["Jobs"])
+def list_script_jobs(limit: int = 50):
+    """Most recent background script jobs, newest first."""
+    return {"jobs": [job.to_dict(include_output=False) for job in get_job_queue().list_jobs(limit)]}
+
+
+@api.get("/api/jobs/{job_id}", tags=["Jobs"])
+def get_script_job_status(job_id: str):
+    """Status of a background script job (without output)."""
+    job = get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return job.to_dict(include_output=False)
+
+
+@api.get("/api/jobs/{job_id}/result", tags=["Jobs"])
+def get_script_job_result(job_id: str):
+    """Full record of a background script job, including stdout and stderr."""
+    job = get_job_queue().get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    if not job.finished:
+        raise HTTPException(status_code=409, detail=f"Job '{job_id}' is still {job.status}.")
+    return job.to_dict()
+
+
+@api.delete("/api/jobs/{job_id}", tags=["Jobs"])
+def cancel_script_job(job_id: str):
+    """Cancel a queued or running background script job."""
+    job = get_job_queue().cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job '{job_id}' not found.")
+    return job.to_dict(include_output=False)
+
+
+# --- CrewAI Integration ---
+
 class RunRequest(BaseModel):
     task_description: str = Field(..., description="Task for the Skills Operator.")
     extra_inputs: Dict[str, Any] = Field(default_factory=dict, description="Additional context.")
     thread_id: str | None = Field(default=None, description="Thread ID.")
 
+def _run_crew(**inputs: Any) -> str:
+    """Blocking part of a run; executes on a run executor thread."""
+    result = run_command(inputs["task_description"])
+    if result is not None:
+        return result
+    with get_crew_pool().lease() as crew:
+        return crew.run(**inputs)
+
+
 @api.post("/api/v1/run", tags=["Execution"])
 async def run_skill_crew(request: RunRequest):
     """Execute the Skill-Driven Operator with a dynamic task."""
-    try:
-        crew = SkillsCrew()
-        result = crew.run(
+    def run():
+        return get_run_executor().submit(
+            _run_crew,
             task_description=request.task_description,
             **request.extra_inputs
         )
+
+    try:
+        # Identical concurrent requests share one run (core/single_flight.py)
+        single_flight = get_single_flight()
+        if single_flight is None:
+            result = await run()
+        else:
+            key = run_key(request.task_description, request.extra_inputs, request.thread_id)
+            result = await single_flight.do(key, run)
         return {"success": True, "result": result}
+    except ExecutorSaturated as e:
+        logger.warning("Rejected run request: %s", e)
+        return JSONResponse(
+            status_code=503,
+            headers={"Retry-After": str(e.retry_after)},
+            content={"success": False, "error": str(e)},
+        )
     except Exception as e:
         logger.error("Error running Skills Crew: %s", str(e), exc_info=True)
         return {"success": False, "error": str(e)}
@@ -134,6 +254,16 @@ async def run_skill_crew(request: RunRequest):
 
 mcp_asgi = mcp.http_app()
 
+
+@asynccontextmanager
+async def lifespan(app):
+    async with mcp_asgi.lifespan(app):
+        yield
+    # Run threads, pooled crews and the MCP client sessions they share
+    get_run_executor().shutdown()
+    get_crew_pool().close()
+    close_mcp_pool()
+
 # ---------------------------------------------------------------------------
 # Root Starlette app — combines FastMCP + FastAPI
 # ---------------------------------------------------------------------------
@@ -151,7 +281,7 @@ app = Starlette(
             allow_headers=["*"],
         )
     ],
-    lifespan=mcp_asgi.lifespan,
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
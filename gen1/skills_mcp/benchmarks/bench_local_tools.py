@@ -0,0 +1,41 @@
+"""
+Benchmark: per-tool-call cost, SSE session pool vs in-process binding.
+
+Uses the stand-in FastMCP server from bench_mcp_pool.py. The same CrewAI
+tools are called through:
+
+- sse:    MCPSessionPool to the server over loopback SSE (JSON-RPC both ways)
+- local:  LocalToolBinding calling the registered functions directly
+
+Usage (from gen1/skills_mcp):
+    python benchmarks/bench_local_tools.py [calls]
+"""
+
+import logging
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.bench_mcp_pool import measure, serve, standin  # noqa: E402
+from core.local_tools import LocalToolBinding  # noqa: E402
+from core.mcp_pool import MCPSessionPool  # noqa: E402
+
+
+def main() -> None:
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    logging.disable(logging.WARNING)
+    pool = MCPSessionPool(serve(), transport="sse", size=2)
+    local = LocalToolBinding(standin)
+
+    for label, source in (("sse", pool), ("local", local)):
+        tools = {tool.name: tool for tool in source.tools()}
+        load_skill = next(tool for name, tool in tools.items() if name.endswith("load_skill"))
+        assert load_skill.run(skill_name="code-review").startswith("# code-review")
+        measure(label, lambda: load_skill.run(skill_name="code-review"), calls)
+
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+Benchmark: MCP client setup per /api/v1/run, fresh adapter vs session pool.
+
+Serves a stand-in FastMCP server (same tool names as mcp_server/tools.py,
+canned results) over SSE on localhost, then measures what a run pays before
+and for its first tool call:
+
+- adapter:  MCPServerAdapter per request (connect + initialize + list_tools),
+            one call, stop()
+- pool:     MCPSessionPool.tools() from cached schemas, one call
+
+It then checks that a tools/list_changed notification refreshes the cached
+schemas and that a dropped session is reconnected on the next call.
+
+Usage (from gen1/skills_mcp):
+    python benchmarks/bench_mcp_pool.py [requests]
+"""
+
+import logging
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, List
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+import uvicorn  # noqa: E402
+from crewai.tools import BaseTool  # noqa: E402
+from crewai_tools import MCPServerAdapter  # noqa: E402
+from fastmcp import Context, FastMCP  # noqa: E402
+from mcp import types  # noqa: E402
+
+from core.mcp_pool import MCPSessionPool  # noqa: E402
+
+standin = FastMCP("skills-standin")
+
+
+@standin.tool
+def skills__list_skills() -> str:
+    """List available skills."""
+    return "- code-review\n- database-design\n- frontend-development"
+
+
+@standin.tool
+def skills__load_skill(skill_name: str) -> str:
+    """Load a skill's SKILL.md."""
+    return f"# {skill_name}\n\nFollow the protocol."
+
+
+@standin.tool
+def skills__read_skill_file(skill_name: str, file_path: str) -> str:
+    """Read a file inside a skill."""
+    return f"{skill_name}/{file_path}"
+
+
+@standin.tool
+def skills__run_skill_script(skill_name: str, script_name: str, script_args: str = "") -> str:
+    """Run a skill script."""
+    return "exit 0"
+
+
+def skills__search_skills(query: str) -> str:
+    """Search skills by keyword (registered by skills__reload)."""
+    return query
+
+
+@standin.tool
+async def skills__reload(ctx: Context) -> str:
+    """Register one more tool and announce the change (for the list_changed check)."""
+    standin.tool(skills__search_skills)
+    await ctx.send_notification(types.ToolListChangedNotification())
+    return "reloaded"
+
+
+def serve() -> str:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    config = uvicorn.Config(standin.http_app(transport="sse"), port=port, log_level="error")
+    server = uvicorn.Server(config)
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.01)
+    return f"http://127.0.0.1:{port}/sse"
+
+
+def list_skills(tools: list) -> BaseTool:
+    # CrewAI sanitizes MCP tool names (skills__list_skills -> skills_list_skills)
+    return next(tool for tool in tools if tool.name.endswith("list_skills"))
+
+
+def measure(label: str, run: Callable[[], None], requests: int) -> None:
+    samples: List[float] = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    print(
+        f"{label:<8} {requests} requests | median {statistics.median(samples):7.2f} ms | "
+        f"max {max(samples):7.2f} ms | total {sum(samples):8.1f} ms"
+    )
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    logging.disable(logging.WARNING)
+    url = serve()
+
+    def adapter() -> None:
+        server = MCPServerAdapter({"url": url, "transport": "sse"})
+        try:
+            assert "code-review" in list_skills(server.tools).run()
+        finally:
+            server.stop()
+
+    pool = MCPSessionPool(url, transport="sse", size=2)
+
+    def pooled() -> None:
+        assert "code-review" in list_skills(pool.tools()).run()
+
+    adapter()  # warm imports / server
+    measure("adapter", adapter, requests)
+    pool.start()
+    measure("pool", pooled, requests)
+
+    version = pool.tools_version
+    pool.call_tool("skills__reload")
+    deadline = time.time() + 5
+    while pool.tools_version == version and time.time() < deadline:
+        time.sleep(0.01)
+    print(
+        f"list_changed refresh: tools_version {version} -> {pool.tools_version} "
+        f"({pool.stats()['tools']} tools)"
+    )
+
+    for slot in pool._slots:  # simulate dropped connections
+        pool._run(pool._disconnect(slot), 10)
+    result = pool.call_tool("skills__list_skills")
+    assert "code-review" in result.content[0].text
+    print(f"after dropping every session: call ok | {pool.stats()}")
+    pool.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,187 @@
+"""
+Command Router
+==============
+Deterministic fast path in front of `SkillsCrew.run`.
+
+Many `/api/v1/run` tasks are mechanical: "run content-idea-generator's
+generate_ideas.py for blogs", "show me the api-development skill". A crew
+kickoff spends LLM iterations (up to `max_iter`) to end up making exactly
+that one SkillsManager call. The router makes the call directly:
+
+- Slash commands (`/skills`, `/search`, `/skill`, `/resources`, `/read`,
+  `/run`, `/help`) always run; a known command with missing arguments
+  returns its usage. Unknown `/words` (e.g. a path) go to the crew.
+- Plain phrasings (`COMMAND_ROUTER_INTENTS`) run only when the pattern
+  matches the whole task and names an existing skill and file.
+
+Anything else falls through to the crew.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from core.settings import settings
+from core.skills_manager import SkillsManager
+
+logger = logging.getLogger(__name__)
+
+# /command → (SkillsManager method, positional arguments); the last argument
+# takes the rest of the line
+SLASH_COMMANDS: dict[str, tuple[str, list[str]]] = {
+    "skills": ("list_skills", []),
+    "search": ("search_skills", ["query"]),
+    "skill": ("load_skill", ["skill_name"]),
+    "load": ("load_skill", ["skill_name"]),
+    "resources": ("list_resources", ["skill_name"]),
+    "read": ("read_resource", ["skill_name", "resource_path"]),
+    "run": ("run_script", ["skill_name", "script_name", "script_args"]),
+}
+OPTIONAL_ARGS = ("script_args",)
+
+COMMAND_HELP = "\n".join([
+    "# Commands",
+    "",
+    "- /skills — list available skills",
+    "- /search <query> — search skills by keyword",
+    "- /skill <slug> — load a skill's instructions (alias: /load)",
+    "- /resources <slug> — list a skill's references and scripts",
+    "- /read <slug> <references/file.md> — read a resource",
+    "- /run <slug> <script.py> [args] — run a skill script",
+    "",
+    "Anything else is handled by the crew.",
+])
+
+_POLITE = r"(?:please |can you |could you )?"
+_SKILL = r"(?P<skill_name>[\w.-]+?)(?:'s|’s)?"
+
+# Each must match the whole (whitespace-normalized) task
+INTENT_PATTERNS: list[tuple[str, re.Pattern[str]]] = [
+    ("list_skills", re.compile(rf"{_POLITE}(?:list|show)(?: me)?(?: all)?(?: the)?(?: available)? skills", re.I)),
+    ("load_skill", re.compile(rf"{_POLITE}(?:show|load|open|display)(?: me)?(?: the)? {_SKILL} skill", re.I)),
+    ("load_skill", re.compile(rf"{_POLITE}(?:show|load|open|display)(?: me)?(?: the)? skill {_SKILL}", re.I)),
+    ("list_resources", re.compile(
+        rf"{_POLITE}(?:list|show)(?: me)?(?: the)? (?:resources|references|scripts|files) (?:of|for|in)(?: the)? "
+        rf"{_SKILL}(?: skill)?",
+        re.I,
+    )),
+    ("read_resource", re.compile(
+        rf"{_POLITE}(?:show|read|open|display)(?: me)?(?: the)? {_SKILL} (?P<resource_path>(?:references|scripts)/[\w./-]+)",
+        re.I,
+    )),
+    ("run_script", re.compile(
+        rf"{_POLITE}(?:run|execute) {_SKILL} (?:scripts/)?(?P<script_name>[\w.-]+\.py)(?: (?:for|with|on) (?P<script_args>.+))?",
+        re.I,
+    )),
+]
+
+
+@dataclass
+class Command:
+    """A SkillsManager call resolved from the task text."""
+
+    action: str
+    args: dict[str, str] = field(default_factory=dict)
+    source: str = "slash"  # slash | intent
+
+
+# ---------------------------------------------------------------------------
+# Router
+# ---------------------------------------------------------------------------
+
+
+class CommandRouter:
+    """Runs slash commands and unambiguous requests on SkillsManager; None means use the crew."""
+
+    def __init__(self, intents: bool = True) -> None:
+        self.intents = intents
+        self.manager = SkillsManager()
+        self._lock = threading.Lock()
+        self._counts = {"slash": 0, "intent": 0, "crew": 0}
+
+    def route(self, task: str) -> Command | str | None:
+        """The command for `task`, a usage / help message, or None for the crew."""
+        text = " ".join(task.split())
+        if text.startswith("/"):
+            return self._parse_slash(text)
+        if self.intents:
+            return self._match_intent(text.rstrip(".!?"))
+        return None
+
+    def _parse_slash(self, text: str) -> Command | str | None:
+        name, _, rest = text[1:].partition(" ")
+        name = name.lower()
+        if name == "help":
+            return COMMAND_HELP
+        if name not in SLASH_COMMANDS:
+            return None
+        action, names = SLASH_COMMANDS[name]
+        values = rest.split(None, len(names) - 1) if names and rest else []
+        required = [n for n in names if n not in OPTIONAL_ARGS]
+        if len(values) < len(required):
+            usage = " ".join(f"[{n}]" if n in OPTIONAL_ARGS else f"<{n}>" for n in names)
+            return f"❌ Usage: /{name} {usage}".rstrip() + "\n\n" + COMMAND_HELP
+        return Command(action, dict(zip(names, values)), source="slash")
+
+    def _match_intent(self, text: str) -> Command | None:
+        for action, pattern in INTENT_PATTERNS:
+            match = pattern.fullmatch(text)
+            if not match:
+                continue
+            args = {k: v for k, v in match.groupdict().items() if v}
+            if "skill_name" in args:
+                relative = args.get("resource_path") or (
+                    f"scripts/{args['script_name']}" if "script_name" in args else ""
+                )
+                if not self.manager.has_skill_file(args["skill_name"], relative):
+                    continue
+            return Command(action, args, source="intent")
+        return None
+
+    def run(self, task: str) -> str | None:
+        """Execute `task` directly if it is a command; None means run the crew."""
+        routed = self.route(task)
+        if routed is None:
+            self._count("crew")
+            return None
+        if isinstance(routed, str):
+            self._count("slash")
+            return routed
+        self._count(routed.source)
+        logger.info("Routed %s command: %s %s", routed.source, routed.action, routed.args)
+        return getattr(self.manager, routed.action)(**routed.args)
+
+    def _count(self, key: str) -> None:
+        with self._lock:
+            self._counts[key] += 1
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"intents": self.intents, **self._counts}
+
+
+# ---------------------------------------------------------------------------
+# Singleton
+# ---------------------------------------------------------------------------
+
+_router: CommandRouter | None = None
+_router_lock = threading.Lock()
+
+
+def get_command_router() -> CommandRouter | None:
+    """Return the shared router, or None when COMMAND_ROUTER_ENABLED is off."""
+    global _router
+    if not settings.COMMAND_ROUTER_ENABLED:
+        return None
+    with _router_lock:
+        if _router is None:
+            _router = CommandRouter(intents=settings.COMMAND_ROUTER_INTENTS)
+        return _router
+
+
+def run_command(task: str) -> str | None:
+    """Result of `task` as a direct command, or None when the crew should handle it."""
+    router = get_command_router()
+    return router.run(task) if router is not None else None
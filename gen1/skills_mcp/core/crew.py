@@ -2,44 +2,48 @@ import logging
 from typing import Any
 from pathlib import Path
 
-from crewai import Agent, Crew, Process, Task, LLM
+from crewai import Agent, Crew, Process, Task
+from crewai.agents.cache import CacheHandler
 from crewai.project import CrewBase, agent, crew, task
-from crewai_tools import MCPServerAdapter
 
+from core.llm import build_llm
+from core.local_tools import LocalToolBinding, get_tool_source
 from core.settings import settings
+from core.skills_manager import SkillsManager
 
 logger = logging.getLogger(__name__)
 
+# {skills_registry} when SKILLS_REGISTRY_IN_PROMPT is off or the registry is unreachable
+REGISTRY_NOT_PROVIDED = "Not provided. Call skills__list_skills() to discover skills."
+
 @CrewBase
 class SkillsCrew:
     """
-    Skill-driven CrewAI crew for the MCP Server using MCPServerAdapter (SSE).
+    Skill-driven CrewAI crew for the MCP Server. Tools are bound in-process when
+    the crew runs next to the server, otherwise through pooled MCP sessions (SSE).
     """
 
     agents_config = "../config/agents.yaml"
     tasks_config = "../config/tasks.yaml"
 
     def __init__(self) -> None:
-        self.llm = LLM(model=settings.LLM_MODEL)
-        
-        # Configure the MCP Server connection (SSE / streamable-http)
-        # Instead of Stdio, we connect to the running server's SSE endpoint.
-        self.mcp_adapter = MCPServerAdapter(
-            name="SkillsMCPServer",
-            server_params={
-                "transport": "sse",
-                "url": settings.MCP_SSE_URL
-            }
-        )
-        
-        logger.info("SkillsCrew initialized for MCP-over-HTTP (SSE) at %s", settings.MCP_SSE_URL)
+        # Provider model or offline stand-in, behind the completion cache (core/llm.py)
+        self.llm = build_llm()
+
+        # In-process FastMCP functions (core/local_tools.py) or the worker's
+        # long-lived MCP sessions (core/mcp_pool.py); no per-crew handshake either way.
+        self.tool_source = get_tool_source()
+        self.tool_source.start()
+        self.tools_version = 0
+        self.skills_manager = SkillsManager()
+
+        logger.info("SkillsCrew initialized with %s tools", type(self.tool_source).__name__)
 
     @agent
     def skills_operator(self) -> Agent:
-        # Load tools from the MCP Server via the adapter
-        # This will connect to the SSE endpoint and fetch tool definitions
-        mcp_tools = self.mcp_adapter.get_tools()
-        
+        self.tools_version = self.tool_source.tools_version
+        mcp_tools = self.tool_source.tools()
+
         return Agent(
             config=self.agents_config["skills_operator"],
             tools=mcp_tools,
@@ -64,13 +68,49 @@ class SkillsCrew:
             verbose=True,
         )
 
+    def reset(self) -> None:
+        """Give a pooled crew an empty tool-result cache and the current MCP tool list."""
+        crew = self.crew()
+        cache_handler = CacheHandler()
+        crew._cache_handler = cache_handler
+        for crew_agent in crew.agents:
+            crew_agent.set_cache_handler(cache_handler)
+
+        # The server's tool list changed since this crew was built
+        if self.tools_version != self.tool_source.tools_version:
+            self.tools_version = self.tool_source.tools_version
+            tools = self.tool_source.tools()
+            for crew_agent in crew.agents:
+                crew_agent.tools = tools
+
+    def skills_registry(self) -> str:
+        """
+        Skill list for the task prompt, saving the agent a skills__list_skills
+        round trip. In-process it is the compact summary from the shared tool
+        cache; against a remote server it is that server's list_skills output.
+        """
+        if not settings.SKILLS_REGISTRY_IN_PROMPT:
+            return REGISTRY_NOT_PROVIDED
+        if isinstance(self.tool_source, LocalToolBinding):
+            return self.skills_manager.registry_summary()
+        try:
+            result = self.tool_source.call_tool("skills__list_skills", {})
+        except Exception as e:
+            logger.warning("Could not fetch the skills registry: %s", e)
+            return REGISTRY_NOT_PROVIDED
+        if result.isError:
+            return REGISTRY_NOT_PROVIDED
+        return "\n".join(getattr(item, "text", "") for item in result.content)
+
     def run(self, task_description: str, chat_history: str = "No previous context.", **extra_inputs: Any) -> str:
         inputs = {
             "task_description": task_description,
             "chat_history": chat_history,
+            "skills_registry": self.skills_registry(),
             **extra_inputs
         }
-        logger.info("Kicking off SkillsCrew (SSE) with inputs: %s", inputs)
+        logger.info("Kicking off SkillsCrew for task: %s", task_description)
         
+        self.reset()
         result = self.crew().kickoff(inputs=inputs)
         return result.raw
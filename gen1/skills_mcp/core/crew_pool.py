@@ -0,0 +1,133 @@
+"""
+Crew Pool
+=========
+Per-worker pool of fully built SkillsCrew instances.
+
+Building a crew means an LLM client, CrewAI tools for every MCP tool and
+the agent/task/crew objects. The pool builds each instance once and leases
+it to one request at a time, so concurrent requests never share a crew's
+kickoff state. When every instance is busy a new one is built rather than
+blocking; at most `max_idle` are kept for reuse. Instances whose run raised
+are discarded. MCP connections are not owned by crews but shared through
+`core/mcp_pool.py`.
+
+The pool is not warmed at startup: unless its tools are bound in-process,
+the crew connects to this very server over SSE, which is not accepting
+connections until the lifespan finishes.
+"""
+
+import contextlib
+import logging
+import threading
+import time
+from typing import Callable, Generic, Iterator, TypeVar
+
+from core.crew import SkillsCrew
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+class CrewPool(Generic[T]):
+    """Lease-based pool of reusable crews built by `factory`."""
+
+    def __init__(
+        self,
+        factory: Callable[[], T],
+        max_idle: int,
+        close: Callable[[T], None] | None = None,
+    ) -> None:
+        self._factory = factory
+        self._close = close
+        self.max_idle = max(1, max_idle)
+        self._idle: list[T] = []
+        self._lock = threading.Lock()
+        self.built = 0
+        self.leased = 0
+        self.reused = 0
+        self.discarded = 0
+        self.build_seconds = 0.0
+
+    def _build(self) -> T:
+        start = time.perf_counter()
+        instance = self._factory()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.built += 1
+            self.build_seconds += elapsed
+        logger.info("Crew pool built an instance in %.0f ms", elapsed * 1000)
+        return instance
+
+    def _discard(self, instance: T) -> None:
+        with self._lock:
+            self.discarded += 1
+        if self._close:
+            try:
+                self._close(instance)
+            except Exception as e:
+                logger.warning("Error closing pooled crew: %s", e)
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[T]:
+        """Hand out an idle crew (or a new one) for the duration of one request."""
+        with self._lock:
+            instance = self._idle.pop() if self._idle else None
+            self.leased += 1
+            if instance is not None:
+                self.reused += 1
+        if instance is None:
+            instance = self._build()
+
+        try:
+            yield instance
+        except BaseException:
+            self._discard(instance)  # kickoff state after a failure is unknown
+            raise
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(instance)
+                return
+        self._discard(instance)
+
+    def close(self) -> None:
+        """Close every idle crew (call on shutdown)."""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for instance in idle:
+            self._discard(instance)
+
+    def stats(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "idle": len(self._idle),
+                "built": self.built,
+                "leased": self.leased,
+                "reused": self.reused,
+                "discarded": self.discarded,
+                "avg_build_ms": round(1000 * self.build_seconds / self.built, 1) if self.built else 0.0,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_pool: CrewPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_crew_pool() -> CrewPool:
+    """Return this worker's SkillsCrew pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = CrewPool(SkillsCrew, max_idle=settings.CREW_POOL_SIZE)
+        return _pool
@@ -0,0 +1,506 @@
+"""
+Script Job Queue
+================
+Background execution for long-running skill scripts.
+
+Jobs are persisted in a local SQLite table (so handles survive a restart),
+executed by a bounded pool of worker threads in priority order, and can be
+cancelled while queued or running. Zero dependency on MCP or FastAPI.
+
+Several server processes can share one table. A worker claims a queued job
+with a conditional UPDATE, so each job runs once; the owning process keeps
+a heartbeat on it, and a running job whose heartbeat is older than
+`JOB_LEASE_SECONDS` (its process died) is failed by whichever process sees
+it first. Cancellation is a flag in the table that the owner polls.
+"""
+
+import json
+import logging
+import os
+import socket
+import sqlite3
+import subprocess
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Job lifecycle states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (COMPLETED, FAILED, CANCELLED)
+
+# Stored stdout/stderr are capped so one chatty script cannot bloat the table
+MAX_OUTPUT_CHARS = 200_000
+
+# How often idle workers look for queued jobs submitted by other processes,
+# and how often a running job's worker checks its cancellation flag
+POLL_SECONDS = 1.0
+
+
+# ---------------------------------------------------------------------------
+# Job record
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class ScriptJob:
+    """A single background script execution."""
+
+    id: str
+    skill_name: str
+    script_name: str
+    script_args: str
+    cmd: list[str]
+    cwd: str
+    priority: int
+    status: str
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    returncode: int | None = None
+    stdout: str = ""
+    stderr: str = ""
+    error: str | None = None
+    cancel_requested: bool = False
+    worker_id: str | None = field(default=None, repr=False)
+    heartbeat_at: float | None = field(default=None, repr=False)
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATES
+
+    def to_dict(self, include_output: bool = True) -> dict[str, Any]:
+        data = asdict(self)
+        data.pop("cmd")
+        data.pop("worker_id")
+        data.pop("heartbeat_at")
+        if not include_output:
+            data.pop("stdout")
+            data.pop("stderr")
+        return data
+
+
+_COLUMNS = (
+    "id", "skill_name", "script_name", "script_args", "cmd", "cwd", "priority",
+    "status", "created_at", "started_at", "finished_at", "returncode",
+    "stdout", "stderr", "error", "cancel_requested", "worker_id", "heartbeat_at",
+)
+
+# Columns added after the first release; older tables get them on open
+_ADDED_COLUMNS = {
+    "cancel_requested": "INTEGER NOT NULL DEFAULT 0",
+    "worker_id": "TEXT",
+    "heartbeat_at": "REAL",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id          TEXT PRIMARY KEY,
+    skill_name  TEXT NOT NULL,
+    script_name TEXT NOT NULL,
+    script_args TEXT NOT NULL,
+    cmd         TEXT NOT NULL,
+    cwd         TEXT NOT NULL,
+    priority    INTEGER NOT NULL,
+    status      TEXT NOT NULL,
+    created_at  REAL NOT NULL,
+    started_at  REAL,
+    finished_at REAL,
+    returncode  INTEGER,
+    stdout      TEXT NOT NULL DEFAULT '',
+    stderr      TEXT NOT NULL DEFAULT '',
+    error       TEXT,
+    cancel_requested INTEGER NOT NULL DEFAULT 0,
+    worker_id   TEXT,
+    heartbeat_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Queue
+# ---------------------------------------------------------------------------
+
+
+class ScriptJobQueue:
+    """
+    Persistent, priority-ordered job queue backed by SQLite.
+    Higher `priority` runs first; ties run in submission order.
+    Worker threads start with the queue and claim jobs from the table, so
+    jobs submitted by other processes sharing it are picked up too.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        workers: int,
+        timeout: int,
+        history_limit: int,
+        lease: float = 60.0,
+    ) -> None:
+        self._db_path = db_path
+        self._workers = max(1, workers)
+        self._timeout = timeout
+        self._history_limit = history_limit
+        self._lease = max(1.0, lease)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+
+        self._db_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._procs: dict[str, subprocess.Popen] = {}
+        self._state_lock = threading.Lock()
+        self._threads: list[threading.Thread] = []
+
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._db_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA busy_timeout=5000")
+            self._conn.executescript(_SCHEMA)
+            existing = {row["name"] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            for name, ddl in _ADDED_COLUMNS.items():
+                if name not in existing:
+                    self._conn.execute(f"ALTER TABLE jobs ADD COLUMN {name} {ddl}")
+        self._recover()
+        self._ensure_workers()
+        self._heartbeat = threading.Thread(
+            target=self._heartbeat_loop, name="script-job-heartbeat", daemon=True
+        )
+        self._heartbeat.start()
+
+    # ------------------------------------------------------------------
+    # Persistence helpers
+    # ------------------------------------------------------------------
+
+    def _row_to_job(self, row: sqlite3.Row) -> ScriptJob:
+        data = dict(row)
+        data["cmd"] = json.loads(data["cmd"])
+        data["cancel_requested"] = bool(data["cancel_requested"])
+        return ScriptJob(**data)
+
+    def _get(self, job_id: str) -> ScriptJob | None:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT * FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return self._row_to_job(row) if row else None
+
+    def _finish(self, job_id: str, status: str, **fields: Any) -> bool:
+        """
+        Record the outcome of a job this process is running. A no-op (False)
+        if it no longer owns it, e.g. its lease expired and it was failed.
+        """
+        fields = {"status": status, "finished_at": time.time(), **fields}
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self._db_lock, self._conn:
+            cursor = self._conn.execute(
+                f"UPDATE jobs SET {assignments} WHERE id = ? AND status = ? AND worker_id = ?",
+                (*fields.values(), job_id, RUNNING, self.worker_id),
+            )
+        if not cursor.rowcount:
+            logger.warning("Script job %s is no longer ours; %s result dropped.", job_id, status)
+        return bool(cursor.rowcount)
+
+    def _recover(self) -> None:
+        """
+        Fail running jobs whose worker is gone: a process on this host that no
+        longer exists, or any worker that stopped heartbeating.
+        """
+        now = time.time()
+        host = socket.gethostname()
+        with self._db_lock, self._conn:
+            rows = self._conn.execute(
+                "SELECT id, worker_id FROM jobs WHERE status = ? AND worker_id LIKE ?",
+                (RUNNING, f"{host}:%"),
+            ).fetchall()
+            dead = []
+            for row in rows:
+                pid = row["worker_id"].rpartition(":")[2]
+                if row["worker_id"] != self.worker_id and pid.isdigit() and not _pid_alive(int(pid)):
+                    dead.append(row["id"])
+            failed = 0
+            for job_id in dead:
+                failed += self._conn.execute(
+                    "UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE id = ? AND status = ?",
+                    (FAILED, now, "Interrupted by server restart.", job_id, RUNNING),
+                ).rowcount
+            failed += self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, error = ? "
+                "WHERE status = ? AND COALESCE(heartbeat_at, started_at, 0) < ?",
+                (FAILED, now, "Interrupted: its worker stopped responding.", RUNNING, now - self._lease),
+            ).rowcount
+        if failed:
+            logger.info("Failed %d script job(s) whose worker is gone.", failed)
+
+    def _prune(self) -> None:
+        """Drop the oldest finished jobs beyond the history limit."""
+        placeholders = ", ".join("?" for _ in FINISHED_STATES)
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                f"""
+                DELETE FROM jobs WHERE id IN (
+                    SELECT id FROM jobs WHERE status IN ({placeholders})
+                    ORDER BY finished_at DESC LIMIT -1 OFFSET ?
+                )
+                """,
+                (*FINISHED_STATES, self._history_limit),
+            )
+
+    # ------------------------------------------------------------------
+    # Public interface
+    # ------------------------------------------------------------------
+
+    def submit(
+        self,
+        skill_name: str,
+        script_name: str,
+        script_args: str,
+        cmd: list[str],
+        cwd: Path,
+        priority: int = 0,
+    ) -> ScriptJob:
+        job = ScriptJob(
+            id=uuid.uuid4().hex[:12],
+            skill_name=skill_name,
+            script_name=script_name,
+            script_args=script_args,
+            cmd=cmd,
+            cwd=str(cwd),
+            priority=priority,
+            status=QUEUED,
+            created_at=time.time(),
+        )
+        row = asdict(job)
+        row["cmd"] = json.dumps(cmd)
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                f"INSERT INTO jobs ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' for _ in _COLUMNS)})",
+                tuple(row[col] for col in _COLUMNS),
+            )
+        self._wake.set()
+        logger.info(
+            "Queued script job %s: %s/%s (priority=%d)",
+            job.id, skill_name, script_name, priority,
+        )
+        return job
+
+    def get(self, job_id: str) -> ScriptJob | None:
+        return self._get(job_id)
+
+    def list_jobs(self, limit: int = 50) -> list[ScriptJob]:
+        with self._db_lock:
+            rows = self._conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def queue_depth(self) -> int:
+        with self._db_lock:
+            (depth,) = self._conn.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status = ?", (QUEUED,)
+            ).fetchone()
+        return depth
+
+    def cancel(self, job_id: str) -> ScriptJob | None:
+        """
+        Cancel a queued job, or flag a running one; its worker (in whichever
+        process) kills the script within POLL_SECONDS. Finished jobs are left as-is.
+        """
+        with self._db_lock, self._conn:
+            cancelled = self._conn.execute(
+                "UPDATE jobs SET status = ?, finished_at = ?, cancel_requested = 1 "
+                "WHERE id = ? AND status = ?",
+                (CANCELLED, time.time(), job_id, QUEUED),
+            ).rowcount
+            if not cancelled:
+                self._conn.execute(
+                    "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = ?",
+                    (job_id, RUNNING),
+                )
+
+        with self._state_lock:
+            proc = self._procs.get(job_id)
+        if proc is not None:
+            proc.kill()  # running here: no need to wait for the next poll
+        logger.info("Cancellation requested for script job %s.", job_id)
+        return self._get(job_id)
+
+    def _cancel_requested(self, job_id: str) -> bool:
+        with self._db_lock:
+            row = self._conn.execute(
+                "SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return bool(row and row["cancel_requested"])
+
+    # ------------------------------------------------------------------
+    # Worker pool
+    # ------------------------------------------------------------------
+
+    def _ensure_workers(self) -> None:
+        with self._state_lock:
+            self._threads = [t for t in self._threads if t.is_alive()]
+            while len(self._threads) < self._workers:
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    name=f"script-job-worker-{len(self._threads)}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+    def _heartbeat_loop(self) -> None:
+        """Renew the lease on this process's running jobs and fail expired ones."""
+        while True:
+            time.sleep(self._lease / 3)
+            try:
+                with self._db_lock, self._conn:
+                    self._conn.execute(
+                        "UPDATE jobs SET heartbeat_at = ? WHERE worker_id = ? AND status = ?",
+                        (time.time(), self.worker_id, RUNNING),
+                    )
+                self._recover()
+            except sqlite3.Error as exc:
+                logger.warning("Script job heartbeat failed: %s", exc)
+
+    def _claim(self) -> ScriptJob | None:
+        """Move the next queued job to running for this process; None if there is none."""
+        while True:
+            with self._db_lock, self._conn:
+                row = self._conn.execute(
+                    "SELECT id FROM jobs WHERE status = ? ORDER BY priority DESC, created_at LIMIT 1",
+                    (QUEUED,),
+                ).fetchone()
+                if row is None:
+                    return None
+                now = time.time()
+                # Only succeeds if no other worker (in any process) claimed it first
+                claimed = self._conn.execute(
+                    "UPDATE jobs SET status = ?, started_at = ?, heartbeat_at = ?, worker_id = ? "
+                    "WHERE id = ? AND status = ?",
+                    (RUNNING, now, now, self.worker_id, row["id"], QUEUED),
+                ).rowcount
+            if claimed:
+                return self._get(row["id"])
+
+    def _worker_loop(self) -> None:
+        while True:
+            try:
+                job = self._claim()
+            except sqlite3.Error as exc:
+                logger.warning("Could not claim a script job: %s", exc)
+                job = None
+            if job is None:
+                self._wake.wait(POLL_SECONDS)
+                self._wake.clear()
+                continue
+            try:
+                self._execute(job)
+            except Exception as exc:
+                logger.exception("Script job %s crashed the worker: %s", job.id, exc)
+                self._finish(job.id, FAILED, error=str(exc))
+
+    def _execute(self, job: ScriptJob) -> None:
+        with self._state_lock:
+            try:
+                proc = subprocess.Popen(
+                    job.cmd,
+                    cwd=job.cwd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                )
+            except Exception as exc:
+                self._finish(job.id, FAILED, error=str(exc))
+                return
+            self._procs[job.id] = proc
+
+        logger.info("Running script job %s: %s", job.id, " ".join(job.cmd))
+        error = None
+        cancelled = False
+        deadline = time.monotonic() + self._timeout
+        try:
+            while True:
+                try:
+                    wait = min(POLL_SECONDS, deadline - time.monotonic())
+                    stdout, stderr = proc.communicate(timeout=max(0.01, wait))
+                    break
+                except subprocess.TimeoutExpired:
+                    if self._cancel_requested(job.id):
+                        cancelled = True
+                    elif time.monotonic() >= deadline:
+                        error = f"Script timed out after {self._timeout}s."
+                    else:
+                        continue
+                    proc.kill()
+                    stdout, stderr = proc.communicate()
+                    break
+        finally:
+            with self._state_lock:
+                self._procs.pop(job.id, None)
+
+        # Killed by cancel() in this process before the poll noticed
+        cancelled = cancelled or self._cancel_requested(job.id)
+        if cancelled:
+            status = CANCELLED
+        elif error:
+            status = FAILED
+        else:
+            status = COMPLETED
+
+        self._finish(
+            job.id,
+            status,
+            returncode=proc.returncode,
+            stdout=(stdout or "")[:MAX_OUTPUT_CHARS],
+            stderr=(stderr or "")[:MAX_OUTPUT_CHARS],
+            error=error,
+        )
+        logger.info("Script job %s finished: %s (exit %s)", job.id, status, proc.returncode)
+        self._prune()
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_queue: ScriptJobQueue | None = None
+_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> ScriptJobQueue:
+    """Return the shared job queue, creating it on first use."""
+    global _queue
+    with _queue_lock:
+        if _queue is None:
+            _queue = ScriptJobQueue(
+                db_path=settings.JOBS_DB_PATH,
+                workers=settings.JOB_WORKERS,
+                timeout=settings.SCRIPT_TIMEOUT,
+                history_limit=settings.JOB_HISTORY_LIMIT,
+                lease=settings.JOB_LEASE_SECONDS,
+            )
+        return _queue
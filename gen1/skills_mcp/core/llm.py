@@ -0,0 +1,373 @@
+"""
+Crew LLM
+========
+The LLM the crew talks to, behind a completion cache.
+
+Regression runs and repeated prompts otherwise pay for the same completion
+every time. `CachedLLM` wraps any CrewAI LLM and stores text completions
+under a key built from the model, sampling settings, tool schemas and the
+messages with whitespace collapsed. `CompletionCache` keeps them in a memory
+LRU with an optional SQLite tier (shared between workers, kept across
+restarts); both expire entries after `LLM_CACHE_TTL`. Anything with the same
+`get` / `set` / `stats` methods can be plugged in instead.
+
+`LLM_MODEL=standin` (or `standin/<script.yaml>`) selects `StandInLLM`, a
+deterministic scripted model, so the whole `/api/v1/run` path can be
+load-tested and benchmarked offline.
+"""
+
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import yaml
+from crewai import LLM, BaseLLM
+from crewai.events import crewai_event_bus
+from crewai.events.types.llm_events import LLMStreamChunkEvent
+from pydantic import Field
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+STANDIN_PREFIX = "standin"
+
+# Used when LLM_MODEL=standin (no script): answer every task in one step
+DEFAULT_STANDIN_SCRIPT: dict[str, Any] = {
+    "rules": [],
+    "default": ["Thought: I now know the final answer\nFinal Answer: Stand-in answer (turn {turn})."],
+}
+
+# Characters per streamed chunk when the stand-in model streams
+STANDIN_CHUNK_CHARS = 16
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS completions (
+    key        TEXT PRIMARY KEY,
+    value      TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completions_expiry ON completions (expires_at);
+"""
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class CompletionCache:
+    """Memory LRU of completions with an optional SQLite tier; disk hits are promoted."""
+
+    def __init__(self, ttl: float, max_entries: int, disk_path: Path | None = None) -> None:
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self.hits = self.misses = 0
+        if disk_path is not None:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(disk_path), check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> str | None:
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry and entry[0] > now:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self._memory.pop(key, None)
+            if self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT value, expires_at FROM completions WHERE key = ? AND expires_at > ?",
+                    (key, now),
+                ).fetchone()
+                if row:
+                    self._remember(key, row[1], row[0])
+                    self.hits += 1
+                    return row[0]
+            self.misses += 1
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(key, expires_at, value)
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO completions (key, value, expires_at) VALUES (?, ?, ?)",
+                        (key, value, expires_at),
+                    )
+                    self._conn.execute("DELETE FROM completions WHERE expires_at <= ?", (time.time(),))
+
+    def _remember(self, key: str, expires_at: float, value: str) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full. Caller holds the lock."""
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM completions")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {"entries": len(self._memory), "hits": self.hits, "misses": self.misses}
+
+
+def completion_key(
+    model: str,
+    messages: Any,
+    tools: list[dict[str, Any]] | None = None,
+    stop: list[str] | None = None,
+    temperature: float | None = None,
+    response_model: Any = None,
+) -> str:
+    """Model, sampling settings, tool schemas and whitespace-normalized messages, hashed."""
+    if isinstance(messages, str):
+        messages = [{"role": "user", "content": messages}]
+    normalized = [
+        {
+            "role": message.get("role"),
+            "content": " ".join(c.split()) if isinstance(c := message.get("content"), str) else c,
+            **{k: message[k] for k in ("name", "tool_calls", "tool_call_id") if message.get(k)},
+        }
+        for message in messages
+    ]
+    payload = {
+        "model": model,
+        "temperature": temperature,
+        "stop": sorted(stop or []),
+        "tools": tools or [],
+        "response_model": getattr(response_model, "__name__", None),
+        "messages": normalized,
+    }
+    blob = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# LLM wrappers
+# ---------------------------------------------------------------------------
+
+
+def _as_messages(messages: Any) -> list[dict[str, Any]]:
+    """Messages as role / content dicts (CrewAI may also pass a bare prompt string)."""
+    if isinstance(messages, str):
+        return [{"role": "user", "content": messages}]
+    return list(messages)
+
+
+def _emit_chunk(source: BaseLLM, chunk: str, call_id: str, from_task: Any, from_agent: Any) -> None:
+    """Publish one stream chunk on the CrewAI event bus, where job event streams listen."""
+    crewai_event_bus.emit(
+        source,
+        event=LLMStreamChunkEvent(chunk=chunk, call_id=call_id, from_task=from_task, from_agent=from_agent),
+    )
+
+
+class CachedLLM(BaseLLM):
+    """
+    Completion cache in front of any CrewAI LLM. Only text completions are
+    cached; tool-call responses and structured outputs pass through. Hits are
+    replayed as one stream chunk when the wrapped LLM streams.
+    """
+
+    llm_type: str = "cached"
+    inner: Any = None
+    cache: Any = Field(default=None, exclude=True)
+
+    def __init__(self, inner: BaseLLM, cache: Any) -> None:
+        # Public BaseLLM arguments only; the rest is set as attributes, which
+        # works whether BaseLLM is a plain class or a pydantic model
+        super().__init__(model=inner.model, temperature=inner.temperature, stop=list(inner.stop or []))
+        self.inner = inner
+        self.cache = cache
+        self.stream = getattr(inner, "stream", False)
+
+    def call(
+        self,
+        messages: Any,
+        tools: list[dict[str, Any]] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any = None,
+        from_agent: Any = None,
+        response_model: Any = None,
+    ) -> Any:
+        # The agent sets its stop words on this LLM: as `stop`, or scoped to the
+        # call and read back through `stop_sequences` on newer CrewAI releases
+        stop = list(getattr(self, "stop_sequences", self.stop) or [])
+        key = completion_key(
+            self.inner.model, messages, tools, stop, self.inner.temperature, response_model
+        )
+        cached = self.cache.get(key)
+        if isinstance(cached, str):
+            if self.stream:
+                _emit_chunk(self, cached, uuid.uuid4().hex, from_task, from_agent)
+            return cached
+
+        # Each crew has its own wrapped LLM, so setting its stop words is not shared
+        self.inner.stop = stop
+        result = self.inner.call(
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model,
+        )
+        if isinstance(result, str) and result.strip():
+            self.cache.set(key, result)
+        return result
+
+    def supports_function_calling(self) -> bool:
+        return getattr(self.inner, "supports_function_calling", lambda: False)()
+
+    def supports_stop_words(self) -> bool:
+        return self.inner.supports_stop_words()
+
+    def get_context_window_size(self) -> int:
+        return self.inner.get_context_window_size()
+
+    def get_token_usage_summary(self) -> Any:
+        return self.inner.get_token_usage_summary()
+
+
+class StandInLLM(BaseLLM):
+    """
+    Deterministic offline model (CrewAI ReAct text format). Script:
+
+        latency_ms: 200            # per completion
+        rules:
+          - match: "gross margin"  # regex searched in the first user message (the task)
+            responses: ["Thought: ...\\nAction: ...\\nAction Input: {...}", "Thought: ...\\nFinal Answer: ..."]
+        default: ["Thought: ...\\nFinal Answer: ..."]
+
+    Response N answers the Nth agent turn (the last one repeats); "{turn}" is
+    replaced by the turn number.
+    """
+
+    llm_type: str = "standin"
+    script: dict[str, Any] = Field(default_factory=lambda: dict(DEFAULT_STANDIN_SCRIPT))
+    latency: float = 0.0
+    calls: int = 0
+
+    def __init__(
+        self,
+        model: str,
+        script: dict[str, Any] | None = None,
+        latency: float = 0.0,
+        stream: bool = False,
+    ) -> None:
+        super().__init__(model=model)
+        self.script = script if script is not None else dict(DEFAULT_STANDIN_SCRIPT)
+        self.latency = latency
+        self.stream = stream
+        self.calls = 0
+
+    @classmethod
+    def from_model(cls, model: str, stream: bool = False) -> "StandInLLM":
+        _, _, script_path = model.partition("/")
+        script = DEFAULT_STANDIN_SCRIPT
+        if script_path:
+            script = yaml.safe_load(Path(script_path).read_text(encoding="utf-8")) or {}
+        latency_ms = script.get("latency_ms", settings.STANDIN_LLM_LATENCY_MS)
+        return cls(model=model, script=script, latency=latency_ms / 1000, stream=stream)
+
+    def _respond(self, messages: list[dict[str, Any]]) -> str:
+        task = next((str(m.get("content", "")) for m in messages if m.get("role") == "user"), "")
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+        responses = self.script.get("default") or DEFAULT_STANDIN_SCRIPT["default"]
+        for rule in self.script.get("rules", []):
+            if re.search(rule["match"], task, re.IGNORECASE):
+                responses = rule["responses"]
+                break
+        return responses[min(turn, len(responses) - 1)].replace("{turn}", str(turn))
+
+    def call(
+        self,
+        messages: Any,
+        tools: list[dict[str, Any]] | None = None,
+        callbacks: list[Any] | None = None,
+        available_functions: dict[str, Any] | None = None,
+        from_task: Any = None,
+        from_agent: Any = None,
+        response_model: Any = None,
+    ) -> str:
+        self.calls += 1
+        text = self._respond(_as_messages(messages))
+        if not self.stream:
+            time.sleep(self.latency)
+            return text
+        chunks = [text[i:i + STANDIN_CHUNK_CHARS] for i in range(0, len(text), STANDIN_CHUNK_CHARS)]
+        call_id = uuid.uuid4().hex
+        for chunk in chunks:
+            time.sleep(self.latency / len(chunks))
+            _emit_chunk(self, chunk, call_id, from_task, from_agent)
+        return text
+
+    def supports_function_calling(self) -> bool:
+        return False
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def is_standin(model: str) -> bool:
+    return model == STANDIN_PREFIX or model.startswith(STANDIN_PREFIX + "/")
+
+
+_cache: CompletionCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_cache() -> CompletionCache | None:
+    """Return the shared completion cache, or None when LLM_CACHE_ENABLED is off."""
+    global _cache
+    if not settings.LLM_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = CompletionCache(
+                ttl=settings.LLM_CACHE_TTL,
+                max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+                disk_path=settings.LLM_CACHE_PATH if settings.LLM_CACHE_DISK else None,
+            )
+        return _cache
+
+
+def set_llm_cache(cache: CompletionCache | None) -> None:
+    """Swap the shared completion cache, e.g. for a temporary one in benchmarks."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
+
+
+def build_llm() -> BaseLLM:
+    """The crew LLM for LLM_MODEL (provider model or stand-in), behind the completion cache."""
+    model = settings.LLM_MODEL
+    llm: BaseLLM = StandInLLM.from_model(model) if is_standin(model) else LLM(model=model)
+    cache = get_llm_cache()
+    return CachedLLM(llm, cache) if cache is not None else llm
@@ -0,0 +1,151 @@
+"""
+Local Tool Binding
+==================
+CrewAI tools bound straight to the FastMCP tool functions of this process.
+
+When the crew runs inside the same app that serves `/mcp`, talking to it
+over SSE means every tool call is JSON-encoded, sent through the loopback
+stack, decoded by the server and back again. `LocalToolBinding` reads the
+tool registry of the in-process FastMCP server once and calls each tool's
+Python function directly. Names, descriptions and argument schemas are the
+ones MCP clients see, and results are wrapped the same way, so the agent
+cannot tell the difference.
+
+`get_tool_source()` picks the binding: `local` when `MCP_SSE_URL` points at
+this server (or `MCP_TOOL_BINDING=local`), otherwise the SSE session pool.
+"""
+
+import asyncio
+import inspect
+import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any
+from urllib.parse import urlparse
+
+from crewai.tools import BaseTool
+from crewai_tools.adapters.mcp_adapter import CrewAIToolAdapter
+from mcp import types
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LOOPBACK_HOSTS = {"localhost", "127.0.0.1", "::1", "0.0.0.0", "::"}
+
+
+def _run_coroutine(coro) -> Any:
+    """Run a coroutine to completion even when called from inside an event loop."""
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+# ---------------------------------------------------------------------------
+# Binding
+# ---------------------------------------------------------------------------
+
+
+class LocalToolBinding:
+    """In-process replacement for MCPSessionPool (same start / tools / call_tool surface)."""
+
+    def __init__(self, server) -> None:
+        self.server = server
+        self.tools_version = 0
+        self._functions: dict[str, Any] = {}
+        self._templates: list[BaseTool] = []
+        self._adapter = CrewAIToolAdapter()
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.errors = 0
+
+    async def _registered_tools(self) -> list:
+        if hasattr(self.server, "get_tools"):  # fastmcp 2.x
+            return list((await self.server.get_tools()).values())
+        return list(await self.server.list_tools())
+
+    def start(self) -> None:
+        """Read the server's tool registry once. Idempotent."""
+        with self._lock:
+            if self.tools_version:
+                return
+            registered = _run_coroutine(self._registered_tools())
+            templates = []
+            for tool in registered:
+                schema = types.Tool(
+                    name=tool.name,
+                    description=tool.description,
+                    inputSchema=tool.parameters,
+                )
+                self._functions[tool.name] = tool.fn
+                templates.append(self._adapter.adapt(partial(self.call_tool, tool.name), schema))
+            self._templates = templates
+            self.tools_version = 1
+        logger.info("Local tool binding: %d in-process tools", len(templates))
+
+    def tools(self) -> list[BaseTool]:
+        """Fresh CrewAI tool instances for one crew."""
+        self.start()
+        return [tool.model_copy() for tool in self._templates]
+
+    def call_tool(self, name: str, arguments: dict | None = None) -> types.CallToolResult:
+        self.start()
+        self.calls += 1
+        try:
+            result = self._functions[name](**(arguments or {}))
+            if inspect.isawaitable(result):
+                result = _run_coroutine(result)
+        except Exception as e:
+            self.errors += 1
+            logger.warning("Local tool '%s' failed: %s", name, e)
+            return types.CallToolResult(
+                content=[types.TextContent(type="text", text=f"Error calling tool '{name}': {e}")],
+                isError=True,
+            )
+        text = result if isinstance(result, str) else json.dumps(result, default=str)
+        return types.CallToolResult(content=[types.TextContent(type="text", text=text)])
+
+    def close(self) -> None:
+        pass
+
+    def stats(self) -> dict[str, Any]:
+        return {"binding": "local", "tools": len(self._templates), "calls": self.calls, "errors": self.errors}
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+
+def is_local_url(url: str) -> bool:
+    """True if `url` points at this server (loopback / our HOST, same PORT)."""
+    parsed = urlparse(url)
+    host = (parsed.hostname or "").lower()
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return host in LOOPBACK_HOSTS | {settings.HOST.lower()} and port == settings.PORT
+
+
+_binding: LocalToolBinding | None = None
+_binding_lock = threading.Lock()
+
+
+def get_local_binding() -> LocalToolBinding:
+    """Return the binding to this process's FastMCP server."""
+    global _binding
+    with _binding_lock:
+        if _binding is None:
+            import mcp_server  # registers every @mcp.tool on the shared server
+
+            _binding = LocalToolBinding(mcp_server.mcp)
+        return _binding
+
+
+def get_tool_source():
+    """Where crews get their tools: MCP_TOOL_BINDING = auto | local | remote."""
+    from core.mcp_pool import get_mcp_pool
+
+    binding = settings.MCP_TOOL_BINDING.lower()
+    if binding == "local" or (binding == "auto" and is_local_url(settings.MCP_SSE_URL)):
+        return get_local_binding()
+    return get_mcp_pool()
@@ -0,0 +1,339 @@
+"""
+MCP Session Pool
+================
+Long-lived MCP client sessions shared by every SkillsCrew in this worker.
+
+`MCPServerAdapter` opens a connection, performs the initialize handshake and
+lists tools each time it is constructed, and keeps that connection for one
+crew. The pool instead keeps `size` sessions to `MCP_SSE_URL` open on one
+background event loop and caches the tool schemas:
+
+- `tools()` builds CrewAI tools from the cached schemas (no round trip). The
+  tools are bound to the pool, not to a session, so they survive reconnects.
+- Tool calls go to the least-busy healthy session. A call that fails at the
+  transport level marks the session dead and is retried once on another.
+- A `notifications/tools/list_changed` from the server re-lists the tools and
+  bumps `tools_version`; crews compare it before each run.
+- A health loop pings every session and reconnects the ones that fail.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from datetime import timedelta
+from functools import partial
+from typing import Any
+
+from crewai.tools import BaseTool
+from crewai_tools.adapters.mcp_adapter import CrewAIToolAdapter
+from mcp import ClientSession, types
+from mcp.client.sse import sse_client
+from mcp.client.streamable_http import streamablehttp_client
+from mcp.shared.exceptions import McpError
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = {
+    "sse": sse_client,
+    "streamable-http": streamablehttp_client,
+}
+
+
+# ---------------------------------------------------------------------------
+# One connection
+# ---------------------------------------------------------------------------
+
+
+class _Slot:
+    """A pooled session and the task that holds its transport open."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+        self.session: ClientSession | None = None
+        self.task: asyncio.Task | None = None
+        self.ready: asyncio.Event | None = None
+        self.closing: asyncio.Event | None = None
+        self.reconnecting = asyncio.Lock()
+        self.in_flight = 0
+        self.connects = 0
+        self.failures = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.session is not None
+
+
+# ---------------------------------------------------------------------------
+# Pool
+# ---------------------------------------------------------------------------
+
+
+class MCPSessionPool:
+    """Fixed-size pool of MCP client sessions with cached tool schemas."""
+
+    def __init__(
+        self,
+        url: str,
+        transport: str = "sse",
+        size: int = 2,
+        connect_timeout: float = 30,
+        call_timeout: float = 120,
+        health_interval: float = 30,
+    ) -> None:
+        if transport not in TRANSPORTS:
+            raise ValueError(f"Unknown MCP transport '{transport}' (expected one of {list(TRANSPORTS)})")
+        self.url = url
+        self.transport = transport
+        self.connect_timeout = connect_timeout
+        self.call_timeout = call_timeout
+        self.health_interval = health_interval
+        self._slots = [_Slot(i) for i in range(max(1, size))]
+        self._schemas: list[types.Tool] = []
+        self._templates: tuple[int, list[BaseTool]] = (0, [])
+        self.tools_version = 0
+        self._adapter = CrewAIToolAdapter()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="mcp-pool", daemon=True)
+        self._health_task: asyncio.Task | None = None
+        self._started = False
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.reconnects = 0
+        self.schema_refreshes = 0
+
+    # -- lifecycle ----------------------------------------------------------
+
+    def start(self) -> None:
+        """Open every session and fetch the tool schemas once. Idempotent."""
+        with self._lock:
+            if self._started:
+                return
+            if not self._thread.is_alive():
+                self._thread.start()
+            start = time.perf_counter()
+            self._run(self._start(), 2 * self.connect_timeout)
+            self._started = True
+        logger.info(
+            "MCP session pool: %d session(s) to %s (%s), %d tools in %.0f ms",
+            len(self._slots), self.url, self.transport, len(self._schemas),
+            (time.perf_counter() - start) * 1000,
+        )
+
+    async def _start(self) -> None:
+        await asyncio.gather(*(self._connect(slot) for slot in self._slots))
+        await self._refresh_tools()
+        self._health_task = asyncio.create_task(self._health_loop())
+
+    def close(self) -> None:
+        """Close every session and stop the background loop."""
+        with self._lock:
+            if not self._started:
+                return
+            self._started = False
+        try:
+            self._run(self._close(), self.connect_timeout)
+        except Exception as e:
+            logger.warning("Error closing MCP sessions: %s", e)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=5)
+
+    async def _close(self) -> None:
+        if self._health_task:
+            self._health_task.cancel()
+        await asyncio.gather(*(self._disconnect(slot) for slot in self._slots), return_exceptions=True)
+
+    def _run(self, coro, timeout: float) -> Any:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result(timeout)
+
+    # -- connections (run on the pool loop) ---------------------------------
+
+    async def _hold(self, slot: _Slot) -> None:
+        """Own one transport + session for its whole life (anyio scopes must exit in this task)."""
+        client = TRANSPORTS[self.transport](self.url)
+        try:
+            async with client as (read, write, *_):
+                async with ClientSession(
+                    read,
+                    write,
+                    timedelta(seconds=self.call_timeout),
+                    message_handler=self._on_message,
+                ) as session:
+                    await session.initialize()
+                    slot.session = session
+                    slot.connects += 1
+                    slot.ready.set()
+                    await slot.closing.wait()
+        except Exception as e:
+            slot.failures += 1
+            logger.warning("MCP session %d dropped: %s", slot.index, e)
+        finally:
+            slot.session = None
+            slot.ready.set()  # wake a pending _connect even if the handshake failed
+
+    async def _connect(self, slot: _Slot) -> None:
+        await self._disconnect(slot)
+        slot.ready, slot.closing = asyncio.Event(), asyncio.Event()
+        slot.task = asyncio.create_task(self._hold(slot))
+        try:
+            await asyncio.wait_for(slot.ready.wait(), self.connect_timeout)
+        except asyncio.TimeoutError:
+            logger.warning("MCP session %d: no handshake within %ss", slot.index, self.connect_timeout)
+            await self._disconnect(slot)
+
+    async def _disconnect(self, slot: _Slot) -> None:
+        slot.session = None
+        if slot.task is None:
+            return
+        slot.closing.set()
+        try:
+            await asyncio.wait_for(slot.task, 5)
+        except (asyncio.TimeoutError, asyncio.CancelledError):
+            slot.task.cancel()
+        except Exception:
+            pass
+        slot.task = None
+
+    async def _reconnect(self, slot: _Slot, broken: ClientSession | None = None) -> None:
+        """Replace `broken` (or a dead slot); a no-op if someone already did."""
+        async with slot.reconnecting:
+            if slot.healthy and slot.session is not broken:
+                return
+            self.reconnects += 1
+            await self._connect(slot)
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for slot in self._slots:
+                session = slot.session
+                if session is not None:
+                    try:
+                        await asyncio.wait_for(session.send_ping(), self.connect_timeout)
+                        continue
+                    except Exception as e:
+                        logger.warning("MCP session %d failed health check: %s", slot.index, e)
+                await self._reconnect(slot, broken=session)
+
+    # -- tool schemas -------------------------------------------------------
+
+    async def _on_message(self, message: Any) -> None:
+        if isinstance(message, types.ServerNotification) and isinstance(
+            message.root, types.ToolListChangedNotification
+        ):
+            logger.info("MCP server reported a tool list change; refreshing schemas")
+            asyncio.get_running_loop().create_task(self._refresh_tools())
+
+    async def _refresh_tools(self) -> None:
+        slot = self._pick()
+        if slot is None:
+            raise ConnectionError(f"No MCP session to {self.url} could be established")
+        tools, cursor = [], None
+        while True:
+            params = types.PaginatedRequestParams(cursor=cursor) if cursor else None
+            result = await slot.session.list_tools(params=params)
+            tools.extend(result.tools)
+            cursor = result.nextCursor
+            if not cursor:
+                break
+        self._schemas = tools
+        self.tools_version += 1
+        self.schema_refreshes += 1
+
+    def tools(self) -> list[BaseTool]:
+        """Fresh CrewAI tool instances for one crew, built from the cached schemas."""
+        self.start()
+        version, templates = self._templates
+        if version != self.tools_version:
+            # Building the args models is the expensive part; do it once per schema version
+            version, schemas = self.tools_version, self._schemas
+            templates = [self._adapter.adapt(partial(self.call_tool, tool.name), tool) for tool in schemas]
+            self._templates = (version, templates)
+        return [tool.model_copy() for tool in templates]
+
+    # -- tool calls ---------------------------------------------------------
+
+    def _pick(self) -> _Slot | None:
+        """Least-busy healthy session, or None if every session is down."""
+        return min(
+            (slot for slot in self._slots if slot.healthy),
+            key=lambda slot: slot.in_flight,
+            default=None,
+        )
+
+    async def _call(self, name: str, arguments: dict | None) -> types.CallToolResult:
+        self.calls += 1
+        for attempt in range(2):
+            slot = self._pick()
+            if slot is None:
+                slot = min(self._slots, key=lambda s: s.in_flight)
+                await self._reconnect(slot)
+                if not slot.healthy:
+                    raise ConnectionError(f"MCP server at {self.url} is unreachable")
+
+            session = slot.session
+            slot.in_flight += 1
+            try:
+                return await session.call_tool(name, arguments)
+            except McpError:
+                raise  # the server answered; the session is fine
+            except Exception as e:
+                if attempt:
+                    raise
+                logger.warning("MCP call '%s' failed on session %d (%s); retrying", name, slot.index, e)
+                self.retries += 1
+                await self._reconnect(slot, broken=session)
+            finally:
+                slot.in_flight -= 1
+
+    def call_tool(self, name: str, arguments: dict | None = None) -> types.CallToolResult:
+        self.start()
+        return self._run(self._call(name, arguments), self.call_timeout + self.connect_timeout)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "sessions": len(self._slots),
+            "healthy": sum(slot.healthy for slot in self._slots),
+            "tools": len(self._schemas),
+            "tools_version": self.tools_version,
+            "calls": self.calls,
+            "retries": self.retries,
+            "reconnects": self.reconnects,
+            "schema_refreshes": self.schema_refreshes,
+        }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_pool: MCPSessionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_mcp_pool() -> MCPSessionPool:
+    """Return this worker's MCP session pool. Sessions open on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = MCPSessionPool(
+                url=settings.MCP_SSE_URL,
+                transport=settings.MCP_CLIENT_TRANSPORT,
+                size=settings.MCP_POOL_SIZE,
+                connect_timeout=settings.MCP_CONNECT_TIMEOUT,
+                call_timeout=settings.MCP_CALL_TIMEOUT,
+                health_interval=settings.MCP_HEALTH_INTERVAL,
+            )
+        return _pool
+
+
+def close_mcp_pool() -> None:
+    """Close the pool's sessions (call on shutdown)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
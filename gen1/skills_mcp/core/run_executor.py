@@ -0,0 +1,144 @@
+"""
+Run Executor
+============
+Bounded thread pool for blocking crew kickoffs.
+
+`/api/v1/run` is an async endpoint, but `crew.run()` blocks for the whole
+agent loop. Running it on the event loop stalls `/health`, the REST API and
+the `/mcp` mount behind a single run. The executor runs crews on
+`RUN_WORKERS` dedicated threads, lets `RUN_QUEUE_SIZE` more wait, and
+rejects anything beyond that with ExecutorSaturated (mapped to 503 +
+Retry-After by the app).
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+# ---------------------------------------------------------------------------
+# Executor
+# ---------------------------------------------------------------------------
+
+
+class ExecutorSaturated(Exception):
+    """Every worker is busy and the wait queue is full."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__(f"All crew workers are busy; retry in {retry_after}s")
+        self.retry_after = retry_after
+
+
+class RunExecutor:
+    """Sized worker pool with a bounded wait queue and run gauges."""
+
+    def __init__(self, workers: int, queue_size: int, default_retry_after: int = 30) -> None:
+        self.workers = max(1, workers)
+        self.queue_size = max(0, queue_size)
+        self.default_retry_after = default_retry_after
+        self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="crew-run")
+        self._lock = threading.Lock()
+        self.active = 0
+        self.queued = 0
+        self.completed = 0
+        self.failed = 0
+        self.rejected = 0
+        self._run_seconds = 0.0
+
+    def _avg_run_seconds(self) -> float | None:
+        finished = self.completed + self.failed
+        return self._run_seconds / finished if finished else None
+
+    def _retry_after(self) -> int:
+        """Rough time until a queue slot frees up. Caller holds the lock."""
+        avg = self._avg_run_seconds()
+        if avg is None:
+            return self.default_retry_after
+        return max(1, min(300, round(avg * (self.queued + 1) / self.workers)))
+
+    def _execute(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        with self._lock:
+            self.queued -= 1
+            self.active += 1
+        start = time.perf_counter()
+        ok = False
+        try:
+            result = fn(*args, **kwargs)
+            ok = True
+            return result
+        finally:
+            with self._lock:
+                self.active -= 1
+                self._run_seconds += time.perf_counter() - start
+                if ok:
+                    self.completed += 1
+                else:
+                    self.failed += 1
+
+    async def submit(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run `fn` on a worker thread and await its result (context vars are carried over)."""
+        with self._lock:
+            if self.active + self.queued >= self.workers + self.queue_size:
+                self.rejected += 1
+                raise ExecutorSaturated(self._retry_after())
+            self.queued += 1
+
+        context = contextvars.copy_context()
+        loop = asyncio.get_running_loop()
+        try:
+            future = loop.run_in_executor(
+                self._pool, lambda: context.run(self._execute, fn, *args, **kwargs)
+            )
+        except RuntimeError:
+            with self._lock:
+                self.queued -= 1  # pool already shut down
+            raise
+        return await future
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            avg = self._avg_run_seconds()
+            return {
+                "workers": self.workers,
+                "queue_limit": self.queue_size,
+                "active": self.active,
+                "queued": self.queued,
+                "completed": self.completed,
+                "failed": self.failed,
+                "rejected": self.rejected,
+                "avg_run_s": round(avg, 2) if avg is not None else None,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Process-wide instance
+# ---------------------------------------------------------------------------
+
+_executor: RunExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_run_executor() -> RunExecutor:
+    """Return this worker's crew run executor, creating it on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = RunExecutor(
+                workers=settings.RUN_WORKERS,
+                queue_size=settings.RUN_QUEUE_SIZE,
+                default_retry_after=settings.RUN_RETRY_AFTER,
+            )
+        return _executor
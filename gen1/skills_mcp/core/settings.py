@@ -17,10 +17,54 @@ class Settings:
     GOOGLE_API_KEY: str = os.getenv("GOOGLE_API_KEY", "")
     LLM_MODEL: str = os.getenv("LLM_MODEL", "gemini/gemini-2.5-flash")
 
+    # Completion cache in front of the crew LLM (core/llm.py)
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL: int = int(os.getenv("LLM_CACHE_TTL", "86400"))
+    LLM_CACHE_MAX_ENTRIES: int = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "512"))
+    LLM_CACHE_DISK: bool = os.getenv("LLM_CACHE_DISK", "true").lower() == "true"
+    LLM_CACHE_PATH: Path = Path(os.getenv("LLM_CACHE_PATH", str(BASE_DIR / ".cache" / "llm_cache.sqlite3")))
+
+    # Offline scripted model: LLM_MODEL=standin or standin/<script.yaml>
+    STANDIN_LLM_LATENCY_MS: int = int(os.getenv("STANDIN_LLM_LATENCY_MS", "0"))
+
     # Skills engine
     SCRIPT_TIMEOUT: int = int(os.getenv("SCRIPT_TIMEOUT", "60"))
     MAX_FILE_PREVIEW_CHARS: int = int(os.getenv("MAX_FILE_PREVIEW_CHARS", "8000"))
 
+    # Shared cache of read-only skills tool results (core/tool_cache.py);
+    # the SQLite tier lets server processes share results and invalidations
+    TOOL_CACHE_ENABLED: bool = os.getenv("TOOL_CACHE_ENABLED", "true").lower() == "true"
+    TOOL_CACHE_MAX_ENTRIES: int = int(os.getenv("TOOL_CACHE_MAX_ENTRIES", "256"))
+    TOOL_CACHE_DISK: bool = os.getenv("TOOL_CACHE_DISK", "false").lower() == "true"
+    TOOL_CACHE_PATH: Path = Path(os.getenv("TOOL_CACHE_PATH", str(BASE_DIR / ".cache" / "tool_cache.sqlite3")))
+
+    # Background script jobs
+    JOBS_DB_PATH: Path = Path(os.getenv("JOBS_DB_PATH", str(BASE_DIR / ".cache" / "jobs.sqlite3")))
+    JOB_WORKERS: int = int(os.getenv("JOB_WORKERS", "2"))
+    JOB_HISTORY_LIMIT: int = int(os.getenv("JOB_HISTORY_LIMIT", "500"))
+    # Processes sharing JOBS_DB_PATH fail a running job not heartbeated for this long
+    JOB_LEASE_SECONDS: float = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+
+    # /api/v1/run crews execute on a bounded thread pool, off the event loop;
+    # beyond RUN_WORKERS running + RUN_QUEUE_SIZE waiting the API answers 503
+    RUN_WORKERS: int = int(os.getenv("RUN_WORKERS", "4"))
+    RUN_QUEUE_SIZE: int = int(os.getenv("RUN_QUEUE_SIZE", "8"))
+    RUN_RETRY_AFTER: int = int(os.getenv("RUN_RETRY_AFTER", "30"))
+    # Identical concurrent /api/v1/run requests share one execution (core/single_flight.py)
+    RUN_COALESCE_ENABLED: bool = os.getenv("RUN_COALESCE_ENABLED", "true").lower() == "true"
+
+    # Render the skills registry into the crew task ({skills_registry}) so the
+    # agent skips the skills__list_skills step
+    SKILLS_REGISTRY_IN_PROMPT: bool = os.getenv("SKILLS_REGISTRY_IN_PROMPT", "true").lower() == "true"
+
+    # Run slash commands (/skill, /read, /run, ...) and unambiguous requests
+    # ("show me the X skill") on SkillsManager directly (core/command_router.py)
+    COMMAND_ROUTER_ENABLED: bool = os.getenv("COMMAND_ROUTER_ENABLED", "true").lower() == "true"
+    COMMAND_ROUTER_INTENTS: bool = os.getenv("COMMAND_ROUTER_INTENTS", "true").lower() == "true"
+
+    # Pooled SkillsCrew instances per worker (built once, leased per /api/v1/run)
+    CREW_POOL_SIZE: int = int(os.getenv("CREW_POOL_SIZE", "4"))
+
     # Server
     HOST: str = os.getenv("HOST", "0.0.0.0")
     PORT: int = int(os.getenv("PORT", "8000"))
@@ -31,6 +75,17 @@ class Settings:
     MCP_SERVER_NAME: str = os.getenv("MCP_SERVER_NAME", "skills-mcp-server")
     MCP_SERVER_VERSION: str = os.getenv("MCP_SERVER_VERSION", "1.0.0")
 
+    # How the crew reaches the MCP tools: auto (in-process when MCP_SSE_URL is this
+    # server, else SSE) | local | remote  (core/local_tools.py)
+    MCP_TOOL_BINDING: str = os.getenv("MCP_TOOL_BINDING", "auto")
+
+    # Pooled MCP client sessions used by the crew (core/mcp_pool.py)
+    MCP_CLIENT_TRANSPORT: str = os.getenv("MCP_CLIENT_TRANSPORT", "sse")
+    MCP_POOL_SIZE: int = int(os.getenv("MCP_POOL_SIZE", "2"))
+    MCP_CONNECT_TIMEOUT: float = float(os.getenv("MCP_CONNECT_TIMEOUT", "30"))
+    MCP_CALL_TIMEOUT: float = float(os.getenv("MCP_CALL_TIMEOUT", "120"))
+    MCP_HEALTH_INTERVAL: float = float(os.getenv("MCP_HEALTH_INTERVAL", "30"))
+
     # SSE endpoint for CrewAI (if using streamable-http)
     @property
     def MCP_SSE_URL(self) -> str:
@@ -40,7 +95,7 @@ class Settings:
     @classmethod
     def validate(cls) -> None:
         errors = []
-        if not cls.GOOGLE_API_KEY:
+        if not cls.GOOGLE_API_KEY and cls.LLM_MODEL.split("/")[0] != "standin":
             errors.append("GOOGLE_API_KEY is not set.")
         if not cls.SKILLS_DIR.exists():
             # Auto-create if not exists for better UX
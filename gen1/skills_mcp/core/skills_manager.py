@@ -5,21 +5,30 @@ Self-contained skill engine — zero dependency on MCP or FastAPI.
 All path operations are traversal-safe.
 Skills are auto-discovered from the SKILLS_DIR at runtime.
 Cache invalidates automatically when the directory changes (mtime check).
+Read-only results are shared process-wide through core/tool_cache.py.
 """
 
 import logging
 import subprocess
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
+from core.job_queue import CANCELLED, COMPLETED, FAILED, get_job_queue
 from core.settings import settings
+from core.tool_cache import get_tool_cache
 
 logger = logging.getLogger(__name__)
 
 
+# registry_summary(): description characters and triggers kept per skill
+SUMMARY_DESCRIPTION_CHARS = 160
+SUMMARY_MAX_TRIGGERS = 5
+
+
 # ---------------------------------------------------------------------------
 # Skill Metadata
 # ---------------------------------------------------------------------------
@@ -43,6 +52,15 @@ class SkillMetadata:
         )
         return f"- **{self.name}** (`{self.slug}`): {self.description}{trigger_str}"
 
+    def compact_line(self) -> str:
+        """One short line for the registry summary rendered into crew prompts."""
+        description = " ".join(self.description.split())
+        if len(description) > SUMMARY_DESCRIPTION_CHARS:
+            description = description[: SUMMARY_DESCRIPTION_CHARS - 1].rstrip() + "…"
+        triggers = self.triggers[:SUMMARY_MAX_TRIGGERS]
+        trigger_str = f" [{', '.join(triggers)}]" if triggers else ""
+        return f"- {self.slug}: {description}{trigger_str}"
+
 
 # ---------------------------------------------------------------------------
 # Skill Registry (cache layer)
@@ -168,12 +186,49 @@ class SkillsManager:
     def __init__(self) -> None:
         self._registry = SkillRegistry(settings.SKILLS_DIR)
 
+    # ------------------------------------------------------------------
+    # Result cache
+    # ------------------------------------------------------------------
+
+    def _cached(
+        self, tool: str, args: dict[str, Any], deps: Callable[[], list[Path]], compute: Callable[[], str]
+    ) -> str:
+        """Serve a read-only result from the shared tool cache (see core/tool_cache.py)."""
+        cache = get_tool_cache()
+        if cache is None:
+            return compute()
+        return cache.cached(tool, args, deps, compute)
+
+    def _invalidate(self, reason: str) -> None:
+        self._registry.invalidate()
+        cache = get_tool_cache()
+        if cache is not None:
+            cache.bump(reason)
+
+    def _registry_files(self) -> list[Path]:
+        """SKILLS_DIR (skills added / removed) and every skill.md (front matter)."""
+        return [settings.SKILLS_DIR] + [meta.path / "skill.md" for meta in self._registry.all().values()]
+
+    def _skill_files(self, skill_name: str, *relative: str) -> list[Path]:
+        meta = self._registry.get(skill_name)
+        if not meta:
+            return []
+        paths = [meta.path / "skill.md"]
+        for rel in relative:
+            path = _safe_path(meta.path, rel)
+            if path:
+                paths.append(path)
+        return paths
+
     # ------------------------------------------------------------------
     # Discovery
     # ------------------------------------------------------------------
 
     def list_skills(self) -> str:
         """Return a formatted registry of all available skills."""
+        return self._cached("list_skills", {}, self._registry_files, self._list_skills)
+
+    def _list_skills(self) -> str:
         skills = self._registry.all()
 
         if not skills:
@@ -199,8 +254,23 @@ class SkillsManager:
         ]
         return "\n".join(lines)
 
+    def registry_summary(self) -> str:
+        """Compact one-line-per-skill registry the crew renders into its task prompt."""
+        return self._cached("registry_summary", {}, self._registry_files, self._registry_summary)
+
+    def _registry_summary(self) -> str:
+        skills = self._registry.all()
+        if not skills:
+            return "(no skills installed)"
+        return "\n".join(meta.compact_line() for meta in skills.values())
+
     def search_skills(self, query: str) -> str:
         """Search skills by keyword across name, description, and triggers."""
+        return self._cached(
+            "search_skills", {"query": query}, self._registry_files, lambda: self._search_skills(query)
+        )
+
+    def _search_skills(self, query: str) -> str:
         skills = self._registry.all()
         q = query.lower()
 
@@ -228,12 +298,28 @@ class SkillsManager:
         """Return raw list of skill slugs (for API / programmatic use)."""
         return sorted(self._registry.all().keys())
 
+    def has_skill_file(self, skill_name: str, relative: str = "") -> bool:
+        """True if the skill exists and, when `relative` is given, contains that file."""
+        meta = self._registry.get(skill_name)
+        if meta is None or not relative:
+            return meta is not None
+        path = _safe_path(meta.path, relative)
+        return path is not None and path.is_file()
+
     # ------------------------------------------------------------------
     # Loading
     # ------------------------------------------------------------------
 
     def load_skill(self, skill_name: str) -> str:
         """Load and return the full skill.md content."""
+        return self._cached(
+            "load_skill",
+            {"skill_name": skill_name},
+            lambda: self._skill_files(skill_name),
+            lambda: self._load_skill(skill_name),
+        )
+
+    def _load_skill(self, skill_name: str) -> str:
         meta = self._registry.get(skill_name)
         if not meta:
             available = list(self._registry.all().keys())
@@ -253,6 +339,14 @@ class SkillsManager:
 
     def list_resources(self, skill_name: str) -> str:
         """List all references and scripts for a skill."""
+        return self._cached(
+            "list_resources",
+            {"skill_name": skill_name},
+            lambda: self._skill_files(skill_name, "references", "scripts"),
+            lambda: self._list_resources(skill_name),
+        )
+
+    def _list_resources(self, skill_name: str) -> str:
         meta = self._registry.get(skill_name)
         if not meta:
             return f"❌ Skill '{skill_name}' not found."
@@ -279,6 +373,14 @@ class SkillsManager:
 
     def read_resource(self, skill_name: str, resource_path: str) -> str:
         """Read a file from a skill's references/ or scripts/ directory."""
+        return self._cached(
+            "read_resource",
+            {"skill_name": skill_name, "resource_path": resource_path},
+            lambda: self._skill_files(skill_name, resource_path),
+            lambda: self._read_resource(skill_name, resource_path),
+        )
+
+    def _read_resource(self, skill_name: str, resource_path: str) -> str:
         meta = self._registry.get(skill_name)
         if not meta:
             return f"❌ Skill '{skill_name}' not found."
@@ -324,6 +426,7 @@ class SkillsManager:
 
         try:
             full_path.write_text(content, encoding="utf-8")
+            self._invalidate("write_resource")
             logger.info(
                 "Wrote resource '%s/%s' (%d chars)",
                 skill_name, resource_path, len(content),
@@ -337,10 +440,10 @@ class SkillsManager:
     # Script execution
     # ------------------------------------------------------------------
 
-    def run_script(
-        self, skill_name: str, script_name: str, script_args: str = ""
-    ) -> str:
-        """Execute a Python script from a skill's scripts/ directory."""
+    def _prepare_script(
+        self, skill_name: str, script_name: str, script_args: str
+    ) -> tuple[list[str], Path] | str:
+        """Resolve a skill script into (cmd, cwd), or an error message."""
         meta = self._registry.get(skill_name)
         if not meta:
             return f"❌ Skill '{skill_name}' not found."
@@ -358,6 +461,46 @@ class SkillsManager:
         cmd = ["python", str(script_path)]
         if script_args:
             cmd += [a for a in script_args.split() if a]
+        return cmd, script_path.parent
+
+    @staticmethod
+    def _format_script_result(
+        skill_name: str, script_name: str, stdout: str, stderr: str, returncode: int | None
+    ) -> str:
+        return (
+            f"# SCRIPT: {skill_name}/scripts/{script_name}\n\n"
+            f"STDOUT:\n{stdout or '(empty)'}\n\n"
+            f"STDERR:\n{stderr or '(empty)'}\n\n"
+            f"EXIT CODE: {returncode}"
+        )
+
+    def run_script(
+        self,
+        skill_name: str,
+        script_name: str,
+        script_args: str = "",
+        background: bool = False,
+        priority: int = 0,
+    ) -> str:
+        """
+        Execute a Python script from a skill's scripts/ directory.
+        With background=True the script is queued and a job ID is returned at once.
+        """
+        prepared = self._prepare_script(skill_name, script_name, script_args)
+        if isinstance(prepared, str):
+            return prepared
+        cmd, cwd = prepared
+
+        if background:
+            job = get_job_queue().submit(
+                skill_name, script_name, script_args, cmd, cwd, priority=priority
+            )
+            return (
+                f"✅ Job queued: {job.id}\n"
+                f"Script: {skill_name}/scripts/{script_name} (priority {priority})\n\n"
+                f"→ job_status(job_id='{job.id}') to poll progress.\n"
+                f"→ job_result(job_id='{job.id}') to fetch output once finished."
+            )
 
         logger.info("Running script: %s", " ".join(cmd))
 
@@ -367,19 +510,69 @@ class SkillsManager:
                 capture_output=True,
                 text=True,
                 timeout=settings.SCRIPT_TIMEOUT,
-                cwd=str(script_path.parent),
+                cwd=str(cwd),
             )
         except subprocess.TimeoutExpired:
             return f"❌ Script timed out after {settings.SCRIPT_TIMEOUT}s."
         except Exception as exc:
             return f"❌ Execution error: {exc}"
 
-        return (
-            f"# SCRIPT: {skill_name}/scripts/{script_name}\n\n"
-            f"STDOUT:\n{result.stdout or '(empty)'}\n\n"
-            f"STDERR:\n{result.stderr or '(empty)'}\n\n"
-            f"EXIT CODE: {result.returncode}"
+        return self._format_script_result(
+            skill_name, script_name, result.stdout, result.stderr, result.returncode
+        )
+
+    # ------------------------------------------------------------------
+    # Background jobs
+    # ------------------------------------------------------------------
+
+    def job_status(self, job_id: str) -> str:
+        """Return the lifecycle state of a background script job."""
+        job = get_job_queue().get(job_id)
+        if not job:
+            return f"❌ Job '{job_id}' not found."
+
+        lines = [
+            f"# JOB: {job.id}",
+            f"Script: {job.skill_name}/scripts/{job.script_name}",
+            f"Status: {job.status}",
+            f"Priority: {job.priority}",
+        ]
+        if job.started_at:
+            end = job.finished_at or time.time()
+            lines.append(f"Elapsed: {end - job.started_at:.1f}s")
+        if job.error:
+            lines.append(f"Error: {job.error}")
+        if job.finished:
+            lines.append(f"\n→ job_result(job_id='{job.id}') to fetch output.")
+        return "\n".join(lines)
+
+    def job_result(self, job_id: str) -> str:
+        """Return the captured output of a finished background script job."""
+        job = get_job_queue().get(job_id)
+        if not job:
+            return f"❌ Job '{job_id}' not found."
+        if not job.finished:
+            return f"⏳ Job '{job_id}' is still {job.status}. Poll job_status() and retry."
+        if job.status == CANCELLED:
+            return f"❌ Job '{job_id}' was cancelled."
+        if job.error and job.returncode is None:
+            return f"❌ Job '{job_id}' failed: {job.error}"
+
+        result = self._format_script_result(
+            job.skill_name, job.script_name, job.stdout, job.stderr, job.returncode
         )
+        if job.error:
+            result = f"❌ {job.error}\n\n{result}"
+        return result
+
+    def cancel_job(self, job_id: str) -> str:
+        """Cancel a queued or running background script job."""
+        job = get_job_queue().cancel(job_id)
+        if not job:
+            return f"❌ Job '{job_id}' not found."
+        if job.status in (COMPLETED, FAILED):
+            return f"⚠️ Job '{job_id}' already finished ({job.status})."
+        return f"✅ Cancellation requested for job '{job_id}'."
 
     # ------------------------------------------------------------------
     # Skill creation
@@ -413,7 +606,7 @@ class SkillsManager:
             (skill_path / "skill.md").write_text(skill_content, encoding="utf-8")
             (skill_path / "references").mkdir()
             (skill_path / "scripts").mkdir()
-            self._registry.invalidate()
+            self._invalidate("create_skill")
             logger.info("Created skill: '%s'", skill_name)
             return f"✅ Skill '{skill_name}' created successfully."
         except Exception as exc:
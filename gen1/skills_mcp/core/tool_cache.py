@@ -0,0 +1,218 @@
+"""
+Tool Result Cache
+=================
+Process-wide cache of read-only skills tool results.
+
+Every agent run repeats list_skills, load_skill and list_resources with the
+same arguments. Results are cached on (tool, args) and tagged with a
+registry generation: SkillsManager bumps it whenever it writes a skill or a
+resource, which drops every entry at once. Each entry also records the files
+it was built from (stat stamps), so edits made outside the server
+(an editor, a git pull) invalidate exactly the entries that read them.
+
+With `TOOL_CACHE_DISK=true` entries and the generation also live in SQLite,
+so several server processes share results and invalidations.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Results that describe a failure are recomputed every time
+UNCACHED_PREFIXES = ("❌", "⚠️")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    key        TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL,
+    deps       TEXT NOT NULL,
+    value      TEXT NOT NULL
+);
+"""
+
+Stamps = dict[str, str | None]
+
+
+def stamp(paths: Iterable[Path]) -> Stamps:
+    """mtime + size of each path (None if missing), to detect edits made outside the tools."""
+    stamps: Stamps = {}
+    for path in paths:
+        try:
+            st = path.stat()
+            stamps[str(path)] = f"{st.st_mtime_ns}:{st.st_size}"
+        except OSError:
+            stamps[str(path)] = None
+    return stamps
+
+
+# ---------------------------------------------------------------------------
+# Cache
+# ---------------------------------------------------------------------------
+
+
+class ToolResultCache:
+    """Generation-tagged (tool, args) → result cache with per-entry file dependencies."""
+
+    def __init__(self, max_entries: int, disk_path: Path | None = None) -> None:
+        self.max_entries = max(1, max_entries)
+        self._memory: OrderedDict[str, tuple[int, Stamps, str]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._conn: sqlite3.Connection | None = None
+        self.hits = self.misses = self.stale = self.bumps = 0
+        if disk_path is not None:
+            disk_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(disk_path), check_same_thread=False)
+            with self._lock, self._conn:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+                self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def key(tool: str, args: dict[str, Any]) -> str:
+        blob = json.dumps([tool, args], sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def _current_generation(self) -> int:
+        """Caller holds the lock."""
+        if self._conn is not None:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'generation'").fetchone()
+            self._generation = row[0] if row else 0
+        return self._generation
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._current_generation()
+
+    def bump(self, reason: str = "") -> int:
+        """A skill or resource changed: invalidate every cached result."""
+        with self._lock:
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT INTO meta (key, value) VALUES ('generation', 1) "
+                        "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+                    )
+                    generation = self._current_generation()
+                    self._conn.execute("DELETE FROM results WHERE generation < ?", (generation,))
+            else:
+                self._generation += 1
+                generation = self._generation
+            self._memory.clear()
+            self.bumps += 1
+        logger.debug("Tool cache generation %d (%s)", generation, reason or "bump")
+        return generation
+
+    def get(self, tool: str, args: dict[str, Any]) -> str | None:
+        key = self.key(tool, args)
+        with self._lock:
+            generation = self._current_generation()
+            entry = self._memory.get(key)
+            if entry is None and self._conn is not None:
+                row = self._conn.execute(
+                    "SELECT generation, deps, value FROM results WHERE key = ?", (key,)
+                ).fetchone()
+                if row:
+                    entry = (row[0], json.loads(row[1]), row[2])
+            if entry is not None:
+                entry_generation, stamps, value = entry
+                if entry_generation == generation and stamp(map(Path, stamps)) == stamps:
+                    self._remember(key, entry)
+                    self.hits += 1
+                    return value
+                self._memory.pop(key, None)
+                self.stale += 1
+            self.misses += 1
+            return None
+
+    def put(self, tool: str, args: dict[str, Any], value: str, generation: int, stamps: Stamps) -> None:
+        key = self.key(tool, args)
+        with self._lock:
+            if generation != self._current_generation():
+                return  # a bump happened while this result was computed
+            self._remember(key, (generation, stamps, value))
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO results (key, generation, deps, value) VALUES (?, ?, ?, ?)",
+                        (key, generation, json.dumps(stamps), value),
+                    )
+
+    def cached(
+        self,
+        tool: str,
+        args: dict[str, Any],
+        deps: Callable[[], Iterable[Path]],
+        compute: Callable[[], str],
+    ) -> str:
+        """Return the cached result of tool(args), or compute and store it with its file deps."""
+        value = self.get(tool, args)
+        if value is not None:
+            return value
+        generation = self.generation
+        stamps = stamp(deps())  # taken before computing, so a concurrent edit leaves it stale
+        value = compute()
+        if isinstance(value, str) and not value.startswith(UNCACHED_PREFIXES):
+            self.put(tool, args, value, generation, stamps)
+        return value
+
+    def _remember(self, key: str, entry: tuple[int, Stamps, str]) -> None:
+        """Insert into the memory tier, evicting the LRU entry if full. Caller holds the lock."""
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._memory),
+                "generation": self._generation,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "bumps": self.bumps,
+            }
+
+
+# ---------------------------------------------------------------------------
+# Shared instance
+# ---------------------------------------------------------------------------
+
+
+_cache: ToolResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_tool_cache() -> ToolResultCache | None:
+    """Return the shared tool-result cache, or None when TOOL_CACHE_ENABLED is off."""
+    global _cache
+    if not settings.TOOL_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = ToolResultCache(
+                max_entries=settings.TOOL_CACHE_MAX_ENTRIES,
+                disk_path=settings.TOOL_CACHE_PATH if settings.TOOL_CACHE_DISK else None,
+            )
+        return _cache
+
+
+def set_tool_cache(cache: ToolResultCache | None) -> None:
+    """Swap the shared cache, e.g. for a temporary one in benchmarks."""
+    global _cache
+    with _cache_lock:
+        _cache = cache
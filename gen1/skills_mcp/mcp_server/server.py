@@ -12,7 +12,8 @@ mcp = FastMCP(
         f"You are the {settings.MCP_SERVER_NAME} operator (v{settings.MCP_SERVER_VERSION}). "
         "You have access to a dynamic skills system. "
         "PROTOCOL: "
-        "1. ALWAYS start by calling skills__list_skills to discover capabilities. "
+        "1. Pick a skill from the registry in your context if you were given one; "
+        "otherwise start by calling skills__list_skills to discover capabilities. "
         "2. Then call skills__load_skill before using any skill. "
         "3. Follow the loaded skill protocol exactly. "
         "Never guess — maintain production-grade precision."
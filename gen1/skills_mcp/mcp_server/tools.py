@@ -70,13 +70,45 @@ def skills__run_script(
     skill_name: str,
     script_name: str,
     script_args: str = "",
+    background: bool = False,
+    priority: int = 0,
 ) -> str:
     """
     Execute a Python script from a skill's scripts/ directory.
     Returns stdout, stderr, and exit code.
+    Set background=True for slow scripts: a job ID is returned immediately
+    and the script runs in the job queue (higher priority runs first).
     Use skills__list_resources to discover available scripts.
     """
-    return _manager.run_script(skill_name, script_name, script_args)
+    return _manager.run_script(
+        skill_name, script_name, script_args, background=background, priority=priority
+    )
+
+
+@mcp.tool
+def skills__job_status(job_id: str) -> str:
+    """
+    Check the state of a background script job started with
+    skills__run_script(background=True): queued, running, completed, failed or cancelled.
+    """
+    return _manager.job_status(job_id)
+
+
+@mcp.tool
+def skills__job_result(job_id: str) -> str:
+    """
+    Fetch stdout, stderr, and exit code of a finished background script job.
+    Poll skills__job_status first if the job may still be running.
+    """
+    return _manager.job_result(job_id)
+
+
+@mcp.tool
+def skills__cancel_job(job_id: str) -> str:
+    """
+    Cancel a background script job. Queued jobs never start; running jobs are killed.
+    """
+    return _manager.cancel_job(job_id)
 
 
 @mcp.tool